@@ -0,0 +1,59 @@
+"""Measures the memory and construction time of EasyPost objects versus compact objects.
+
+Converts many copies of a recorded `shipment.all` page, as when holding many pages of shipments in memory.
+
+Usage: python benchmarks/bench_compact_objects.py [pages]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from easypost.easypost_object import (
+    convert_to_compact_easypost_object,
+    convert_to_easypost_object,
+)
+from payloads import load_response_bodies
+
+
+def convert_pages(convert, raw_pages):
+    """Convert every page, accessing the rates of every shipment."""
+    pages = [convert(json.loads(raw_page)) for raw_page in raw_pages]
+    for page in pages:
+        for shipment in page["shipments"]:
+            shipment["rates"]
+
+    return pages
+
+
+def measure(convert, raw_pages):
+    """Return the seconds taken and bytes held to convert every page."""
+    start = time.perf_counter()
+    convert_pages(convert, raw_pages)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    pages = convert_pages(convert, raw_pages)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del pages
+
+    return seconds, allocated
+
+
+def main(pages: int) -> None:
+    page = load_response_bodies("test_shipment_all")[-1]
+    raw_pages = [json.dumps(page)] * pages
+    print(f"{pages * len(page['shipments'])} shipments, {len(raw_pages[0]) * pages / 1_000_000:.1f} MB of JSON")
+
+    for name, convert in (
+        ("raw dicts", lambda response: response),
+        ("EasyPostObject", convert_to_easypost_object),
+        ("CompactEasyPostObject", convert_to_compact_easypost_object),
+    ):
+        seconds, allocated = measure(convert, raw_pages)
+        print(f"{name:>21}: {seconds:.2f} s, {allocated / 1_000_000:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
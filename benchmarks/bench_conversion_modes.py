@@ -0,0 +1,58 @@
+"""Measures the conversion modes of a client on a bulk listing job that only reads a few fields per object.
+
+Converts many copies of a recorded `shipment.all` page and reads the ID and label URL of every shipment.
+
+Usage: python benchmarks/bench_conversion_modes.py [pages]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from easypost.easypost_object import (
+    convert_to_compact_easypost_object,
+    convert_to_easypost_object,
+)
+from payloads import load_response_bodies
+
+
+CONVERSION_MODES = {
+    "eager": lambda response: convert_to_easypost_object(response=response),
+    "lazy": lambda response: convert_to_easypost_object(response=response, lazy=True),
+    "compact": convert_to_compact_easypost_object,
+}
+
+
+def extract_label_urls(convert, raw_pages):
+    """Convert every page, extracting the ID and label URL of every shipment."""
+    pages = [convert(json.loads(raw_page)) for raw_page in raw_pages]
+    label_urls = {}
+    for page in pages:
+        for shipment in page["shipments"]:
+            postage_label = shipment.postage_label
+            label_urls[shipment.id] = postage_label.label_url if postage_label else None
+
+    return pages, label_urls
+
+
+def main(pages: int) -> None:
+    page = load_response_bodies("test_shipment_all")[-1]
+    raw_pages = [json.dumps(page)] * pages
+    print(f"{pages * len(page['shipments'])} shipments, {len(raw_pages[0]) * pages / 1_000_000:.1f} MB of JSON")
+
+    for name, convert in CONVERSION_MODES.items():
+        start = time.perf_counter()
+        extract_label_urls(convert, raw_pages)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        result = extract_label_urls(convert, raw_pages)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+
+        print(f"{name:>7}: {seconds:.2f} s, {peak / 1_000_000:.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
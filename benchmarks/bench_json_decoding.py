@@ -0,0 +1,46 @@
+"""Measures the decoding of response bodies by the JSON codecs over every response recorded in the test cassettes.
+
+"text + json" decodes the bytes into a string before parsing them like the client used to, the codecs parse the
+bytes received directly. `orjson` is skipped when it is not installed.
+
+Usage: python benchmarks/bench_json_decoding.py [repeat]
+"""
+import json
+import sys
+import time
+
+from easypost.json_codecs import (
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+)
+from payloads import load_raw_response_bodies
+
+
+def decode_text(body: bytes) -> None:
+    json.loads(body.decode("utf-8"))
+
+
+def main(repeat: int) -> None:
+    bodies = load_raw_response_bodies()
+    large_bodies = sorted(bodies, key=len, reverse=True)[: len(bodies) // 10]
+    decoders = {"text + json": decode_text, "stdlib": StdlibJsonCodec().loads}
+    try:
+        decoders["orjson"] = OrjsonJsonCodec().loads
+    except ImportError:
+        print("orjson is not installed, skipping it")
+
+    for name, sample in (("all responses", bodies), ("largest 10%", large_bodies)):
+        size = sum(len(body) for body in sample)
+        print(f"{name}: {len(sample)} bodies, {size / 1_000_000:.2f} MB")
+        for decoder_name, decode in decoders.items():
+            seconds = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for body in sample:
+                    decode(body)
+                seconds = min(seconds, time.perf_counter() - start)
+            print(f"  {decoder_name:>12}: {seconds * 1000:.2f} ms, {size / seconds / 1_000_000:.0f} MB/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,64 @@
+"""Measures the time to convert recorded API responses into EasyPost objects.
+
+"dynamic import" resolves the model class of every nested object with a regex and `importlib` like the client
+used to, "registry" is the current behavior.
+
+Usage: python benchmarks/bench_object_conversion.py [iterations]
+"""
+import importlib
+import re
+import sys
+import timeit
+from unittest.mock import patch
+
+import easypost.easypost_object
+from easypost.easypost_object import (
+    EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP,
+    OBJECT_CLASS_NAME_OVERRIDES,
+    EasyPostObject,
+    convert_to_easypost_object,
+)
+from payloads import load_large_payloads
+
+
+def convert_with_dynamic_import(response, parent=None, name=None):
+    """The previous implementation of `convert_to_easypost_object`."""
+    if isinstance(response, list):
+        return [convert_with_dynamic_import(response=item, parent=parent) for item in response]
+    elif isinstance(response, dict):
+        object_type_str = response.get("object", EasyPostObject)
+        class_name = OBJECT_CLASS_NAME_OVERRIDES.get(object_type_str, EasyPostObject)
+        object_id = response.get("id")
+
+        if object_id is not None:
+            object_id_prefix = object_id.split("_")[0]
+            class_name = EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.get(object_id_prefix, EasyPostObject)
+
+        class_model = (
+            getattr(
+                importlib.import_module(f'easypost.models.{re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()}'),
+                class_name,
+            )
+            if class_name != EasyPostObject
+            else EasyPostObject
+        )
+
+        return class_model.construct_from(values=response, parent=parent, name=name)
+    else:
+        return response
+
+
+def main(iterations: int) -> None:
+    for payload_name, payload in load_large_payloads().items():
+        with patch.object(easypost.easypost_object, "convert_to_easypost_object", convert_with_dynamic_import):
+            before = min(timeit.repeat(lambda: convert_with_dynamic_import(payload), number=iterations, repeat=5))
+        after = min(timeit.repeat(lambda: convert_to_easypost_object(payload), number=iterations, repeat=5))
+
+        print(
+            f"{payload_name:>13}: dynamic import {before / iterations * 1_000:.3f} ms,"
+            f" registry {after / iterations * 1_000:.3f} ms ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,50 @@
+"""Measures encoding the body of a bulk batch creation referencing thousands of retrieved shipments.
+
+"copy + json" replaces the shipments with their IDs in a copy of the params before encoding them like the client
+used to, the codecs encode the params in a single pass.
+
+Usage: python benchmarks/bench_request_encoding.py [shipments]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from easypost.easypost_object import convert_to_easypost_object
+from easypost.json_codecs import (
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+)
+from easypost.requestor import Requestor
+from payloads import load_large_payloads
+
+
+def encode_copy(params):
+    return json.dumps(Requestor._objects_to_ids(param=params)).encode()
+
+
+def main(shipments: int) -> None:
+    shipment = convert_to_easypost_object(response=load_large_payloads()["shipment"])
+    params = {"batch": {"shipments": [shipment] * shipments, "reference": "bench"}}
+    encoders = {"copy + json": encode_copy, "stdlib": StdlibJsonCodec().dumps}
+    try:
+        encoders["orjson"] = OrjsonJsonCodec().dumps
+    except ImportError:
+        print("orjson is not installed, skipping it")
+
+    print(f"{shipments} shipments")
+    for name, encode in encoders.items():
+        start = time.perf_counter()
+        encode(params)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        encode(params)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{name:>12}: {seconds * 1000:.2f} ms, {peak / 1_000_000:.2f} MB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
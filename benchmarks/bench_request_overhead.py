@@ -0,0 +1,35 @@
+"""Measures the client-side overhead of preparing a request (URL, headers, and params).
+
+"uncached" rebuilds the User-Agent on every request like the client used to, "cached" is the current behavior.
+
+Usage: python benchmarks/bench_request_overhead.py [iterations]
+"""
+import sys
+import timeit
+
+from easypost.easypost_client import EasyPostClient
+from easypost.requestor import (
+    Requestor,
+    get_user_agent,
+)
+
+
+def prepare_request(requestor: Requestor) -> None:
+    requestor._prepare_request(url="/trackers/trk_123", params={"carrier": "USPS"})
+
+
+def prepare_request_uncached(requestor: Requestor) -> None:
+    get_user_agent.cache_clear()
+    requestor._prepare_request(url="/trackers/trk_123", params={"carrier": "USPS"})
+
+
+def main(iterations: int) -> None:
+    requestor = Requestor(EasyPostClient("123"))
+
+    for name, function in (("uncached", prepare_request_uncached), ("cached", prepare_request)):
+        seconds = min(timeit.repeat(lambda: function(requestor), number=iterations, repeat=5))
+        print(f"{name:>8}: {seconds / iterations * 1_000_000:.2f} us per request")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
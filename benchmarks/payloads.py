@@ -0,0 +1,48 @@
+"""Helpers to load recorded API responses from the test cassettes for use in benchmarks."""
+import json
+import os
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import yaml
+
+
+CASSETTES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "cassettes")
+
+
+def load_response_bodies(cassette: str) -> List[Dict[str, Any]]:
+    """Load the JSON response bodies recorded in a cassette of the test suite."""
+    with open(os.path.join(CASSETTES_DIR, f"{cassette}.yaml")) as cassette_file:
+        interactions = yaml.safe_load(cassette_file)["interactions"]
+
+    return [json.loads(interaction["response"]["body"]["string"]) for interaction in interactions]
+
+
+def load_large_payloads() -> Dict[str, Dict[str, Any]]:
+    """Load large recorded Shipment, Batch, and Tracker payloads."""
+    return {
+        "shipment": load_response_bodies("test_shipment_buy")[-1],
+        "shipment list": load_response_bodies("test_shipment_all")[-1],
+        "batch list": load_response_bodies("test_batch_all")[-1],
+        "tracker": load_response_bodies("test_tracker_retrieve")[-1],
+        "tracker list": load_response_bodies("test_tracker_all")[-1],
+    }
+
+
+def load_raw_response_bodies() -> List[bytes]:
+    """Load every JSON response body recorded in the cassettes of the test suite, as the bytes received."""
+    bodies = []
+    for cassette in sorted(os.listdir(CASSETTES_DIR)):
+        with open(os.path.join(CASSETTES_DIR, cassette)) as cassette_file:
+            interactions = yaml.safe_load(cassette_file)["interactions"]
+
+        for interaction in interactions:
+            body = interaction["response"]["body"]["string"]
+            body = body.encode() if isinstance(body, str) else body
+            if body.startswith((b"{", b"[")):
+                bodies.append(body)
+
+    return bodies
@@ -1,4 +1,5 @@
 # flake8: noqa
+from easypost.async_easypost_client import AsyncEasyPostClient
 from easypost.constant import (
     AUTHOR,
     VERSION,
@@ -0,0 +1,209 @@
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from easypost.constant import (
+    API_BASE,
+    API_VERSION,
+    INVALID_CONVERSION_MODE_ERROR,
+    TIMEOUT,
+)
+from easypost.easypost_object import ConversionMode
+from easypost.errors import InvalidParameterError
+from easypost.hooks import (
+    RequestHook,
+    ResponseHook,
+)
+from easypost.idempotency import IdempotencyJournal
+from easypost.json_codecs import (
+    JsonCodec,
+    default_json_codec,
+)
+from easypost.rate_limiter import RateLimiter
+from easypost.request_options import request_options
+from easypost.response_cache import ResponseCache
+from easypost.retry_policy import RetryPolicy
+from easypost.services import (
+    AsyncAddressService,
+    AsyncBatchService,
+    AsyncBetaCarrierMetadataService,
+    AsyncBetaRateService,
+    AsyncBetaReferralCustomerService,
+    AsyncBillingService,
+    AsyncCarrierAccountService,
+    AsyncCarrierMetadataService,
+    AsyncCustomsInfoService,
+    AsyncCustomsItemService,
+    AsyncEndShipperService,
+    AsyncEventService,
+    AsyncInsuranceService,
+    AsyncOrderService,
+    AsyncParcelService,
+    AsyncPickupService,
+    AsyncRateService,
+    AsyncReferralCustomerService,
+    AsyncRefundService,
+    AsyncReportService,
+    AsyncScanFormService,
+    AsyncShipmentService,
+    AsyncTrackerService,
+    AsyncUserService,
+    AsyncWebhookService,
+)
+from easypost.single_flight import SingleFlight
+from easypost.transports import (
+    AiohttpTransport,
+    AsyncTransport,
+)
+
+
+class AsyncEasyPostClient:
+    """An asyncio client object used to authenticate and configure all HTTP calls to the EasyPost API.
+
+    Every service method is awaitable. By default, requests are made with `aiohttp` over a connection pool owned
+    by this client, pass your own `AsyncTransport` via the `transport` parameter to replace it. Close the client
+    with `await client.close()` or use it as an async context manager. Extra static headers to send with every
+    request can be set via the `headers` parameter.
+
+    Responses are converted into objects according to the `conversion_mode`: "eager" (the default) converts
+    whole responses into EasyPostObjects, "lazy" converts nested objects when they are first accessed, and
+    "compact" returns read-only CompactEasyPostObjects which use the least memory.
+
+    Pass a `RateLimiter` via the `rate_limiter` parameter to throttle requests and back off adaptively when the
+    API responds with a 429, it can be shared between clients using the same API key.
+
+    Pass a `RetryPolicy` via the `retry_policy` parameter to retry requests that time out or fail with a server
+    error. Only GET and DELETE requests are retried unless they are made within a
+    `client.request_options(retry_safe=True)` block. Purchases (eg: `client.shipment.buy()`) are sent with an
+    idempotency key when retries are enabled, which makes them safe to retry. Pass an `IdempotencyJournal` via
+    the `idempotency_journal` parameter to also resume purchases interrupted by a crash without paying twice.
+
+    Pass a `ResponseCache` via the `response_cache` parameter to cache the responses of read-mostly endpoints
+    (carrier metadata, carrier types, API keys, and payment methods) and, optionally, of retrieved Shipments and
+    Trackers, in memory or in a backend shared by every process on a host.
+
+    Pass a `SingleFlight` via the `single_flight` parameter to coalesce concurrent identical GET requests (same
+    URL, params, and API key) into one request whose response is converted separately for each caller. Hooks
+    only fire for the request that is sent.
+
+    Responses are decoded and request bodies encoded by the `json_codec`, which defaults to the standard library.
+    Pass an `OrjsonJsonCodec` (`pip install easypost[orjson]`) to decode large responses faster. The default
+    transport of the client encodes request bodies with it too.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_base: str = f"{API_BASE}/{API_VERSION}",
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+        transport: Optional[AsyncTransport] = None,
+        headers: Optional[Dict[str, str]] = None,
+        conversion_mode: Union[ConversionMode, str] = ConversionMode.EAGER,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
+        # Client configuration
+        self.api_key = api_key
+        self.api_base = api_base
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.idempotency_journal = idempotency_journal
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.json_codec = json_codec or default_json_codec()
+
+        try:
+            self.conversion_mode = ConversionMode(conversion_mode)
+        except ValueError:
+            raise InvalidParameterError(
+                message=INVALID_CONVERSION_MODE_ERROR.format([mode.value for mode in ConversionMode])
+            )
+
+        # Services
+        self.address = AsyncAddressService(self)
+        self.batch = AsyncBatchService(self)
+        self.beta_carrier_metadata = AsyncBetaCarrierMetadataService(self)
+        self.beta_rate = AsyncBetaRateService(self)
+        self.beta_referral_customer = AsyncBetaReferralCustomerService(self)
+        self.billing = AsyncBillingService(self)
+        self.carrier_account = AsyncCarrierAccountService(self)
+        self.carrier_metadata = AsyncCarrierMetadataService(self)
+        self.customs_info = AsyncCustomsInfoService(self)
+        self.customs_item = AsyncCustomsItemService(self)
+        self.end_shipper = AsyncEndShipperService(self)
+        self.event = AsyncEventService(self)
+        self.insurance = AsyncInsuranceService(self)
+        self.order = AsyncOrderService(self)
+        self.parcel = AsyncParcelService(self)
+        self.rate = AsyncRateService(self)
+        self.pickup = AsyncPickupService(self)
+        self.referral_customer = AsyncReferralCustomerService(self)
+        self.refund = AsyncRefundService(self)
+        self.report = AsyncReportService(self)
+        self.scan_form = AsyncScanFormService(self)
+        self.shipment = AsyncShipmentService(self)
+        self.tracker = AsyncTrackerService(self)
+        self.user = AsyncUserService(self)
+        self.webhook = AsyncWebhookService(self)
+
+        # Hooks
+        self._request_hook = RequestHook()
+        self._response_hook = ResponseHook()
+
+        # Transport
+        self.transport = transport or AiohttpTransport(json_codec=self.json_codec)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connection pool of this client."""
+        await self.transport.close()
+
+    async def warm_up(self, connections: int) -> int:
+        """Open connections to the EasyPost API ahead of time so the first requests skip the TLS handshake.
+
+        Returns the number of connections opened, which may be lower than `connections` when it exceeds
+        the pool size of the transport.
+        """
+        return await self.transport.warm_up(url=self.api_base, connections=connections)
+
+    def request_options(self, **options):
+        """Return a context manager applying options to the requests made within it.
+
+        - `retry_safe`: allow the retry policy of the client to retry POST, PUT, and PATCH requests
+        - `idempotency_key`: send purchases with this `Idempotency-Key` header instead of a generated one
+        - `timeout`: the timeout of each attempt of a request in seconds, or a `(connect timeout, read timeout)`
+          tuple, instead of the timeout of the client
+        - `deadline`: fail requests with a `TimeoutError` once this many seconds passed since entering the
+          block, covering every retry and page of the requests made within it
+        """
+        return request_options(**options)
+
+    def subscribe_to_request_hook(self, function):
+        """Subscribe functions to run when a request occurs."""
+        self._request_hook += function
+
+    def unsubscribe_from_request_hook(self, function):
+        """Unsubscribe functions from running when a request occurs."""
+        self._request_hook -= function
+
+    def subscribe_to_response_hook(self, function):
+        """Subscribe functions to run when a response occurs."""
+        self._response_hook += function
+
+    def unsubscribe_from_response_hook(self, function):
+        """Unsubscribe functions from running when a response occurs."""
+        self._response_hook -= function
@@ -0,0 +1,325 @@
+import asyncio
+import contextvars
+import datetime
+import time
+import uuid
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from easypost.constant import (
+    COMMUNICATION_ERROR,
+    SUPPORT_EMAIL,
+    TIMEOUT_ERROR,
+)
+from easypost.errors import (
+    EasyPostError,
+    HttpError,
+    TimeoutError,
+)
+from easypost.idempotency import IDEMPOTENCY_KEY_HEADER
+from easypost.request_options import get_request_options
+from easypost.requestor import (
+    RequestMethod,
+    Requestor,
+)
+
+
+if TYPE_CHECKING:
+    from easypost.transports import (
+        Timeout,
+        TransportResponse,
+    )
+
+
+T = TypeVar("T")
+
+
+class AsyncRequestor(Requestor):
+    """Makes non-blocking requests to the EasyPost API for an `AsyncEasyPostClient`.
+
+    URL building, headers, hooks, error mapping, and response interpretation are shared with the `Requestor`,
+    requests are sent with the `AsyncTransport` of the client. The idempotency journal and blocking response cache
+    backends are called from the default executor of the event loop, so their I/O does not block it.
+    """
+
+    async def request(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        beta: bool = False,
+        idempotent: bool = False,
+        cacheable: bool = False,
+        resumable: bool = True,
+    ) -> Dict[str, Any]:
+        """Make a request to the EasyPost API."""
+        if params is None:
+            params = {}
+
+        cache = self._client.response_cache if cacheable else None
+        cached_response = None
+        if cache:
+            cache_key = cache.make_key(api_key=self._client.api_key, url=url, params=params, beta=beta)
+            cached_response = await self._run_blocking(cache.backend.blocking, cache.get, key=cache_key)
+            if cached_response is not None and cached_response.fresh:
+                return self.interpret_response(
+                    http_body=cached_response.http_body,
+                    http_status=cached_response.http_status,
+                )
+
+        fingerprint, idempotency_key, response = await self._run_blocking(
+            self._client.idempotency_journal is not None,
+            self._start_idempotent_request,
+            method=method,
+            url=url,
+            params=params,
+            idempotent=idempotent,
+            resumable=resumable,
+        )
+        if response is not None:
+            return response
+
+        try:
+            http_body, http_status, http_headers = await self._coalesced_request_raw(
+                method=method,
+                url=url,
+                params=params,
+                beta=beta,
+                idempotency_key=idempotency_key,
+                headers=cached_response.conditional_headers if cached_response else None,
+            )
+            # An expired cached response confirmed unchanged by the API is served from the cache
+            revalidated_response = cached_response if http_status == 304 else None
+            if revalidated_response is not None:
+                http_body, http_status = revalidated_response.http_body, revalidated_response.http_status
+
+            response = self.interpret_response(http_body=http_body, http_status=http_status)
+        except EasyPostError as error:
+            await self._run_blocking(
+                fingerprint is not None, self._finish_idempotent_request, fingerprint=fingerprint, error=error
+            )
+            if method != RequestMethod.GET:
+                await self._invalidate_cached_responses_async(url=url)
+            raise
+
+        await self._run_blocking(
+            fingerprint is not None, self._finish_idempotent_request, fingerprint=fingerprint, response=response
+        )
+        if cache and revalidated_response:
+            await self._run_blocking(
+                cache.backend.blocking,
+                cache.revalidate,
+                key=cache_key,
+                cached_response=revalidated_response,
+                headers=http_headers,
+            )
+        elif cache:
+            await self._run_blocking(
+                cache.backend.blocking,
+                cache.set,
+                key=cache_key,
+                http_body=http_body,
+                http_status=http_status,
+                headers=http_headers,
+            )
+        if method != RequestMethod.GET:
+            await self._invalidate_cached_responses_async(url=url)
+
+        return response
+
+    @staticmethod
+    async def _run_blocking(blocking: bool, function: Callable[..., T], **kwargs: Any) -> T:
+        """Call a function doing blocking I/O from the default executor of the event loop, in a copy of the current
+        context so it sees the request options of the caller. Functions which do not block are called directly.
+        """
+        if not blocking:
+            return function(**kwargs)
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, partial(contextvars.copy_context().run, function, **kwargs))
+
+    async def _invalidate_cached_responses_async(self, url: str) -> None:
+        """Remove the cached responses of the object changed by a request, from the default executor of the event
+        loop when the cache backend blocks.
+        """
+        cache = self._client.response_cache
+        if cache:
+            await self._run_blocking(cache.backend.blocking, self._invalidate_cached_responses, url=url)
+
+    async def _coalesced_request_raw(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Dict[str, Any],
+        beta: bool = False,
+        idempotency_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Union[str, bytes], int, Dict[str, Any]]:
+        """Make a request with `request_raw`, sharing the response of an identical GET request already in flight
+        when the client has a `SingleFlight`.
+        """
+        request_raw = partial(
+            self.request_raw,
+            method=method,
+            url=url,
+            params=params,
+            beta=beta,
+            idempotency_key=idempotency_key,
+            headers=headers,
+        )
+        single_flight = self._client.single_flight
+        if single_flight is None or method != RequestMethod.GET:
+            return await request_raw()
+
+        return await single_flight.do_async(
+            key=self._single_flight_key(url=url, params=params, beta=beta, headers=headers),
+            fn=request_raw,
+            timeout=self._coalesced_wait_timeout(),
+        )
+
+    async def request_raw(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        beta: bool = False,
+        idempotency_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Union[str, bytes], int, Dict[str, Any]]:
+        """Internal logic required to make a request to the EasyPost API, `headers` are added to the headers of
+        the client (eg: the conditional headers of a cached response).
+        """
+        abs_url, request_headers, params = self._prepare_request(url=url, params=params, beta=beta)
+        headers = {**request_headers, **(headers or {})}
+        # Every attempt of a request carries the same idempotency key, which makes it safe to retry
+        if idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        options = get_request_options()
+        retry_safe = bool(idempotency_key) or options.get("retry_safe", False)
+        deadline_at = options.get("deadline_at")
+        rate_limiter = self._client.rate_limiter
+        started_at = time.monotonic()
+        attempt = 1
+        rate_limited_attempts = 0
+
+        while True:
+            if rate_limiter:
+                await rate_limiter.acquire_async(deadline_at=deadline_at)
+
+            request_uuid = uuid.uuid4()
+            request_timestamp = datetime.datetime.now(datetime.timezone.utc)
+            # Params keep the objects passed to them until they are encoded, subscribers receive their IDs instead
+            if self._client._request_hook:
+                self._client._request_hook(
+                    method=method,
+                    path=abs_url,
+                    headers=headers,
+                    request_body=self._objects_to_ids(param=params),
+                    request_timestamp=request_timestamp,
+                    request_uuid=request_uuid,
+                )
+
+            try:
+                http_response = await self._send_request(
+                    method=method,
+                    abs_url=abs_url,
+                    headers=headers,
+                    params=params,
+                    timeout=self._attempt_timeout(deadline_at=deadline_at),
+                )
+            except (TimeoutError, HttpError):
+                delay = self._retry_delay(
+                    method=method,
+                    retry_safe=retry_safe,
+                    attempt=attempt,
+                    started_at=started_at,
+                    deadline_at=deadline_at,
+                )
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            http_body, http_status, http_headers = http_response.body, http_response.status, http_response.headers
+
+            # The body is only decoded into a string for the response hook when something subscribed to it
+            if self._client._response_hook:
+                response_timestamp = datetime.datetime.now(datetime.timezone.utc)
+                self._client._response_hook(
+                    http_status=http_status,
+                    method=method,
+                    path=abs_url,
+                    headers=http_headers,
+                    response_body=self._body_text(http_body=http_body),
+                    response_size=http_response.size,
+                    response_wire_size=http_response.wire_size,
+                    request_timestamp=request_timestamp,
+                    response_timestamp=response_timestamp,
+                    request_uuid=request_uuid,
+                )
+
+            if rate_limiter:
+                rate_limiter.record_response(http_status=http_status, headers=http_headers)
+                # Requests rejected with a 429 were not processed and can be sent again once the rate limiter allows
+                if http_status == 429 and rate_limited_attempts < rate_limiter.max_retries:
+                    rate_limited_attempts += 1
+                    continue
+
+            delay = self._retry_delay(
+                method=method,
+                retry_safe=retry_safe,
+                attempt=attempt,
+                started_at=started_at,
+                deadline_at=deadline_at,
+                http_status=http_status,
+                http_headers=http_headers,
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return http_body, http_status, http_headers
+
+    async def _send_request(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        abs_url: str,
+        headers: Dict[str, Any],
+        params: Dict[str, Any],
+        timeout: "Timeout",
+    ) -> "TransportResponse":
+        """Send a request with the transport of the client, translating transport errors into EasyPost errors."""
+        transport = self._client.transport
+        url_params, body = self._split_params(
+            method=method,
+            params=params,
+            encodes_object_references=transport.encodes_object_references,
+        )
+
+        try:
+            return await transport.request(
+                method=method,
+                url=abs_url,
+                headers=headers,
+                params=url_params,
+                body=body,
+                timeout=timeout,
+            )
+        except EasyPostError:
+            raise
+        except transport.timeout_exceptions:
+            raise TimeoutError(TIMEOUT_ERROR)
+        except Exception as e:
+            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
@@ -0,0 +1,5 @@
+# flake8: noqa
+from easypost.cache_backends.base_cache_backend import CacheBackend
+from easypost.cache_backends.memory_cache_backend import MemoryCacheBackend
+from easypost.cache_backends.redis_cache_backend import RedisCacheBackend
+from easypost.cache_backends.sqlite_cache_backend import SqliteCacheBackend
@@ -0,0 +1,31 @@
+from typing import Optional
+
+
+class CacheBackend:
+    """The interface every storage of a `ResponseCache` implements.
+
+    A backend stores string values under string keys until their TTL expires. Backends shared between processes
+    (eg: `SqliteCacheBackend` or `RedisCacheBackend`) let every process on a host reuse the responses cached by the
+    others. Backends must be safe to use from several threads at once.
+
+    `blocking` backends do I/O (eg: a file or a network round trip), an `AsyncEasyPostClient` calls them from a
+    thread of the default executor of its event loop instead of from the event loop itself.
+    """
+
+    blocking = True
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of a key, or `None` when it is missing or has expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store the value of a key for `ttl` seconds."""
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with `prefix`."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Delete every key."""
+        self.delete_prefix(prefix="")
@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from easypost.cache_backends.base_cache_backend import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Stores values in the memory of the current process, evicting the least recently used value once `max_size`
+    values are stored. The default backend of a `ResponseCache`.
+    """
+
+    blocking = False
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of a key, or `None` when it is missing or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return entry[1]
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store the value of a key for `ttl` seconds."""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with `prefix`."""
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
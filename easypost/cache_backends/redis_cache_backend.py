@@ -0,0 +1,45 @@
+import re
+from typing import (
+    Any,
+    Optional,
+)
+
+from easypost.cache_backends.base_cache_backend import CacheBackend
+
+
+class RedisCacheBackend(CacheBackend):
+    """Stores values in Redis, sharing them between every process and host connected to it.
+
+    Pass a client with the interface of `redis.Redis` (`get`, `set`, `delete`, and `scan_iter`), this library does
+    not depend on a Redis client. Keys are stored under `prefix`, and expire in Redis after their TTL. Eviction is
+    left to the `maxmemory-policy` of the Redis server.
+    """
+
+    def __init__(self, redis: Any, prefix: str = "easypost:response_cache:"):
+        self.redis = redis
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of a key, or `None` when it is missing or has expired."""
+        value = self.redis.get(self.prefix + key)
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store the value of a key for `ttl` seconds."""
+        # Redis rejects expiries that are not in the future
+        if ttl <= 0:
+            self.redis.delete(self.prefix + key)
+            return
+
+        self.redis.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with `prefix`."""
+        # Escape the glob characters of the prefix so it is matched as-is
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self.prefix + prefix) + "*"
+        keys = list(self.redis.scan_iter(match=pattern))
+        if keys:
+            self.redis.delete(*keys)
@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from easypost.cache_backends.base_cache_backend import CacheBackend
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Stores values in a SQLite database file which every process on a host can share.
+
+    The database is opened in WAL mode so readers do not wait for writers, and is read through a memory map of up
+    to `mmap_size` bytes so hits are served from the page cache shared by every process.
+
+    The backend approximates LRU eviction to keep writes off the hot path: the size of the table is checked every
+    `eviction_interval` writes, evicting the least recently used values past `max_size`, and a hit only records its
+    time of use when the one stored is older than `touch_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        mmap_size: int = 64 * 1024 * 1024,
+        eviction_interval: int = 100,
+        touch_interval: float = 1.0,
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.eviction_interval = max(1, eviction_interval)
+        self.touch_interval = touch_interval
+
+        self._writes = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS response_cache_used_at ON response_cache (used_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of a key, or `None` when it is missing or has expired."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, used_at FROM response_cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, used_at = row
+            if now - used_at >= self.touch_interval:
+                self._connection.execute("UPDATE response_cache SET used_at = ? WHERE key = ?", (now, key))
+
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store the value of a key for `ttl` seconds."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            self._writes += 1
+            if self._writes % self.eviction_interval:
+                return
+
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM response_cache").fetchone()
+            if size > self.max_size:
+                self._connection.execute(
+                    "DELETE FROM response_cache WHERE key IN "
+                    "(SELECT key FROM response_cache ORDER BY expires_at <= ? DESC, used_at LIMIT ?)",
+                    (now, size - self.max_size),
+                )
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with `prefix`."""
+        with self._lock:
+            # substr() compares the prefix as-is, unlike LIKE which would treat "%" and "_" as wildcards
+            self._connection.execute("DELETE FROM response_cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def close(self) -> None:
+        """Close the database of the backend."""
+        with self._lock:
+            self._connection.close()
@@ -12,22 +12,37 @@ TIMEOUT = 60
 
 # Error messages
 COMMUNICATION_ERROR = "Unexpected error communicating with EasyPost. If this problem persists please let us know at {}. Original error: {}"
+DEADLINE_EXCEEDED_ERROR = "Request deadline exceeded."
+INVALID_AIOHTTP_VERSION_ERROR = 'The EasyPost async client requires an up to date aiohttp library. Install it via "pip install easypost[async]" or contact us at {}.'
+INVALID_CONVERSION_MODE_ERROR = "Invalid conversion_mode value, must be one of: {}"
+INVALID_DATE_RANGE_ERROR = "Invalid date range, start_datetime must be before end_datetime."
 INVALID_DELIVER_ACCURACY_ERROR = "Invalid delivery_accuracy value, must be one of: {}"
+INVALID_ORJSON_VERSION_ERROR = 'The OrjsonJsonCodec requires the orjson library. Install it via "pip install easypost[orjson]" or contact us at {}.'
+INVALID_PARTITIONS_ERROR = "Invalid partitions value, must be at least 1."
 INVALID_PAYMENT_METHOD_ERROR = "The chosen payment method is not valid. Please try again."
-INVALID_REQUEST_LIB_ERROR = "Bug discovered: invalid request_lib: {}. Please report to {}."
+INVALID_PYPDF_VERSION_ERROR = (
+    'Merging PDF labels requires the pypdf library. Install it via "pip install easypost[pdf]" or contact us at {}.'
+)
 INVALID_REQUEST_METHOD_ERROR = "Bug discovered: invalid request method: {}. Please report to {}."
+INVALID_REQUEST_OPTION_ERROR = "Invalid request option: {}, must be one of: {}"
 INVALID_REQUEST_PARAMETERS_ERROR = "Only GET and DELETE requests support parameters."
 INVALID_REQUESTS_VERSION_ERROR = 'EasyPost requires an up to date requests library. Update requests via "pip install -U requests" or contact us at {}.'
 INVALID_RESPONSE_BODY_ERROR = "Invalid response from API: ({}) {}"
 INVALID_SIGNATURE_ERROR = "Webhook received does not contain an HMAC signature."
 INVALID_WEBHOOK_VALIDATION_ERROR = "Webhook received did not originate from EasyPost or had a webhook secret mismatch."
+LABEL_DOWNLOAD_ERROR = "Could not download the label at {}: ({}) {}"
 MISSING_PARAMETER_ERROR = "Missing required parameter: {}"
+MIXED_LABEL_FORMATS_ERROR = "Labels of different formats cannot be merged: {}"
 NO_ATTRIBUTE_ERROR = "{} object has no attribute {}"
 NO_BILLING_ERROR = "Billing has not been setup for this user. Please add a payment method."
+NO_LABEL_URL_ERROR = "No label URL found for {}, generate its label first."
 NO_MORE_PAGES_ERROR = "There are no more pages to retrieve."
 NO_RATES_ERROR = "No rates found."
 SEND_STRIPE_DETAILS_ERROR = "Could not send card details to Stripe, please try again later."
+STATE_TIMEOUT_ERROR = "{} {} did not reach state {} in time, its last state was {}."
 TIMEOUT_ERROR = "Request timed out."
+UNEXPECTED_STATE_ERROR = "{} {} reached state {} instead of {}."
+UNSUPPORTED_LABEL_FORMAT_ERROR = "Labels of format {} cannot be merged, must be one of: {}"
 
 # Internal constants (user's should not use these)
 _TEST_FAILED_INTENTIONALLY_ERROR = "Test failed intentionally."
@@ -1,14 +1,31 @@
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+
 from easypost.constant import (
     API_BASE,
     API_VERSION,
-    INVALID_REQUESTS_VERSION_ERROR,
-    SUPPORT_EMAIL,
+    INVALID_CONVERSION_MODE_ERROR,
     TIMEOUT,
 )
+from easypost.easypost_object import ConversionMode
+from easypost.errors import InvalidParameterError
 from easypost.hooks import (
     RequestHook,
     ResponseHook,
 )
+from easypost.idempotency import IdempotencyJournal
+from easypost.json_codecs import (
+    JsonCodec,
+    default_json_codec,
+)
+from easypost.rate_limiter import RateLimiter
+from easypost.request_options import request_options
+from easypost.response_cache import ResponseCache
+from easypost.retry_policy import RetryPolicy
 from easypost.services import (
     AddressService,
     BatchService,
@@ -36,21 +53,80 @@ from easypost.services import (
     UserService,
     WebhookService,
 )
+from easypost.single_flight import SingleFlight
+from easypost.transports import (
+    RequestsTransport,
+    Transport,
+    UrlfetchTransport,
+)
 
 
 class EasyPostClient:
-    """A client object used to authenticate and configure all HTTP calls to the EasyPost API."""
+    """A client object used to authenticate and configure all HTTP calls to the EasyPost API.
+
+    HTTP calls are sent with a `Transport`, pass your own via the `transport` parameter to replace the
+    default `requests` (or `urlfetch` on Google App Engine) transport. Extra static headers to send with every
+    request can be set via the `headers` parameter.
+
+    Responses are converted into objects according to the `conversion_mode`: "eager" (the default) converts
+    whole responses into EasyPostObjects, "lazy" converts nested objects when they are first accessed, and
+    "compact" returns read-only CompactEasyPostObjects which use the least memory.
+
+    Pass a `RateLimiter` via the `rate_limiter` parameter to throttle requests and back off adaptively when the
+    API responds with a 429, it can be shared between clients using the same API key.
+
+    Pass a `RetryPolicy` via the `retry_policy` parameter to retry requests that time out or fail with a server
+    error. Only GET and DELETE requests are retried unless they are made within a
+    `client.request_options(retry_safe=True)` block. Purchases (eg: `client.shipment.buy()`) are sent with an
+    idempotency key when retries are enabled, which makes them safe to retry. Pass an `IdempotencyJournal` via
+    the `idempotency_journal` parameter to also resume purchases interrupted by a crash without paying twice.
+
+    Pass a `ResponseCache` via the `response_cache` parameter to cache the responses of read-mostly endpoints
+    (carrier metadata, carrier types, API keys, and payment methods) and, optionally, of retrieved Shipments and
+    Trackers, in memory or in a backend shared by every process on a host.
+
+    Pass a `SingleFlight` via the `single_flight` parameter to coalesce concurrent identical GET requests (same
+    URL, params, and API key) into one request whose response is converted separately for each caller. Hooks
+    only fire for the request that is sent.
+
+    Responses are decoded and request bodies encoded by the `json_codec`, which defaults to the standard library.
+    Pass an `OrjsonJsonCodec` (`pip install easypost[orjson]`) to decode large responses faster. The default
+    transport of the client encodes request bodies with it too.
+    """
 
     def __init__(
         self,
         api_key: str,
         api_base: str = f"{API_BASE}/{API_VERSION}",
-        timeout: int = TIMEOUT,
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+        transport: Optional[Transport] = None,
+        headers: Optional[Dict[str, str]] = None,
+        conversion_mode: Union[ConversionMode, str] = ConversionMode.EAGER,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
         # Client configuration
         self.api_key = api_key
         self.api_base = api_base
         self.timeout = timeout
+        self.headers = headers or {}
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.idempotency_journal = idempotency_journal
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.json_codec = json_codec or default_json_codec()
+
+        try:
+            self.conversion_mode = ConversionMode(conversion_mode)
+        except ValueError:
+            raise InvalidParameterError(
+                message=INVALID_CONVERSION_MODE_ERROR.format([mode.value for mode in ConversionMode])
+            )
 
         # Services
         self.address = AddressService(self)
@@ -83,36 +159,37 @@ class EasyPostClient:
         self._request_hook = RequestHook()
         self._response_hook = ResponseHook()
 
-        # use urlfetch as request_lib on google app engine, otherwise use requests
-        self._request_lib = None
-        try:
-            from google.appengine.api import urlfetch  # type: ignore
-
-            self._request_lib = "urlfetch"
-            # use the GAE application-wide "deadline" (or its default)
-            timeout = urlfetch.get_default_fetch_deadline() or self.timeout
-        except ImportError:
+        # Transport, use urlfetch on Google App Engine, otherwise use requests
+        if transport is None:
             try:
-                import requests
-
-                self._request_lib = "requests"
-                self._requests_session = requests.Session()
-                requests_http_adapter = requests.adapters.HTTPAdapter(max_retries=3)
-                self._requests_session.mount(
-                    prefix=self.api_base.split(f"/{API_VERSION}")[0],
-                    adapter=requests_http_adapter,
+                transport = UrlfetchTransport(json_codec=self.json_codec)
+            except ImportError:
+                transport = RequestsTransport(
+                    base_url=self.api_base.split(f"/{API_VERSION}")[0],
+                    json_codec=self.json_codec,
                 )
-            except Exception:
-                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
 
-            try:
-                requests_version = requests.__version__
-                major_version, _, _ = [int(i) for i in requests_version.split(".")]
-            except Exception:
-                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
-            else:
-                if major_version < 1:
-                    raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+        self.transport = transport
+
+    def warm_up(self, connections: int) -> int:
+        """Open connections to the EasyPost API ahead of time so the first requests skip the TLS handshake.
+
+        Returns the number of connections opened, which may be lower than `connections` when it exceeds
+        the pool size of the transport.
+        """
+        return self.transport.warm_up(url=self.api_base, connections=connections)
+
+    def request_options(self, **options):
+        """Return a context manager applying options to the requests made within it.
+
+        - `retry_safe`: allow the retry policy of the client to retry POST, PUT, and PATCH requests
+        - `idempotency_key`: send purchases with this `Idempotency-Key` header instead of a generated one
+        - `timeout`: the timeout of each attempt of a request in seconds, or a `(connect timeout, read timeout)`
+          tuple, instead of the timeout of the client
+        - `deadline`: fail requests with a `TimeoutError` once this many seconds passed since entering the
+          block, covering every retry and page of the requests made within it
+        """
+        return request_options(**options)
 
     def subscribe_to_request_hook(self, function):
         """Subscribe functions to run when a request occurs."""
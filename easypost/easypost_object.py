@@ -1,11 +1,13 @@
-import importlib
+import copy
 import json
-import re
+from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 from easypost.constant import NO_ATTRIBUTE_ERROR
@@ -53,41 +55,78 @@ OBJECT_CLASS_NAME_OVERRIDES: Dict[str, Any] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _get_model_class_maps() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Resolve the model classes of the ID prefix and object type maps once, on first use.
+
+    Models are imported here rather than at the top of this module due to circular imports of EasyPostObject.
+    """
+    import easypost.models
+
+    id_prefix_to_class = {
+        prefix: getattr(easypost.models, class_name)
+        for prefix, class_name in EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.items()
+    }
+    object_type_to_class = {
+        object_type: getattr(easypost.models, class_name)
+        for object_type, class_name in OBJECT_CLASS_NAME_OVERRIDES.items()
+    }
+
+    return id_prefix_to_class, object_type_to_class
+
+
+class ConversionMode(Enum):
+    """How responses of the EasyPost API are converted into objects.
+
+    EAGER converts the whole response into EasyPostObjects up front, LAZY converts nested objects into
+    EasyPostObjects when they are first accessed, and COMPACT converts responses into read-only
+    CompactEasyPostObjects.
+    """
+
+    EAGER = "eager"
+    LAZY = "lazy"
+    COMPACT = "compact"
+
+
 def convert_to_easypost_object(
     response: Dict[str, Any],
     parent: object = None,
     name: Optional[str] = None,
+    lazy: bool = False,
 ):
-    """Convert a response to an EasyPostObject."""
+    """Convert a response to an EasyPostObject.
+
+    When `lazy` is set, nested objects of the response are only converted when they are first accessed.
+    """
     if isinstance(response, list):
-        return [convert_to_easypost_object(response=item, parent=parent) for item in response]
+        return [convert_to_easypost_object(response=item, parent=parent, lazy=lazy) for item in response]
     elif isinstance(response, dict):
-        object_type_str = response.get("object", EasyPostObject)
-        class_name = OBJECT_CLASS_NAME_OVERRIDES.get(object_type_str, EasyPostObject)
+        id_prefix_to_class, object_type_to_class = _get_model_class_maps()
         object_id = response.get("id")
 
         if object_id is not None:
             # If an object ID is present, use it to find the class type instead.
-            object_id_prefix = object_id.split("_")[0]
-            class_name = EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.get(object_id_prefix, EasyPostObject)
-
-        # Dynamically import class models due to circular imports of EasyPostObject
-        class_model = (
-            getattr(
-                importlib.import_module(f'easypost.models.{re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()}'),
-                class_name,
-            )
-            if class_name != EasyPostObject
-            else EasyPostObject
-        )
+            class_model = id_prefix_to_class.get(object_id.split("_")[0], EasyPostObject)
+        else:
+            class_model = object_type_to_class.get(response.get("object", ""), EasyPostObject)
 
-        obj = class_model.construct_from(values=response, parent=parent, name=name)
+        obj = class_model.construct_from(values=response, parent=parent, name=name, lazy=lazy)
 
         return obj
     else:
         return response
 
 
+def convert_to_compact_easypost_object(response: Any) -> Any:
+    """Convert a response to a CompactEasyPostObject."""
+    if isinstance(response, list):
+        return [convert_to_compact_easypost_object(response=item) for item in response]
+    elif isinstance(response, dict):
+        return CompactEasyPostObject(values=response)
+    else:
+        return response
+
+
 class EasyPostObject(object):
     def __init__(
         self,
@@ -121,13 +160,27 @@ class EasyPostObject(object):
 
     def __getattr__(self, k) -> Any:
         try:
-            return self.__dict__[k]
+            return self[k]
         except KeyError:
             pass
         raise AttributeError(NO_ATTRIBUTE_ERROR.format(type(self).__name__, k))
 
     def __getitem__(self, k):
-        return self.__dict__[k]
+        try:
+            return self.__dict__[k]
+        except KeyError:
+            return self._convert_lazy_value(k)
+
+    def _convert_lazy_value(self, k) -> Any:
+        """Convert a value of a lazily constructed object on first access, raises a KeyError if there is none."""
+        lazy_values = self.__dict__.get("_lazy_values")
+        if lazy_values is None or k in self._immutable_values:
+            raise KeyError(k)
+
+        v = convert_to_easypost_object(response=lazy_values[k], parent=self, name=k, lazy=True)
+        self.__dict__[k] = v
+
+        return v
 
     def get(self, k, default: Any = None) -> Any:
         try:
@@ -159,10 +212,19 @@ class EasyPostObject(object):
         values: Dict[str, Any],
         parent: object = None,
         name: Optional[str] = None,
+        lazy: bool = False,
     ) -> object:
-        """Construct an EasyPostObject from values returned by the API."""
+        """Construct an EasyPostObject from values returned by the API.
+
+        When `lazy` is set, values are kept as-is and only converted when they are first accessed.
+        """
         instance = cls(id=values.get("id"), parent=parent, name=name)
-        instance.convert_each_value(values=values)
+
+        if lazy:
+            instance.__dict__["_lazy_values"] = values
+            instance._values.update(values.keys() - instance._immutable_values)
+        else:
+            instance.convert_each_value(values=values)
 
         return instance
 
@@ -217,10 +279,87 @@ class EasyPostObject(object):
         return d
 
 
+class CompactEasyPostObject:
+    """A read-only and memory efficient representation of an object returned by the EasyPost API.
+
+    The response is kept as-is, nested objects are only wrapped when they are first accessed. Compact objects
+    have no model class (eg: there is no `lowest_rate` method on a compact Shipment, use
+    `easypost.get_lowest_object_rate` instead) and cannot be modified. Fields named like one of its methods (`get`,
+    `keys`, `to_dict`, and `to_json`, eg: the `keys` of an API key response) must be read as items (`child["keys"]`).
+    """
+
+    __slots__ = ("_values", "_children")
+
+    def __init__(self, values: Dict[str, Any]):
+        self._values = values
+        self._children: Optional[Dict[str, Any]] = None
+
+    def __getattr__(self, k) -> Any:
+        # Private and dunder lookups (eg: by `copy` or `pickle`) are never fields of a response
+        if not k.startswith("_"):
+            try:
+                return self[k]
+            except KeyError:
+                pass
+        raise AttributeError(NO_ATTRIBUTE_ERROR.format(type(self).__name__, k))
+
+    def __getitem__(self, k):
+        if self._children is not None and k in self._children:
+            return self._children[k]
+
+        v = self._values[k]
+        if isinstance(v, (dict, list)):
+            v = convert_to_compact_easypost_object(response=v)
+            if self._children is None:
+                self._children = {}
+            self._children[k] = v
+
+        return v
+
+    def __contains__(self, k) -> bool:
+        return k in self._values
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self._values
+
+    def __setstate__(self, values: Dict[str, Any]) -> None:
+        self._values = values
+        self._children = None
+
+    def get(self, k, default: Any = None) -> Any:
+        try:
+            return self[k]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return list(self._values.keys())
+
+    def __repr__(self) -> str:
+        """String representation of a CompactEasyPostObject."""
+        return "<%s at %s> JSON: %s" % (type(self).__name__, hex(id(self)), self.to_json(indent=2))
+
+    def __str__(self) -> str:
+        return self.to_json(indent=2)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactEasyPostObject):
+            return False
+        return self._values == other._values
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Convert current object to json string."""
+        return json.dumps(obj=self._values, sort_keys=True, indent=indent)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert current object to a dict."""
+        return copy.deepcopy(self._values)
+
+
 class EasyPostObjectEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         """Convert an EasyPostObject to a dict."""
-        if isinstance(obj, EasyPostObject):
+        if isinstance(obj, (EasyPostObject, CompactEasyPostObject)):
             return obj.to_dict()
         else:
             return json.JSONEncoder.default(self, o=obj)
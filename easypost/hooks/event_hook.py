@@ -1,17 +1,59 @@
+import inspect
+from typing import Tuple
+
+
 class EventHook:
-    """The parent event that occurs when a hook is triggered."""
+    """The parent event that occurs when a hook is triggered.
+
+    Keyword arguments in `optional_kwargs` were added to the event after handlers were written for it, they are only
+    passed to handlers accepting them (by name or with `**kwargs`).
+    """
+
+    optional_kwargs: Tuple[str, ...] = ()
 
     def __init__(self):
         self._event_handlers = []
+        self._unaccepted_kwargs = []
 
     def __iadd__(self, handler):
         self._event_handlers.append(handler)
+        self._unaccepted_kwargs.append(self._get_unaccepted_kwargs(handler))
         return self
 
     def __isub__(self, handler):
-        self._event_handlers.remove(handler)
+        index = self._event_handlers.index(handler)
+        del self._event_handlers[index]
+        del self._unaccepted_kwargs[index]
         return self
 
+    def __len__(self):
+        return len(self._event_handlers)
+
     def __call__(self, *args, **kwargs):
-        for event_handler in self._event_handlers:
-            event_handler(*args, **kwargs)
+        for event_handler, unaccepted_kwargs in zip(self._event_handlers, self._unaccepted_kwargs):
+            if unaccepted_kwargs:
+                event_handler(*args, **{key: value for key, value in kwargs.items() if key not in unaccepted_kwargs})
+            else:
+                event_handler(*args, **kwargs)
+
+    def _get_unaccepted_kwargs(self, handler):
+        """Return the optional keyword arguments a handler does not accept, once when it subscribes."""
+        if not self.optional_kwargs:
+            return ()
+
+        try:
+            parameters = inspect.signature(handler).parameters.values()
+        except (TypeError, ValueError):
+            # Callables without a signature (eg: some builtins) receive every argument
+            return ()
+
+        if any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters):
+            return ()
+
+        names = {
+            parameter.name
+            for parameter in parameters
+            if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        }
+
+        return tuple(key for key in self.optional_kwargs if key not in names)
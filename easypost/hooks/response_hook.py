@@ -4,4 +4,5 @@ from easypost.hooks import EventHook
 class ResponseHook(EventHook):
     """An event that gets triggered when an HTTP response is returned."""
 
-    pass
+    # The sizes of the response body, only passed to handlers accepting them
+    optional_kwargs = ("response_size", "response_wire_size")
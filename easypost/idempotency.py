@@ -0,0 +1,102 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def generate_idempotency_key() -> str:
+    """Generate a new random idempotency key."""
+    return str(uuid.uuid4())
+
+
+class IdempotencyJournal:
+    """Records the purchases made by a client in a SQLite database so they are never made twice.
+
+    Before a purchase (eg: `client.shipment.buy()`) is sent, it is recorded along with the idempotency key it is sent
+    with. Its response is recorded once it succeeds. When the same purchase is made again, by a retry or by a worker
+    resuming the work of one that crashed, a recorded response is returned without calling the API, and a purchase
+    that never got a response is sent again with the same idempotency key so the API does not process it twice.
+
+    Purchases which create the object they buy (eg: `client.batch.create_and_buy()`) cannot be told apart from the
+    same purchase made again on purpose, they are only recorded when an `idempotency_key` is set for them with
+    `client.request_options()`, under that key.
+
+    Purchases rejected by the API are forgotten, so they can be made again once their issue is fixed. Entries expire
+    after `ttl` seconds. Workers on the same machine can share a journal by passing the same `path`.
+    """
+
+    def __init__(self, path: str = ":memory:", ttl: float = 24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency_journal ("
+                "fingerprint TEXT PRIMARY KEY, idempotency_key TEXT NOT NULL, response TEXT, created_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idempotency_journal_created_at ON idempotency_journal (created_at)"
+            )
+
+    @staticmethod
+    def fingerprint(
+        api_key: str,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """Identify a request by its API key, method, URL, and params, and by the idempotency key given for it when
+        the request alone does not identify the purchase.
+        """
+        request_parts = [api_key, method, url, params] + ([idempotency_key] if idempotency_key is not None else [])
+        request = json.dumps(request_parts, sort_keys=True, default=str)
+
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def begin(self, fingerprint: str, idempotency_key: Optional[str] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Record a request about to be sent, returning the idempotency key to send it with and, when the request
+        already succeeded, its recorded response.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM idempotency_journal WHERE created_at < ?", (now - self.ttl,))
+            self._connection.execute(
+                "INSERT OR IGNORE INTO idempotency_journal (fingerprint, idempotency_key, created_at) VALUES (?, ?, ?)",
+                (fingerprint, idempotency_key or generate_idempotency_key(), now),
+            )
+            recorded_key, recorded_response = self._connection.execute(
+                "SELECT idempotency_key, response FROM idempotency_journal WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+
+        return recorded_key, json.loads(recorded_response) if recorded_response is not None else None
+
+    def complete(self, fingerprint: str, response: Dict[str, Any]) -> None:
+        """Record the response of a request that succeeded."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE idempotency_journal SET response = ? WHERE fingerprint = ?", (json.dumps(response), fingerprint)
+            )
+
+    def discard(self, fingerprint: str) -> None:
+        """Forget a request, so it is sent with a new idempotency key the next time it is made."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM idempotency_journal WHERE fingerprint = ?", (fingerprint,))
+
+    def close(self) -> None:
+        """Close the database of the journal."""
+        with self._lock:
+            self._connection.close()
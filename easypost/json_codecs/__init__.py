@@ -0,0 +1,13 @@
+# flake8: noqa
+from easypost.json_codecs.base_json_codec import JsonCodec
+from easypost.json_codecs.orjson_json_codec import OrjsonJsonCodec
+from easypost.json_codecs.stdlib_json_codec import StdlibJsonCodec
+
+
+def default_json_codec() -> JsonCodec:
+    """Return the codec used when none is given, a `StdlibJsonCodec`.
+
+    The `OrjsonJsonCodec` encodes request bodies into different bytes than the standard library (without whitespace
+    or escaped non-ASCII characters), it is only used when passed explicitly.
+    """
+    return StdlibJsonCodec()
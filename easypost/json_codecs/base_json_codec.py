@@ -0,0 +1,47 @@
+from typing import (
+    Any,
+    Iterator,
+    Union,
+)
+
+from easypost.easypost_object import (
+    CompactEasyPostObject,
+    EasyPostObject,
+)
+
+
+class JsonCodec:
+    """The interface every JSON codec of a client implements.
+
+    A codec decodes response bodies straight from the bytes received by the transport, without decoding them into
+    a string first, and encodes request bodies into bytes. Errors raised while decoding must be `ValueError`s.
+    """
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into a UTF-8 JSON document in a single pass.
+
+        `EasyPostObject`s are encoded as a reference to their ID (`{"id": ...}`), and `bytes` values as strings.
+        """
+        raise NotImplementedError
+
+    def iter_dumps(self, obj: Any) -> Iterator[bytes]:
+        """Encode an object into a UTF-8 JSON document as it is generated, in chunks of any size.
+
+        Codecs which cannot encode incrementally return the whole document as a single chunk.
+        """
+        yield self.dumps(obj)
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        """Encode the values JSON does not support natively."""
+        if isinstance(value, (EasyPostObject, CompactEasyPostObject)):
+            # Only pass along the ID so the API uses the object reference correctly
+            return {"id": value.id}
+        elif isinstance(value, bytes):
+            return value.decode(encoding="utf-8")
+
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,34 @@
+from typing import (
+    Any,
+    Union,
+)
+
+from easypost.constant import (
+    INVALID_ORJSON_VERSION_ERROR,
+    SUPPORT_EMAIL,
+)
+from easypost.json_codecs.base_json_codec import JsonCodec
+
+
+class OrjsonJsonCodec(JsonCodec):
+    """Decodes and encodes JSON with `orjson`, several times faster than the standard library on large responses
+    such as batches, reports, and lists.
+
+    Install it via `pip install easypost[orjson]`, constructing it without `orjson` installed raises an `ImportError`.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(INVALID_ORJSON_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document, `orjson.JSONDecodeError` is a `ValueError`."""
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into a UTF-8 JSON document."""
+        return self._orjson.dumps(obj, default=self._default)
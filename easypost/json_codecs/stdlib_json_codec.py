@@ -0,0 +1,25 @@
+import json
+from typing import (
+    Any,
+    Iterator,
+    Union,
+)
+
+from easypost.json_codecs.base_json_codec import JsonCodec
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Decodes and encodes JSON with the `json` module of the standard library."""
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document, `json.loads` detects the encoding of bytes itself."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into a UTF-8 JSON document."""
+        return json.dumps(obj, default=self._default).encode(encoding="utf-8")
+
+    def iter_dumps(self, obj: Any) -> Iterator[bytes]:
+        """Encode an object into a UTF-8 JSON document as it is generated, matching `dumps` byte for byte."""
+        for chunk in json.JSONEncoder(default=self._default).iterencode(obj):
+            yield chunk.encode(encoding="utf-8")
@@ -0,0 +1,348 @@
+import io
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+from urllib.parse import urlparse
+
+from easypost.constant import (
+    COMMUNICATION_ERROR,
+    INVALID_PYPDF_VERSION_ERROR,
+    LABEL_DOWNLOAD_ERROR,
+    MIXED_LABEL_FORMATS_ERROR,
+    NO_LABEL_URL_ERROR,
+    SUPPORT_EMAIL,
+    TIMEOUT_ERROR,
+    UNSUPPORTED_LABEL_FORMAT_ERROR,
+)
+from easypost.errors import (
+    EasyPostError,
+    HttpError,
+    InvalidObjectError,
+    InvalidParameterError,
+    TimeoutError,
+    UnknownApiError,
+)
+from easypost.requestor import (
+    STATUS_CODE_TO_ERROR_MAPPING,
+    get_user_agent,
+)
+from easypost.services.base_service import _map_concurrently
+
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Label formats which can be merged into a single print-ready file, ZPL and EPL2 labels are concatenated
+MERGEABLE_FORMATS = ["pdf", "zpl", "epl2"]
+
+
+def _file_format(url: str) -> Optional[str]:
+    """Return the format of a label file according to the extension of its URL."""
+    _, extension = os.path.splitext(urlparse(url).path)
+
+    return extension[1:].lower() or None
+
+
+class LabelDownload:
+    """The result of downloading one label file.
+
+    `label` is the Shipment, Batch, or URL the label was downloaded for. The file is written to `path` when
+    downloading to a directory, otherwise it is held in `buffer`, a read-only memory map of a temporary file which
+    the operating system pages in as it is read. `error` is the error that stopped this download, if any.
+    """
+
+    def __init__(self, index: int, label: Any, url: Optional[str] = None):
+        self.index = index
+        self.label = label
+        self.url = url
+        self.path: Optional[str] = None
+        self.buffer: Optional[Union[mmap.mmap, bytes]] = None
+        self.size = 0
+        self.error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the label was downloaded."""
+        return self.error is None and (self.path is not None or self.buffer is not None)
+
+    @property
+    def file_format(self) -> Optional[str]:
+        """The format of the label (eg: "pdf" or "zpl"), according to the extension of its URL."""
+        return _file_format(url=self.url) if self.url else None
+
+    def open(self) -> BinaryIO:
+        """Open the downloaded file for reading."""
+        if self.path is not None:
+            return open(self.path, "rb")
+
+        return io.BufferedReader(_MemoryMapReader(self.buffer or b""))
+
+    def close(self) -> None:
+        """Release the memory map of a label downloaded to memory."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.buffer = None
+
+
+class _MemoryMapReader(io.RawIOBase):
+    """Reads a memory map from its start without moving the position of the memory map itself."""
+
+    def __init__(self, buffer: Union[mmap.mmap, bytes]):
+        super().__init__()
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        start = self._position
+        end = min(start + len(b), len(self._view))
+        b[: end - start] = self._view[start:end]
+        self._position = end
+
+        return end - start
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: len(self._view)}[whence]
+        self._position = max(0, min(base + offset, len(self._view)))
+
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
+class _ProgressWriter:
+    """Writes the chunks of a download to a file, reporting the progress of the download after each chunk."""
+
+    def __init__(self, file: BinaryIO, download: LabelDownload, progress: Optional[Callable[[LabelDownload], None]]):
+        self._file = file
+        self._download = download
+        self._progress = progress
+
+    def write(self, chunk: bytes) -> int:
+        written = self._file.write(chunk)
+        self._download.size += len(chunk)
+        if self._progress:
+            self._progress(self._download)
+
+        return written
+
+
+class LabelDownloader:
+    """Downloads the label files of Shipments (their `postage_label`) and Batches (their `label_url`, once
+    `client.batch.label()` generated it) concurrently, and merges them into print-ready bundles.
+
+    Up to `concurrency` labels are downloaded at once with the transport of the `client`. Label files are served by
+    other hosts than the API (eg: S3 or a CDN), the `RequestsTransport` keeps a connection pool for them configured
+    like the pool of the API (`pool_maxsize`, `pool_block`, and `max_retries`), so `pool_maxsize` should be at least
+    `concurrency`. Labels are streamed to disk or to memory maps in chunks of `chunk_size` bytes, so they are never
+    held in memory whole. `progress` is called with the `LabelDownload` after each chunk is received, from the
+    thread downloading it. Label files are not EasyPost API requests: they are sent without the API key, hooks do
+    not fire for them, and they are not rate limited, retried by the retry policy, or cached.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        concurrency: int = 8,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Callable[[LabelDownload], None]] = None,
+    ):
+        self._client = client
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._failed = 0
+        self._bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The number of labels downloaded and failed, and of bytes downloaded, by this downloader."""
+        with self._lock:
+            return {
+                "downloaded": self._downloaded,
+                "failed": self._failed,
+                "bytes": self._bytes,
+            }
+
+    def download(
+        self,
+        labels: Iterable[Any],
+        directory: Optional[str] = None,
+        file_format: Optional[str] = None,
+    ) -> Iterator[LabelDownload]:
+        """Download the label of each Shipment, Batch, or label URL of `labels`.
+
+        Labels are written to `directory` (as `<index>_<file name>`, so they sort in the order of `labels`), or to
+        memory maps when no directory is given. Shipments are downloaded in their `file_format` (eg: "pdf", once
+        generated with `client.shipment.label()`) instead of the format they were bought in. A result is yielded
+        for each label as soon as it completes, in completion order, and errors are reported on their result instead
+        of stopping the run.
+        """
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        def download_label(index: int, label: Any) -> LabelDownload:
+            download = LabelDownload(index=index, label=label)
+            try:
+                download.url = self._label_url(label=label, file_format=file_format)
+                if directory is not None:
+                    self._download_to_file(download=download, directory=directory)
+                else:
+                    self._download_to_memory(download=download)
+            except Exception as error:
+                download.error = error
+
+            with self._lock:
+                if download.error is None:
+                    self._downloaded += 1
+                    self._bytes += download.size
+                else:
+                    self._failed += 1
+
+            return download
+
+        return _map_concurrently(download_label, enumerate(labels), self.concurrency)
+
+    def merge(self, downloads: Iterable[LabelDownload], path: str) -> str:
+        """Merge downloaded labels into a single print-ready file at `path`, in the order they were requested.
+
+        PDF labels are merged into one document (which requires `pypdf`, `pip install easypost[pdf]`), ZPL and EPL2
+        labels are concatenated. Failed downloads are skipped, the labels must all have the same format.
+        """
+        succeeded = sorted(
+            [download for download in downloads if download.succeeded],
+            key=lambda download: download.index,
+        )
+        file_formats = sorted({str(download.file_format) for download in succeeded})
+        if len(file_formats) > 1:
+            raise InvalidParameterError(MIXED_LABEL_FORMATS_ERROR.format(", ".join(file_formats)))
+        elif file_formats and file_formats[0] not in MERGEABLE_FORMATS:
+            raise InvalidParameterError(
+                UNSUPPORTED_LABEL_FORMAT_ERROR.format(file_formats[0], ", ".join(MERGEABLE_FORMATS))
+            )
+
+        if file_formats == ["pdf"]:
+            self._merge_pdfs(downloads=succeeded, path=path)
+        else:
+            with open(path, "wb") as merged_file:
+                for download in succeeded:
+                    with download.open() as label_file:
+                        shutil.copyfileobj(label_file, merged_file, self.chunk_size)
+
+        return path
+
+    @staticmethod
+    def _merge_pdfs(downloads: List[LabelDownload], path: str) -> None:
+        """Merge PDF labels into one document with `pypdf`."""
+        try:
+            from pypdf import PdfWriter
+        except ImportError:
+            raise ImportError(INVALID_PYPDF_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+        writer = PdfWriter()
+        label_files = [download.open() for download in downloads]
+        try:
+            for label_file in label_files:
+                writer.append(label_file)
+            with open(path, "wb") as merged_file:
+                writer.write(merged_file)
+        finally:
+            for label_file in label_files:
+                label_file.close()
+
+    @staticmethod
+    def _label_url(label: Any, file_format: Optional[str] = None) -> str:
+        """Return the URL of the label file of a Shipment, a Batch, or a label URL."""
+        if isinstance(label, str):
+            return label
+
+        # Shipments hold their label in `postage_label`, Batches hold the label generated for them
+        postage_label = label.get("postage_label")
+        url = (postage_label or label).get("label_url")
+        if postage_label is not None and file_format:
+            # Labels converted to another format are added next to the label the Shipment was bought in
+            if not url or _file_format(url=url) != file_format.lower():
+                url = postage_label.get(f"label_{file_format.lower()}_url")
+
+        if not url:
+            raise InvalidObjectError(NO_LABEL_URL_ERROR.format(label.get("id")))
+
+        return url
+
+    def _download_to_file(self, download: LabelDownload, directory: str) -> None:
+        """Stream a label to a file of `directory`, removing the partial file when the download fails."""
+        file_name = os.path.basename(urlparse(str(download.url)).path) or "label"
+        path = os.path.join(directory, f"{download.index:05d}_{file_name}")
+        try:
+            with open(path, "wb") as label_file:
+                self._send(download=download, destination=label_file)
+        except BaseException:
+            os.remove(path)
+            raise
+
+        download.path = path
+
+    def _download_to_memory(self, download: LabelDownload) -> None:
+        """Stream a label to an anonymous temporary file and map it into memory."""
+        with tempfile.TemporaryFile() as label_file:
+            self._send(download=download, destination=label_file)
+            label_file.flush()
+            # Empty files cannot be memory mapped
+            download.buffer = mmap.mmap(label_file.fileno(), 0, access=mmap.ACCESS_READ) if download.size else b""
+
+    def _send(self, download: LabelDownload, destination: BinaryIO) -> None:
+        """Download a label with the transport of the client, translating transport errors into EasyPost errors."""
+        transport = self._client.transport
+        url = str(download.url)
+        timeout = self._client.timeout
+
+        try:
+            response = transport.download(
+                url=url,
+                headers={"User-Agent": get_user_agent()},
+                destination=_ProgressWriter(file=destination, download=download, progress=self.progress),
+                timeout=timeout,
+                chunk_size=self.chunk_size,
+            )
+        except EasyPostError:
+            raise
+        except transport.timeout_exceptions:
+            raise TimeoutError(TIMEOUT_ERROR)
+        except Exception as e:
+            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
+
+        if response.status < 200 or response.status >= 300:
+            http_body = (
+                response.body.decode("utf-8", errors="replace") if isinstance(response.body, bytes) else response.body
+            )
+            error_type = STATUS_CODE_TO_ERROR_MAPPING.get(response.status, UnknownApiError)
+            raise error_type(
+                message=LABEL_DOWNLOAD_ERROR.format(url, response.status, http_body),
+                http_status=response.status,
+                http_body=http_body,
+            )
@@ -0,0 +1,166 @@
+import asyncio
+import datetime
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+)
+
+from easypost.constant import DEADLINE_EXCEEDED_ERROR
+from easypost.errors import TimeoutError
+
+
+THROTTLED_STATUS_CODES = {429, 503}
+
+
+class RateLimiter:
+    """Throttles the requests of every thread (or task) sharing an EasyPost client.
+
+    Requests are spent from a token bucket refilled at the current `rate` (requests per second), holding up to
+    `burst` tokens. The rate is controlled with AIMD: each successful response additively increases it, by about
+    `increase` requests per second every second at full throughput, up to the configured `rate`. A throttled
+    response (429 or 503) multiplies it by `decrease_factor`, down to `min_rate`, and pauses every request for the
+    duration of its `Retry-After` header, or one token interval when there is none.
+
+    Requests rejected with a 429 were not processed by the API, so they are sent again after the pause, up to
+    `max_retries` times.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        max_retries: int = 3,
+    ):
+        self.max_rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease_at = 0.0
+        self._throttled_responses = 0
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """The current state of the rate limiter."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            return {
+                "rate": self._rate,
+                "max_rate": self.max_rate,
+                "tokens": self._tokens,
+                "paused_for": max(0.0, self._paused_until - now),
+                "throttled_responses": self._throttled_responses,
+            }
+
+    def acquire(self, deadline_at: Optional[float] = None) -> None:
+        """Block until a request may be sent, raising a `TimeoutError` once `deadline_at` (a `time.monotonic()`
+        value) passes.
+        """
+        while True:
+            wait = self._reserve(deadline_at=deadline_at)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, deadline_at: Optional[float] = None) -> None:
+        """Wait without blocking the event loop until a request may be sent, raising a `TimeoutError` once
+        `deadline_at` (a `time.monotonic()` value) passes.
+        """
+        while True:
+            wait = self._reserve(deadline_at=deadline_at)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def record_response(self, http_status: int, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """Adjust the rate based on the status and headers of a response."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if http_status not in THROTTLED_STATUS_CODES:
+                self._rate = min(self.max_rate, self._rate + self.increase / self._rate)
+                return
+
+            self._throttled_responses += 1
+            # Responses to requests that were in flight together are throttled together, only decrease once for them
+            if now - self._last_decrease_at >= 1 / self._rate:
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._last_decrease_at = now
+
+            retry_after = self.parse_retry_after(headers)
+            pause = retry_after if retry_after is not None else 1 / self._rate
+            self._paused_until = max(self._paused_until, now + pause)
+            self._tokens = 0.0
+
+    def _reserve(self, deadline_at: Optional[float] = None) -> float:
+        """Take a token if one is available, otherwise return the number of seconds to wait before trying again,
+        which does not run past `deadline_at`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._paused_until:
+                wait = self._paused_until - now
+            elif self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            else:
+                wait = (1 - self._tokens) / self._rate
+
+        if deadline_at is None:
+            return wait
+        if now >= deadline_at:
+            raise TimeoutError(DEADLINE_EXCEEDED_ERROR)
+
+        return min(wait, deadline_at - now)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update, must be called with the lock held."""
+        refill_from = max(self._updated_at, self._paused_until)
+        if now > refill_from:
+            self._tokens = min(float(self.burst), self._tokens + (now - refill_from) * self._rate)
+        self._updated_at = max(self._updated_at, now)
+
+    @staticmethod
+    def parse_retry_after(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+        """Return the number of seconds of a `Retry-After` header, given in seconds or as an HTTP date."""
+        if not headers:
+            return None
+
+        value = next((value for key, value in headers.items() if key.lower() == "retry-after"), None)
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -0,0 +1,58 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+)
+
+from easypost.constant import INVALID_REQUEST_OPTION_ERROR
+from easypost.errors import InvalidParameterError
+
+
+# Options that apply to every request made within a `request_options` block
+REQUEST_OPTIONS = {
+    # Gzip-compress request bodies, for endpoints and proxies which accept compressed bodies
+    "compress_body",
+    # Fail requests with a `TimeoutError` once this many seconds passed since entering the block, retries included
+    "deadline",
+    # Send requests with this `Idempotency-Key` header instead of a generated one
+    "idempotency_key",
+    # Allow the retry policy of the client to retry POST, PUT, and PATCH requests
+    "retry_safe",
+    # Stream request bodies as they are encoded (eg: large batches and tracker lists) instead of encoding them whole
+    "stream_body",
+    # The timeout of each attempt of a request in seconds, or a `(connect timeout, read timeout)` tuple
+    "timeout",
+}
+
+_request_options: ContextVar[Dict[str, Any]] = ContextVar("easypost_request_options", default={})
+
+
+@contextmanager
+def request_options(**options: Any) -> Iterator[Dict[str, Any]]:
+    """Apply options to the requests made within the block, on top of the options of enclosing blocks.
+
+    Options are kept in a context variable, so they apply to the current thread or task (and to the tasks it
+    starts) without affecting requests made concurrently elsewhere.
+    """
+    for name in options:
+        if name not in REQUEST_OPTIONS:
+            raise InvalidParameterError(message=INVALID_REQUEST_OPTION_ERROR.format(name, sorted(REQUEST_OPTIONS)))
+
+    merged_options = {**_request_options.get(), **options}
+    if options.get("deadline") is not None:
+        # A deadline is relative to entering its block, and cannot extend the deadline of an enclosing block
+        deadline_at = time.monotonic() + options["deadline"]
+        merged_options["deadline_at"] = min(deadline_at, merged_options.get("deadline_at", deadline_at))
+    token = _request_options.set(merged_options)
+    try:
+        yield merged_options
+    finally:
+        _request_options.reset(token)
+
+
+def get_request_options() -> Dict[str, Any]:
+    """Return the options of the innermost `request_options` block."""
+    return _request_options.get()
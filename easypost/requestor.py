@@ -4,8 +4,12 @@ import platform
 import time
 import uuid
 from enum import Enum
-from json import JSONDecodeError
+from functools import (
+    lru_cache,
+    partial,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     List,
@@ -15,11 +19,10 @@ from typing import (
 )
 from urllib.parse import urlencode
 
-import requests
 from easypost.constant import (
     API_VERSION,
     COMMUNICATION_ERROR,
-    INVALID_REQUEST_LIB_ERROR,
+    DEADLINE_EXCEEDED_ERROR,
     INVALID_REQUEST_METHOD_ERROR,
     INVALID_REQUEST_PARAMETERS_ERROR,
     INVALID_RESPONSE_BODY_ERROR,
@@ -27,8 +30,12 @@ from easypost.constant import (
     TIMEOUT_ERROR,
     VERSION,
 )
-from easypost.easypost_object import EasyPostObject
+from easypost.easypost_object import (
+    CompactEasyPostObject,
+    EasyPostObject,
+)
 from easypost.errors import (
+    ApiError,
     BadRequestError,
     EasyPostError,
     ForbiddenError,
@@ -47,6 +54,20 @@ from easypost.errors import (
     UnauthorizedError,
     UnknownApiError,
 )
+from easypost.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    generate_idempotency_key,
+)
+from easypost.rate_limiter import RateLimiter
+from easypost.request_options import get_request_options
+from easypost.response_cache import ResponseCache
+
+
+if TYPE_CHECKING:
+    from easypost.transports import (
+        Timeout,
+        TransportResponse,
+    )
 
 
 STATUS_CODE_TO_ERROR_MAPPING: Dict[int, Any] = {
@@ -65,6 +86,10 @@ STATUS_CODE_TO_ERROR_MAPPING: Dict[int, Any] = {
 }
 
 
+# Client errors which mean the API did not process a request, and will not when it is sent again as-is
+NON_RETRYABLE_STATUS_CODES = {400, 401, 402, 403, 404, 405, 422}
+
+
 class RequestMethod(Enum):
     GET = "get"
     POST = "post"
@@ -73,6 +98,48 @@ class RequestMethod(Enum):
     DELETE = "delete"
 
 
+@lru_cache(maxsize=None)
+def get_user_agent() -> str:
+    """Build the User-Agent header sent with every request.
+
+    Probing the platform is slow compared to the rest of a request and its result never changes
+    during the life of a process, so it is computed once and cached.
+    """
+    # Fallback values for the user-agent header
+    user_agent = {
+        "client_version": VERSION,
+        "implementation": "NA",
+        "os_arch": "NA",
+        "os_version": "NA",
+        "os": "NA",
+        "python_version": "NA",
+    }
+
+    # Attempt to populate the user-agent header
+    for attr, func in (
+        ("implementation", platform.python_implementation),
+        ("os_details", platform.uname),
+        ("python_version", platform.python_version),
+    ):
+        try:
+            val = func()  # type: ignore
+            if attr == "os_details":
+                user_agent["os"] = val[0]
+                user_agent["os_version"] = val[2]
+                user_agent["os_arch"] = val[4]
+            else:
+                user_agent[attr] = val  # type: ignore
+        except Exception:  # nosec
+            # If we fail to get OS info, do nothing as we already set fallbacks for these values
+            pass
+
+    return (
+        f"EasyPost/{API_VERSION} PythonClient/{VERSION} Python/{user_agent['python_version']}"
+        f" OS/{user_agent['os']} OSVersion/{user_agent['os_version']} OSArch/{user_agent['os_arch']}"
+        f" Implementation/{user_agent['implementation']}"
+    )
+
+
 class Requestor:
     def __init__(self, client):
         self._client = client
@@ -82,7 +149,7 @@ class Requestor:
         """If providing an object as a parameter to another object,
         only pass along the ID so the API will use the object reference correctly.
         """
-        if isinstance(param, EasyPostObject):
+        if isinstance(param, (EasyPostObject, CompactEasyPostObject)):
             return {"id": param.id}
         elif isinstance(param, dict):
             data = {}
@@ -133,201 +200,444 @@ class Requestor:
         url: str,
         params: Optional[Dict[str, Any]] = None,
         beta: bool = False,
+        idempotent: bool = False,
+        cacheable: bool = False,
+        resumable: bool = True,
     ) -> Dict[str, Any]:
-        """Make a request to the EasyPost API."""
+        """Make a request to the EasyPost API.
+
+        Requests which must not be processed twice, such as purchases, are made with `idempotent=True` so they
+        are sent with an idempotency key when the client retries requests or has an idempotency journal. Purchases
+        whose request does not identify what they buy (eg: `batch.create_and_buy`) are made with `resumable=False`,
+        they are only recorded in the journal under an idempotency key set for them. Requests
+        to read-mostly endpoints are made with `cacheable=True` so they are answered from the response cache of
+        the client when it has one.
+        """
         if params is None:
             params = {}
 
-        http_body, http_status = self.request_raw(
+        cache = self._client.response_cache if cacheable else None
+        cached_response = None
+        if cache:
+            cache_key = cache.make_key(api_key=self._client.api_key, url=url, params=params, beta=beta)
+            cached_response = cache.get(key=cache_key)
+            if cached_response is not None and cached_response.fresh:
+                return self.interpret_response(
+                    http_body=cached_response.http_body,
+                    http_status=cached_response.http_status,
+                )
+
+        fingerprint, idempotency_key, response = self._start_idempotent_request(
             method=method,
             url=url,
             params=params,
-            beta=beta,
+            idempotent=idempotent,
+            resumable=resumable,
         )
+        if response is not None:
+            return response
 
-        response = self.interpret_response(http_body=http_body, http_status=http_status)
+        try:
+            http_body, http_status, http_headers = self._coalesced_request_raw(
+                method=method,
+                url=url,
+                params=params,
+                beta=beta,
+                idempotency_key=idempotency_key,
+                headers=cached_response.conditional_headers if cached_response else None,
+            )
+            # An expired cached response confirmed unchanged by the API is served from the cache
+            revalidated_response = cached_response if http_status == 304 else None
+            if revalidated_response is not None:
+                http_body, http_status = revalidated_response.http_body, revalidated_response.http_status
+
+            response = self.interpret_response(http_body=http_body, http_status=http_status)
+        except EasyPostError as error:
+            self._finish_idempotent_request(fingerprint=fingerprint, error=error)
+            if method != RequestMethod.GET:
+                self._invalidate_cached_responses(url=url)
+            raise
+
+        self._finish_idempotent_request(fingerprint=fingerprint, response=response)
+        if cache and revalidated_response:
+            cache.revalidate(key=cache_key, cached_response=revalidated_response, headers=http_headers)
+        elif cache:
+            cache.set(key=cache_key, http_body=http_body, http_status=http_status, headers=http_headers)
+        if method != RequestMethod.GET:
+            self._invalidate_cached_responses(url=url)
 
         return response
 
-    def request_raw(
+    def _coalesced_request_raw(
         self,
         method: RequestMethod,
         url: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Dict[str, Any],
         beta: bool = False,
-    ) -> Tuple[str, int]:
-        """Internal logic required to make a request to the EasyPost API."""
-        abs_url = f"{self._client.api_base}{url}"
+        idempotency_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Union[str, bytes], int, Dict[str, Any]]:
+        """Make a request with `request_raw`, sharing the response of an identical GET request already in flight
+        when the client has a `SingleFlight`.
+        """
+        request_raw = partial(
+            self.request_raw,
+            method=method,
+            url=url,
+            params=params,
+            beta=beta,
+            idempotency_key=idempotency_key,
+            headers=headers,
+        )
+        single_flight = self._client.single_flight
+        if single_flight is None or method != RequestMethod.GET:
+            return request_raw()
+
+        return single_flight.do(
+            key=self._single_flight_key(url=url, params=params, beta=beta, headers=headers),
+            fn=request_raw,
+            timeout=self._coalesced_wait_timeout(),
+        )
 
-        if beta:
-            abs_url = abs_url.replace(API_VERSION, "beta")
+    def _coalesced_wait_timeout(self) -> Optional[float]:
+        """Return how long a request may wait for an identical request in flight: until its deadline, or for its
+        timeout (the connect and read timeouts of a tuple together).
+        """
+        options = get_request_options()
+        deadline_at = options.get("deadline_at")
+        if deadline_at is not None:
+            return max(0.0, deadline_at - time.monotonic())
 
-        params = self._objects_to_ids(param=params or {})
+        timeout = options.get("timeout", self._client.timeout)
 
-        # Fallback values for the user-agent header
-        user_agent = {
-            "client_version": VERSION,
-            "implementation": "NA",
-            "os_arch": "NA",
-            "os_version": "NA",
-            "os": "NA",
-            "python_version": "NA",
-        }
+        return sum(timeout) if isinstance(timeout, tuple) else timeout
 
-        # Attempt to populate the user-agent header
-        for attr, func in (
-            ("implementation", platform.python_implementation),
-            ("os_details", platform.uname),
-            ("python_version", platform.python_version),
-        ):
-            try:
-                val = func()  # type: ignore
-                if attr == "os_details":
-                    user_agent["os"] = val[0]
-                    user_agent["os_version"] = val[2]
-                    user_agent["os_arch"] = val[4]
-                else:
-                    user_agent[attr] = val  # type: ignore
-            except Exception:  # nosec
-                # If we fail to get OS info, do nothing as we already set fallbacks for these values
-                pass
-
-        user_agent = (
-            f"EasyPost/{API_VERSION} PythonClient/{VERSION} Python/{user_agent['python_version']}"  # type: ignore
-            f" OS/{user_agent['os']} OSVersion/{user_agent['os_version']} OSArch/{user_agent['os_arch']}"
-            f" Implementation/{user_agent['implementation']}"
-        )
+    def _single_flight_key(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        beta: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Identify the GET requests which can share a response in flight."""
+        key = ResponseCache.make_key(api_key=self._client.api_key, url=url, params=params, beta=beta)
+        # Requests revalidating different cached responses cannot share a response
+        if headers:
+            key += f"|{json.dumps(headers, sort_keys=True)}"
 
-        headers = {
-            "Authorization": "Bearer %s" % self._client.api_key,
-            "User-Agent": user_agent,
-        }
+        return key
 
-        request_uuid = uuid.uuid4()
-        request_timestamp = datetime.datetime.now(datetime.timezone.utc)
-        self._client._request_hook(
-            method=method,
-            path=abs_url,
-            headers=headers,
-            request_body=params,
-            request_timestamp=request_timestamp,
-            request_uuid=request_uuid,
-        )
+    def request_raw(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        beta: bool = False,
+        idempotency_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Union[str, bytes], int, Dict[str, Any]]:
+        """Internal logic required to make a request to the EasyPost API, `headers` are added to the headers of
+        the client (eg: the conditional headers of a cached response).
+        """
+        abs_url, request_headers, params = self._prepare_request(url=url, params=params, beta=beta)
+        headers = {**request_headers, **(headers or {})}
+        # Every attempt of a request carries the same idempotency key, which makes it safe to retry
+        if idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        options = get_request_options()
+        retry_safe = bool(idempotency_key) or options.get("retry_safe", False)
+        deadline_at = options.get("deadline_at")
+        rate_limiter = self._client.rate_limiter
+        started_at = time.monotonic()
+        attempt = 1
+        rate_limited_attempts = 0
+
+        while True:
+            if rate_limiter:
+                rate_limiter.acquire(deadline_at=deadline_at)
+
+            request_uuid = uuid.uuid4()
+            request_timestamp = datetime.datetime.now(datetime.timezone.utc)
+            # Params keep the objects passed to them until they are encoded, subscribers receive their IDs instead
+            if self._client._request_hook:
+                self._client._request_hook(
+                    method=method,
+                    path=abs_url,
+                    headers=headers,
+                    request_body=self._objects_to_ids(param=params),
+                    request_timestamp=request_timestamp,
+                    request_uuid=request_uuid,
+                )
 
-        if self._client._request_lib == "urlfetch":
-            http_body, http_status, http_headers = self.urlfetch_request(
-                method=method, abs_url=abs_url, headers=headers, params=params
+            try:
+                http_response = self._send_request(
+                    method=method,
+                    abs_url=abs_url,
+                    headers=headers,
+                    params=params,
+                    timeout=self._attempt_timeout(deadline_at=deadline_at),
+                )
+            except (TimeoutError, HttpError):
+                delay = self._retry_delay(
+                    method=method,
+                    retry_safe=retry_safe,
+                    attempt=attempt,
+                    started_at=started_at,
+                    deadline_at=deadline_at,
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            http_body, http_status, http_headers = http_response.body, http_response.status, http_response.headers
+
+            # The body is only decoded into a string for the response hook when something subscribed to it
+            if self._client._response_hook:
+                response_timestamp = datetime.datetime.now(datetime.timezone.utc)
+                self._client._response_hook(
+                    http_status=http_status,
+                    method=method,
+                    path=abs_url,
+                    headers=http_headers,
+                    response_body=self._body_text(http_body=http_body),
+                    response_size=http_response.size,
+                    response_wire_size=http_response.wire_size,
+                    request_timestamp=request_timestamp,
+                    response_timestamp=response_timestamp,
+                    request_uuid=request_uuid,
+                )
+
+            if rate_limiter:
+                rate_limiter.record_response(http_status=http_status, headers=http_headers)
+                # Requests rejected with a 429 were not processed and can be sent again once the rate limiter allows
+                if http_status == 429 and rate_limited_attempts < rate_limiter.max_retries:
+                    rate_limited_attempts += 1
+                    continue
+
+            delay = self._retry_delay(
+                method=method,
+                retry_safe=retry_safe,
+                attempt=attempt,
+                started_at=started_at,
+                deadline_at=deadline_at,
+                http_status=http_status,
+                http_headers=http_headers,
             )
-        elif self._client._request_lib == "requests":
-            http_body, http_status, http_headers = self.requests_request(
-                method=method, abs_url=abs_url, headers=headers, params=params
+            if delay is None:
+                break
+            time.sleep(delay)
+            attempt += 1
+
+        return http_body, http_status, http_headers
+
+    def _start_idempotent_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Dict[str, Any],
+        idempotent: bool,
+        resumable: bool = True,
+    ) -> Tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+        """Return the journal fingerprint and idempotency key of a request, along with its response when the
+        idempotency journal of the client recorded that it already succeeded.
+        """
+        # Only purchases are sent with an idempotency key, the other requests of a `request_options` block must not
+        # share the key of its purchase
+        if not idempotent:
+            return None, None, None
+
+        idempotency_key = get_request_options().get("idempotency_key")
+
+        journal = self._client.idempotency_journal
+        # The same purchase made again on purpose cannot be told apart from a resumed one without a key set for it
+        if journal and (resumable or idempotency_key is not None):
+            fingerprint = journal.fingerprint(
+                api_key=self._client.api_key,
+                method=method.value,
+                url=url,
+                params=self._objects_to_ids(param=params),
+                idempotency_key=None if resumable else idempotency_key,
             )
-        else:
-            raise EasyPostError(INVALID_REQUEST_LIB_ERROR.format(self._client._request_lib, SUPPORT_EMAIL))
+            idempotency_key, response = journal.begin(fingerprint=fingerprint, idempotency_key=idempotency_key)
+            return fingerprint, idempotency_key, response
 
-        response_timestamp = datetime.datetime.now(datetime.timezone.utc)
-        self._client._response_hook(
-            http_status=http_status,
-            method=method,
-            path=abs_url,
-            headers=http_headers,
-            response_body=http_body,
-            request_timestamp=request_timestamp,
-            response_timestamp=response_timestamp,
-            request_uuid=request_uuid,
+        # Without a journal, a key is only needed to make the retries of the request safe
+        if idempotency_key is None and self._client.retry_policy:
+            idempotency_key = generate_idempotency_key()
+
+        return None, idempotency_key, None
+
+    def _finish_idempotent_request(
+        self,
+        fingerprint: Optional[str],
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[EasyPostError] = None,
+    ) -> None:
+        """Record the outcome of a request in the idempotency journal of the client."""
+        if fingerprint is None:
+            return
+
+        if error is None:
+            self._client.idempotency_journal.complete(fingerprint=fingerprint, response=response)
+        elif isinstance(error, ApiError) and error.http_status in NON_RETRYABLE_STATUS_CODES:
+            # The API rejected the request, it can be made again with a new key once its issue is fixed
+            self._client.idempotency_journal.discard(fingerprint=fingerprint)
+
+    def _invalidate_cached_responses(self, url: str) -> None:
+        """Remove the cached responses of the object changed by a request (eg: `/shipments/shp_123` when it is
+        bought), whether or not the request succeeded.
+        """
+        cache = self._client.response_cache
+        segments = url.split("/")
+        if cache and len(segments) > 2:
+            cache.invalidate(url="/".join(segments[:3]))
+
+    def _retry_delay(
+        self,
+        method: RequestMethod,
+        retry_safe: bool,
+        attempt: int,
+        started_at: float,
+        deadline_at: Optional[float] = None,
+        http_status: Optional[int] = None,
+        http_headers: Optional[Dict[str, Any]] = None,
+    ) -> Optional[float]:
+        """Return the number of seconds to wait before retrying a request that failed on the given attempt,
+        or `None` when the retry policy of the client does not allow retrying it.
+        """
+        retry_policy = self._client.retry_policy
+        if retry_policy is None:
+            return None
+        if not retry_policy.allows(method=method, retry_safe=retry_safe):
+            return None
+        if http_status is not None and http_status not in retry_policy.status_codes:
+            return None
+
+        now = time.monotonic()
+        delay = retry_policy.delay(
+            attempt=attempt,
+            elapsed=now - started_at,
+            retry_after=RateLimiter.parse_retry_after(http_headers),
         )
+        if delay is not None and deadline_at is not None and now + delay >= deadline_at:
+            return None
 
-        return http_body, http_status
+        return delay
 
-    def interpret_response(self, http_body: str, http_status: int) -> Dict[str, Any]:
-        """Interpret the response body we receive from the API."""
-        if http_status == 204:
-            # HTTP 204 does not have any response body and we can just return here
-            return {}
+    def _attempt_timeout(self, deadline_at: Optional[float] = None) -> "Timeout":
+        """Return the timeout of the next attempt of a request, which must not run past the deadline of the request.
 
-        try:
-            response = json.loads(http_body)
-        except JSONDecodeError:
-            raise JsonError(INVALID_RESPONSE_BODY_ERROR.format(http_body, http_status))
+        Raises a `TimeoutError` when the deadline has passed.
+        """
+        timeout = get_request_options().get("timeout", self._client.timeout)
+        if deadline_at is None:
+            return timeout
 
-        if http_status < 200 or http_status >= 300:
-            self.handle_api_error(http_status=http_status, http_body=http_body, response=response)
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(DEADLINE_EXCEEDED_ERROR)
 
-        return response
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return min(connect_timeout, remaining), min(read_timeout, remaining)
+
+        return min(timeout, remaining)
 
-    def requests_request(
+    def _send_request(
         self,
         method: RequestMethod,
         abs_url: str,
         headers: Dict[str, Any],
         params: Dict[str, Any],
-    ) -> Tuple[str, int, Dict[str, Any]]:
-        """Make a request by using the `request` library."""
-        if method in [RequestMethod.GET, RequestMethod.DELETE]:
-            url_params = params
-            body = None
-        elif method in [RequestMethod.POST, RequestMethod.PATCH, RequestMethod.PUT]:
-            url_params = None
-            body = params
-        else:
-            raise EasyPostError(INVALID_REQUEST_METHOD_ERROR.format(method, SUPPORT_EMAIL))
-
-        if url_params and method not in [RequestMethod.GET, RequestMethod.DELETE]:
-            raise EasyPostError(INVALID_REQUEST_PARAMETERS_ERROR)
+        timeout: "Timeout",
+    ) -> "TransportResponse":
+        """Send a request with the transport of the client, translating transport errors into EasyPost errors."""
+        transport = self._client.transport
+        url_params, body = self._split_params(
+            method=method,
+            params=params,
+            encodes_object_references=transport.encodes_object_references,
+        )
 
         try:
-            result = self._client._requests_session.request(
-                method=method.value,
+            return transport.request(
+                method=method,
                 url=abs_url,
-                params=url_params,
                 headers=headers,
-                json=body,
-                timeout=self._client.timeout,
-                verify=True,
+                params=url_params,
+                body=body,
+                timeout=timeout,
             )
-            http_body = result.text
-            http_status = result.status_code
-            http_headers = result.headers
-        except requests.exceptions.Timeout:
+        except EasyPostError:
+            raise
+        except transport.timeout_exceptions:
             raise TimeoutError(TIMEOUT_ERROR)
         except Exception as e:
             raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
 
-        return http_body, http_status, http_headers
-
-    def urlfetch_request(
-        self,
+    @classmethod
+    def _split_params(
+        cls,
         method: RequestMethod,
-        abs_url: str,
-        headers: Dict[str, Any],
         params: Dict[str, Any],
-    ) -> Tuple[str, int, Dict[str, Any]]:
-        """Make a request by using the `urlfetch` library."""
-        fetch_args = {
-            "method": method.value,
-            "headers": headers,
-            "validate_certificate": False,
-            "deadline": self._client.timeout,
-        }
+        encodes_object_references: bool = False,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Split params into query params (GET/DELETE requests) or body params (POST/PUT/PATCH requests).
 
+        Objects passed as params are replaced with their IDs, except in the body params of a transport which
+        `encodes_object_references` itself while encoding the body, saving a copy of large bodies.
+        """
         if method in [RequestMethod.GET, RequestMethod.DELETE]:
-            # GET/DELETE requests use query params
-            fetch_args["url"] = self.add_params_to_url(url=abs_url, params=params, method=method)
-        elif method in [RequestMethod.POST, RequestMethod.PUT]:
-            fetch_args["url"] = abs_url
-            # POST/PUT requests use body params
-            fetch_args["payload"] = json.dumps(params, default=self._utf8)
+            return cls._objects_to_ids(param=params), None
+        elif method in [RequestMethod.POST, RequestMethod.PATCH, RequestMethod.PUT]:
+            return None, params if encodes_object_references else cls._objects_to_ids(param=params)
         else:
             raise EasyPostError(INVALID_REQUEST_METHOD_ERROR.format(method, SUPPORT_EMAIL))
 
+    def _prepare_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        beta: bool = False,
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """Build the absolute URL, headers, and params of a request to the EasyPost API."""
+        abs_url = f"{self._client.api_base}{url}"
+
+        if beta:
+            abs_url = abs_url.replace(API_VERSION, "beta")
+
+        params = params or {}
+
+        headers = {
+            **self._client.headers,
+            "Authorization": "Bearer %s" % self._client.api_key,
+            "User-Agent": get_user_agent(),
+        }
+
+        return abs_url, headers, params
+
+    def interpret_response(self, http_body: Union[str, bytes], http_status: int) -> Dict[str, Any]:
+        """Interpret the response body we receive from the API.
+
+        The body is decoded by the JSON codec of the client straight from the bytes received by the transport.
+        """
+        if http_status == 204:
+            # HTTP 204 does not have any response body and we can just return here
+            return {}
+
         try:
-            from google.appengine.api import urlfetch  # type: ignore
+            response = self._client.json_codec.loads(http_body)
+        except ValueError:
+            raise JsonError(INVALID_RESPONSE_BODY_ERROR.format(self._body_text(http_body=http_body), http_status))
 
-            result = urlfetch.fetch(**fetch_args)  # type: ignore
-        except Exception as e:
-            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
+        if http_status < 200 or http_status >= 300:
+            self.handle_api_error(
+                http_status=http_status, http_body=self._body_text(http_body=http_body), response=response
+            )
 
-        return result.content, result.status_code, result.headers
+        return response
 
     def handle_api_error(self, http_status: int, http_body: str, response: Dict[str, Any]) -> None:
         """Handles API errors returned from the EasyPost API."""
@@ -351,13 +661,16 @@ class Requestor:
             http_body=http_body,
         )
 
-    def _utf8(self, value: Union[str, bytes]) -> str:
-        # Python3's str(bytestring) returns "b'bytestring'" so we use .decode instead
-        if isinstance(value, bytes):
-            return value.decode(encoding="utf-8")
-        return value
+    @staticmethod
+    def _body_text(http_body: Union[str, bytes]) -> str:
+        """Return the body of a response as a string, the API always responds with UTF-8."""
+        if isinstance(http_body, bytes):
+            return http_body.decode(encoding="utf-8", errors="replace")
+
+        return http_body
 
-    def encode_url_params(self, params: Dict[str, Any], method: RequestMethod) -> Union[str, None]:
+    @staticmethod
+    def encode_url_params(params: Dict[str, Any], method: RequestMethod) -> Union[str, None]:
         """Encode params for a URL."""
         if method not in [RequestMethod.GET, RequestMethod.DELETE]:
             raise EasyPostError(INVALID_REQUEST_PARAMETERS_ERROR)
@@ -373,12 +686,13 @@ class Requestor:
 
         return urlencode(query=converted_params)
 
-    def add_params_to_url(self, url: str, params: Dict[str, Any], method: RequestMethod) -> str:
+    @staticmethod
+    def add_params_to_url(url: str, params: Dict[str, Any], method: RequestMethod) -> str:
         """Add params to the URL."""
         if method not in [RequestMethod.GET, RequestMethod.DELETE]:
             raise EasyPostError(INVALID_REQUEST_PARAMETERS_ERROR)
 
-        encoded_params = self.encode_url_params(params=params, method=method)
+        encoded_params = Requestor.encode_url_params(params=params, method=method)
 
         if encoded_params:
             return "%s?%s" % (url, encoded_params)
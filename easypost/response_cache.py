@@ -0,0 +1,234 @@
+import hashlib
+import json
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from easypost.cache_backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+)
+from easypost.constant import API_VERSION
+
+
+# Shipments and Trackers change as they are bought and delivered, they are only served without revalidating them
+# when a TTL is set for them
+DEFAULT_TTLS = {
+    "/shipments": 0,
+    "/trackers": 0,
+}
+
+
+def _get_header(headers: Optional[Mapping[str, Any]], name: str) -> Optional[str]:
+    """Return the value of a header, matching its name case-insensitively."""
+    if not headers:
+        return None
+
+    return next((value for key, value in headers.items() if key.lower() == name), None)
+
+
+class CachedResponse:
+    """A cached response, along with the validators used to revalidate it with a conditional request."""
+
+    def __init__(
+        self,
+        http_body: str,
+        http_status: int,
+        fresh_until: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.http_body = http_body
+        self.http_status = http_status
+        self.fresh_until = fresh_until
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the response can be served without revalidating it."""
+        return time.time() < self.fresh_until
+
+    @property
+    def validator_headers(self) -> Dict[str, str]:
+        """The `ETag` and `Last-Modified` headers of the response."""
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+
+        return headers
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """The headers of a conditional request answered with a 304 when the response has not changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def dumps(self) -> str:
+        """Serialize the response for a cache backend, header values cannot contain line breaks."""
+        return "\n".join(
+            [str(self.http_status), repr(self.fresh_until), self.etag or "", self.last_modified or "", self.http_body]
+        )
+
+    @classmethod
+    def loads(cls, value: str) -> "CachedResponse":
+        """Deserialize a response serialized with `dumps`."""
+        http_status, fresh_until, etag, last_modified, http_body = value.split("\n", 4)
+
+        return cls(
+            http_body=http_body,
+            http_status=int(http_status),
+            fresh_until=float(fresh_until),
+            etag=etag or None,
+            last_modified=last_modified or None,
+        )
+
+
+class ResponseCache:
+    """Caches the responses of read-mostly endpoints (carrier metadata, carrier types, API keys, and payment methods)
+    and of retrieved Shipments and Trackers.
+
+    Responses are kept for `ttl` seconds, or for the TTL of the longest prefix of their URL in `ttls` (eg:
+    `{"/metadata": 3600, "/shipments": 30}`), a TTL of 0 disables caching for those URLs. Responses are stored in
+    the `backend`, which defaults to a `MemoryCacheBackend` holding up to `max_size` responses. Responses are cached
+    per API key.
+
+    When the API sends an `ETag` or `Last-Modified` header with a response, expired responses are revalidated with
+    a conditional request (`If-None-Match`/`If-Modified-Since`): an unchanged object is answered with an empty 304
+    and served from the cache. With `revalidation` enabled (the default), these responses are kept for `stale_ttl`
+    seconds, so retrieved Shipments and Trackers are revalidated on every retrieval even without a TTL.
+
+    Cached responses are returned without sending a request, so hooks do not fire for them. Requests which change
+    an object (eg: `client.shipment.buy()`) invalidate its cached responses, use `invalidate()` when data changes
+    elsewhere.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        backend: Optional[CacheBackend] = None,
+        revalidation: bool = True,
+        stale_ttl: float = 24 * 60 * 60,
+    ):
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.backend = backend if backend is not None else MemoryCacheBackend(max_size=max_size)
+        self.revalidation = revalidation
+        self.stale_ttl = stale_ttl
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The number of hits, misses, and revalidations (cached responses confirmed unchanged by a 304) of the
+        cache in this process.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "revalidations": self._revalidations,
+            }
+
+    @staticmethod
+    def make_key(api_key: str, url: str, params: Dict[str, Any], beta: bool = False) -> str:
+        """Identify a request by its URL, API key, and params.
+
+        Keys start with the URL so the responses of a URL can be invalidated by prefix. The API key is hashed so
+        it is not stored in shared backends.
+        """
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        version = "beta" if beta else API_VERSION
+
+        return f"{url}|{version}|{api_key_hash}|{json.dumps(params, sort_keys=True, default=str)}"
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL of the responses of a URL."""
+        matching_prefixes = [prefix for prefix in self.ttls if url.startswith(prefix)]
+        if not matching_prefixes:
+            return self.ttl
+
+        return self.ttls[max(matching_prefixes, key=len)]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return a cached response, which may have expired but still be revalidated, or `None` when it is not
+        cached.
+        """
+        value = self.backend.get(key=key)
+        cached_response = CachedResponse.loads(value) if value is not None else None
+        with self._lock:
+            if cached_response is not None and cached_response.fresh:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        return cached_response
+
+    def set(
+        self,
+        key: str,
+        http_body: Union[str, bytes],
+        http_status: int,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Cache a response, bodies are stored as strings.
+
+        Responses with an `ETag` or `Last-Modified` header are kept for `stale_ttl` seconds after they expire so
+        they can be revalidated, even for URLs with a TTL of 0.
+        """
+        ttl = self.ttl_for(url=key.split("|", 1)[0])
+        etag = _get_header(headers, "etag") if self.revalidation else None
+        last_modified = _get_header(headers, "last-modified") if self.revalidation else None
+
+        storage_ttl = max(ttl, self.stale_ttl) if etag or last_modified else ttl
+        if storage_ttl <= 0:
+            return
+
+        cached_response = CachedResponse(
+            http_body=http_body.decode(encoding="utf-8") if isinstance(http_body, bytes) else http_body,
+            http_status=http_status,
+            fresh_until=time.time() + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self.backend.set(key=key, value=cached_response.dumps(), ttl=storage_ttl)
+
+    def revalidate(self, key: str, cached_response: CachedResponse, headers: Optional[Mapping[str, Any]]) -> None:
+        """Keep a cached response for another TTL once the API confirmed it is unchanged with a 304."""
+        with self._lock:
+            self._revalidations += 1
+
+        # A 304 may omit the validators of the response it confirms
+        if _get_header(headers, "etag") is None and _get_header(headers, "last-modified") is None:
+            headers = cached_response.validator_headers
+
+        self.set(key=key, http_body=cached_response.http_body, http_status=cached_response.http_status, headers=headers)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Remove the cached responses of a URL and of the URLs below it (eg: `/metadata` removes the responses
+        of `/metadata/carriers`), or every cached response.
+        """
+        if url is None:
+            self.backend.clear()
+            return
+
+        self.backend.delete_prefix(prefix=f"{url}|")
+        self.backend.delete_prefix(prefix=f"{url}/")
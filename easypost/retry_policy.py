@@ -0,0 +1,62 @@
+import random
+from typing import (
+    Iterable,
+    Optional,
+    Union,
+)
+
+from easypost.requestor import RequestMethod
+
+
+class RetryPolicy:
+    """Decides which failed requests a client sends again, and how long it waits before doing so.
+
+    A request is retried when it timed out, could not reach the API, or was answered with one of the
+    `status_codes`, as long as its method is one of the `methods` (GET and DELETE by default, requests made
+    within a `client.request_options(retry_safe=True)` block are retried whatever their method).
+
+    Retries wait with exponential backoff and full jitter: a random delay of up to `backoff_factor * 2 ** n`
+    seconds (capped at `max_backoff`) before the nth retry, or longer when the response has a `Retry-After`
+    header. A request is sent at most `max_attempts` times, and is not retried once the next attempt would
+    start after `deadline` seconds since the first one.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        methods: Iterable[Union[RequestMethod, str]] = (RequestMethod.GET, RequestMethod.DELETE),
+        status_codes: Iterable[int] = (408, 502, 503, 504),
+        backoff_factor: float = 0.5,
+        max_backoff: float = 10.0,
+        deadline: Optional[float] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.methods = {RequestMethod(method.lower()) if isinstance(method, str) else method for method in methods}
+        self.status_codes = set(status_codes)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+
+    def allows(self, method: RequestMethod, retry_safe: bool = False) -> bool:
+        """Whether requests with this method may be retried."""
+        return retry_safe or method in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """Return a random delay to wait before the retry following the given (1-based) attempt."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))  # nosec
+
+    def delay(self, attempt: int, elapsed: float, retry_after: Optional[float] = None) -> Optional[float]:
+        """Return the number of seconds to wait before retrying a request that failed on the given attempt,
+        or `None` when it must not be retried anymore.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+
+        return delay
@@ -1,5 +1,30 @@
 # flake8: noqa
 from easypost.services.address_service import AddressService
+from easypost.services.async_address_service import AsyncAddressService
+from easypost.services.async_batch_service import AsyncBatchService
+from easypost.services.async_beta_carrier_metadata_service import AsyncBetaCarrierMetadataService
+from easypost.services.async_beta_rate_service import AsyncBetaRateService
+from easypost.services.async_beta_referral_customer_service import AsyncBetaReferralCustomerService
+from easypost.services.async_billing_service import AsyncBillingService
+from easypost.services.async_carrier_account_service import AsyncCarrierAccountService
+from easypost.services.async_carrier_metadata_service import AsyncCarrierMetadataService
+from easypost.services.async_customs_info_service import AsyncCustomsInfoService
+from easypost.services.async_customs_item_service import AsyncCustomsItemService
+from easypost.services.async_end_shipper_service import AsyncEndShipperService
+from easypost.services.async_event_service import AsyncEventService
+from easypost.services.async_insurance_service import AsyncInsuranceService
+from easypost.services.async_order_service import AsyncOrderService
+from easypost.services.async_parcel_service import AsyncParcelService
+from easypost.services.async_pickup_service import AsyncPickupService
+from easypost.services.async_rate_service import AsyncRateService
+from easypost.services.async_referral_customer_service import AsyncReferralCustomerService
+from easypost.services.async_refund_service import AsyncRefundService
+from easypost.services.async_report_service import AsyncReportService
+from easypost.services.async_scan_form_service import AsyncScanFormService
+from easypost.services.async_shipment_service import AsyncShipmentService
+from easypost.services.async_tracker_service import AsyncTrackerService
+from easypost.services.async_user_service import AsyncUserService
+from easypost.services.async_webhook_service import AsyncWebhookService
 from easypost.services.batch_service import BatchService
 from easypost.services.beta_carrier_metadata_service import BetaCarrierMetadataService
 from easypost.services.beta_rate_service import BetaRateService
@@ -1,10 +1,10 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Address
 from easypost.requestor import (
     RequestMethod,
@@ -13,6 +13,22 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _address_create_params(
+    params: Dict[str, Any],
+    verify: Optional[bool] = None,
+    verify_strict: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Wrap the params of an Address with its verification flags, shared with the `AsyncAddressService`."""
+    wrapped_params: Dict[str, Any] = {"address": params}
+
+    if verify:
+        wrapped_params["verify"] = verify
+    if verify_strict:
+        wrapped_params["verify_strict"] = verify_strict
+
+    return wrapped_params
+
+
 class AddressService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -26,21 +42,20 @@ class AddressService(BaseService):
     ) -> Address:
         """Create an Address."""
         url = self._class_url(self._model_class)
-        wrapped_params = {self._snakecase_name(self._model_class): params}  # type: Dict[str, Any]
-
-        if verify:
-            wrapped_params["verify"] = verify
-        if verify_strict:
-            wrapped_params["verify_strict"] = verify_strict
+        wrapped_params = _address_create_params(params=params, verify=verify, verify_strict=verify_strict)
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of Addresses."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Address]:
+        """Iterate over all Addresses, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id) -> Address:
         """Retrieve an Address."""
         return self._retrieve_resource(self._model_class, id)
@@ -52,7 +67,7 @@ class AddressService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response["address"])
+        return self._convert_to_easypost_object(response=response["address"])
 
     def verify(self, id) -> Address:
         """Verify an already created Address."""
@@ -60,7 +75,7 @@ class AddressService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response["address"])
+        return self._convert_to_easypost_object(response=response["address"])
 
     def get_next_page(
         self,
@@ -0,0 +1,70 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Address
+from easypost.requestor import RequestMethod
+from easypost.services.address_service import _address_create_params
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncAddressService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Address.__name__
+
+    async def create(
+        self,
+        verify: Optional[bool] = None,
+        verify_strict: Optional[bool] = None,
+        **params,
+    ) -> Address:
+        """Create an Address."""
+        url = self._class_url(self._model_class)
+        wrapped_params = _address_create_params(params=params, verify=verify, verify_strict=verify_strict)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Addresses."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Address]:
+        """Iterate over all Addresses, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    async def retrieve(self, id) -> Address:
+        """Retrieve an Address."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def create_and_verify(self, **params) -> Address:
+        """Create and verify an Address in one call."""
+        url = f"{self._class_url('address')}/create_and_verify"
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response["address"])
+
+    async def verify(self, id) -> Address:
+        """Verify an already created Address."""
+        url = f"{self._instance_url('address', id)}/verify"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_to_easypost_object(response=response["address"])
+
+    async def get_next_page(
+        self,
+        addresses: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Addresses response."""
+        return await self._get_next_page_resources(self._model_class, addresses, page_size, optional_params)
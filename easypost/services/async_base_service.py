@@ -0,0 +1,299 @@
+import asyncio
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.constant import NO_MORE_PAGES_ERROR
+from easypost.errors import EndOfPaginationError
+from easypost.requestor import RequestMethod
+from easypost.services.base_service import (
+    BaseService,
+    _partition_date_range,
+)
+
+
+_END_OF_ITERATOR = object()
+
+
+def _prefetch(
+    iterators: List[AsyncIterator[Any]],
+    depth: int,
+    tasks: Optional[List["asyncio.Future[None]"]] = None,
+) -> AsyncIterator[Any]:
+    """Advance async iterators in background tasks, keeping up to `depth` items ahead of the consumer.
+
+    Items of different iterators are yielded in the order they are produced. Errors raised by an iterator are raised
+    to the consumer. The tasks are added to `tasks` and are cancelled when the consumer stops iterating early.
+    """
+    buffer: "asyncio.Queue[Tuple[Any, Optional[BaseException]]]" = asyncio.Queue(maxsize=depth)
+    tasks = tasks if tasks is not None else []
+
+    async def produce(iterator: AsyncIterator[Any]) -> None:
+        try:
+            async for item in iterator:
+                await buffer.put((item, None))
+        except Exception as error:
+            await buffer.put((None, error))
+        else:
+            await buffer.put((_END_OF_ITERATOR, None))
+
+    producers = [asyncio.ensure_future(produce(iterator)) for iterator in iterators]
+    tasks.extend(producers)
+
+    async def consume() -> AsyncIterator[Any]:
+        remaining = len(producers)
+        try:
+            while remaining:
+                item, error = await buffer.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_ITERATOR:
+                    remaining -= 1
+                    continue
+                yield item
+        except BaseException:
+            for task in tasks:  # type: ignore[union-attr]
+                task.cancel()
+            raise
+
+    return consume()
+
+
+async def _map_concurrently(
+    function: Callable[..., Awaitable[Any]],
+    arguments: Iterable[Tuple[Any, ...]],
+    concurrency: int,
+) -> AsyncIterator[Any]:
+    """Await a coroutine function with each tuple of arguments in tasks, yielding results as they complete.
+
+    No more than `concurrency` calls are in flight at once and `arguments` is consumed as calls complete.
+    """
+    pending: Set["asyncio.Future[Any]"] = set()
+
+    try:
+        for call_arguments in arguments:
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+            pending.add(asyncio.ensure_future(function(*call_arguments)))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class AsyncBaseService(BaseService):
+    """The base service that all async services inherit containing shared logic.
+
+    URL helpers are inherited from the `BaseService`, every method that makes a request is awaitable.
+    """
+
+    async def _create_resource(self, class_name: str, **params) -> Any:  # type: ignore[override]
+        """Create an EasyPost object via the EasyPost API."""
+        url = self._class_url(class_name)
+        wrapped_params = {self._snakecase_name(class_name): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def _all_resources(self, class_name: str, **params) -> Any:  # type: ignore[override]
+        """Retrieve a list of EasyPostObjects from the EasyPost API."""
+        url = self._class_url(class_name)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    def _iter_all_resources(  # type: ignore[override]
+        self,
+        class_name: str,
+        prefetch: int = 0,
+        **params,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every EasyPostObject of a collection, requesting each page from the EasyPost API as needed."""
+        url = self._class_url(class_name)
+
+        return self._iter_resources(url=url, collection_key=url[1:], params=params, prefetch=prefetch)
+
+    async def _iter_resources(  # type: ignore[override]
+        self,
+        url: str,
+        collection_key: str,
+        params: Dict[str, Any],
+        prefetch: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every EasyPostObject of the collection at a URL.
+
+        When `prefetch` is set, up to that many pages are requested in a background task while the current page
+        is being processed, otherwise each page is only requested once the previous one has been consumed.
+        """
+        pages = self._iter_pages(url=url, collection_key=collection_key, params=params)
+        if prefetch > 0:
+            pages = _prefetch(iterators=[pages], depth=prefetch)
+
+        async for page in pages:
+            for item in page:
+                yield self._convert_to_easypost_object(response=item)
+
+    def _iter_all_resources_in_parallel(  # type: ignore[override]
+        self,
+        class_name: str,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every EasyPostObject of a collection created in a date range, paging through sub-ranges of
+        the date range concurrently in background tasks.
+        """
+        url = self._class_url(class_name)
+        windows = _partition_date_range(start_datetime, end_datetime, partitions)
+        window_pages = [
+            self._iter_pages(
+                url=url,
+                collection_key=url[1:],
+                params={**params, "start_datetime": window_start, "end_datetime": window_end},
+            )
+            for window_start, window_end in windows
+        ]
+        # Objects created exactly at the boundary of two windows may be returned for both windows
+        boundaries = {window_start for window_start, _ in windows[:-1]}
+
+        return self._iter_windows(window_pages=window_pages, boundaries=boundaries, ordered=ordered, prefetch=prefetch)
+
+    async def _iter_windows(  # type: ignore[override]
+        self,
+        window_pages: List[AsyncIterator[List[Dict[str, Any]]]],
+        boundaries: Set[str],
+        ordered: bool,
+        prefetch: int,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every EasyPostObject of the pages of each window, skipping duplicates at their boundaries."""
+        boundary_ids: Set[str] = set()
+        tasks: List["asyncio.Future[None]"] = []
+
+        try:
+            if ordered:
+                prefetched_windows = [_prefetch([pages], depth=prefetch, tasks=tasks) for pages in window_pages]
+            else:
+                prefetched_windows = [_prefetch(window_pages, depth=prefetch * len(window_pages), tasks=tasks)]
+
+            for pages in prefetched_windows:
+                async for page in pages:
+                    for item in page:
+                        if item.get("created_at") in boundaries:
+                            if item["id"] in boundary_ids:
+                                continue
+                            boundary_ids.add(item["id"])
+
+                        yield self._convert_to_easypost_object(response=item)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _iter_pages(  # type: ignore[override]
+        self,
+        url: str,
+        collection_key: str,
+        params: Dict[str, Any],
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over the raw pages of the collection at a URL."""
+        params = dict(params)
+
+        while True:
+            response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+            collection_array = response.get(collection_key) or []
+
+            yield collection_array
+
+            if len(collection_array) == 0 or not response.get("has_more"):
+                return
+
+            params["before_id"] = collection_array[-1]["id"]
+
+    async def _retrieve_resource(  # type: ignore[override]
+        self,
+        class_name: str,
+        id: str,
+        cacheable: bool = False,
+    ) -> Any:
+        """Retrieve an object from the EasyPost API."""
+        url = self._instance_url(class_name, id)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, cacheable=cacheable)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def _update_resource(  # type: ignore[override]
+        self,
+        class_name: str,
+        id: str,
+        method: RequestMethod = RequestMethod.PATCH,
+        **params,
+    ) -> Any:
+        """Update an EasyPost object via the EasyPost API."""
+        url = self._instance_url(class_name, id)
+        wrapped_params = {self._snakecase_name(class_name): params}
+
+        response = await AsyncRequestor(self._client).request(method=method, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def _delete_resource(self, class_name: str, id: str) -> Any:  # type: ignore[override]
+        """Delete an EasyPost object via the EasyPost API."""
+        url = self._instance_url(class_name, id)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.DELETE, url=url)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def _get_next_page_resources(  # type: ignore[override]
+        self,
+        class_name: str,
+        collection: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve next page of EasyPostObjects via the EasyPost API."""
+        url = self._class_url(class_name)
+        collection_array = collection.get(url[1:])
+
+        if collection_array is None or len(collection_array) == 0 or not collection.get("has_more"):
+            raise EndOfPaginationError(NO_MORE_PAGES_ERROR)
+
+        params = {
+            "before_id": collection_array[-1].id,
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        response_array: List[Any] = response.get(url[1:])  # type: ignore
+        if response is None or len(response_array) == 0 or not response.get("has_more"):
+            raise EndOfPaginationError(NO_MORE_PAGES_ERROR)
+
+        return self._convert_to_easypost_object(response=response)
@@ -0,0 +1,102 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Batch
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncBatchService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Batch.__name__
+
+    async def create(self, **params) -> Batch:
+        """Create a Batch."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Batches."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Batch]:
+        """Iterate over all Batches, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    async def retrieve(self, id: str) -> Batch:
+        """Retrieve a Batch."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def create_and_buy(self, **params) -> Batch:
+        """Create and buy a Batch in a single call."""
+        url = f"{self._class_url(self._model_class)}/create_and_buy"
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=wrapped_params,
+            idempotent=True,
+            resumable=False,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def buy(self, id: str, **params) -> Batch:
+        """Buy a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=params,
+            idempotent=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def label(self, id: str, **params) -> Batch:
+        """Create a Batch label."""
+        url = f"{self._instance_url(self._model_class, id)}/label"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def remove_shipments(self, id: str, **params) -> Batch:
+        """Remove Shipments from a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/remove_shipments"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def add_shipments(self, id: str, **params) -> Batch:
+        """Add Shipments to a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/add_shipments"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def create_scan_form(self, id: str, **params) -> Batch:
+        """Create a ScanForm for a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/scan_form"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def get_next_page(
+        self,
+        batches: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Batch response."""
+        return await self._get_next_page_resources(self._model_class, batches, page_size, optional_params)
@@ -0,0 +1,43 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from warnings import warn
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncBetaCarrierMetadataService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+
+    async def retrieve_carrier_metadata(
+        self,
+        carriers: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get metadata for all carriers on the EasyPost platform."""
+        warn(
+            'This method is deprecated, use the "retrieve" function of "carrier_metadata" on the client instead.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        params = {
+            "carriers": ",".join(carriers) if carriers else None,
+            "types": ",".join(types) if types else None,
+        }
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/metadata",
+            params=params,
+            beta=True,
+            cacheable=True,
+        )
+
+        return self._convert_to_easypost_object(response=response.get("carriers", []))
@@ -0,0 +1,29 @@
+from typing import (
+    Any,
+    Dict,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Rate
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncBetaRateService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Rate.__name__
+
+    async def retrieve_stateless_rates(self, **params) -> Dict[str, Any]:
+        """Retrieves stateless rates by passing shipment data."""
+        url = self._class_url(self._model_class)
+        wrapped_params = {"shipment": params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=wrapped_params,
+            beta=True,
+        )
+
+        return self._convert_to_easypost_object(response=response.get("rates", None))
@@ -0,0 +1,66 @@
+from typing import (
+    Any,
+    Dict,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncBetaReferralCustomerService(AsyncBaseService):
+    async def add_payment_method(
+        self,
+        stripe_customer_id: str,
+        payment_method_reference: str,
+        priority: str = "primary",
+    ) -> Dict[str, Any]:
+        """Add a Stripe payment method to your EasyPost account.
+
+        This endpoint uses a user's personal Stripe account. The `stripe_customer_id`
+        and `payment_method_reference` IDs both come from Stripe. By adding these to
+        EasyPost, we will associate your Stripe payment method with either your primary
+        or secondary EasyPost payment method.
+        """
+        wrapped_params = {
+            "payment_method": {
+                "stripe_customer_id": stripe_customer_id,
+                "payment_method_reference": payment_method_reference,
+                "priority": priority,
+            }
+        }
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/referral_customers/payment_method",
+            params=wrapped_params,
+            beta=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def refund_by_amount(self, refund_amount: int) -> Dict[str, Any]:
+        """Refund a ReferralCustomer wallet by specifying an amount."""
+        wrapped_params = {"refund_amount": refund_amount}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/referral_customers/refunds",
+            params=wrapped_params,
+            beta=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def refund_by_payment_log(self, payment_log_id: str) -> Dict[str, Any]:
+        """Refund a ReferralCustomer wallet by specifying a payment log ID to completely refund."""
+        wrapped_params = {"payment_log_id": payment_log_id}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/referral_customers/refunds",
+            params=wrapped_params,
+            beta=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
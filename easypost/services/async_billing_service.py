@@ -0,0 +1,57 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.constant import NO_BILLING_ERROR
+from easypost.errors import InvalidObjectError
+from easypost.models import Billing
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+from easypost.services.billing_service import _select_payment_method
+
+
+class AsyncBillingService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Billing.__name__
+
+    async def fund_wallet(self, amount: str, priority: str = "primary") -> None:
+        """Fund your EasyPost wallet by charging your primary or secondary payment method on file."""
+        endpoint, payment_method_id = await self._get_payment_method_info(priority=priority)
+
+        url = f"{endpoint}/{payment_method_id}/charges"
+        wrapped_params = {"amount": amount}
+
+        await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+    async def delete_payment_method(self, priority: str) -> None:
+        """Delete a payment method."""
+        endpoint, payment_method_id = await self._get_payment_method_info(priority=priority)
+
+        url = f"{endpoint}/{payment_method_id}"
+
+        await AsyncRequestor(self._client).request(method=RequestMethod.DELETE, url=url)
+        self._invalidate_cached_responses(url="/payment_methods")
+
+    async def retrieve_payment_methods(self, **params) -> Dict[str, Any]:
+        """Retrieve payment methods."""
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/payment_methods",
+            params=params,
+            cacheable=True,
+        )
+
+        if response.get("id") is None:
+            raise InvalidObjectError(message=NO_BILLING_ERROR)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def _get_payment_method_info(self, priority: str = "primary") -> List[str]:
+        """Get payment method info (type of the payment method and ID of the payment method)"""
+        payment_methods = await self.retrieve_payment_methods()
+
+        return _select_payment_method(payment_methods=payment_methods, priority=priority)
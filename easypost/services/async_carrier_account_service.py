@@ -0,0 +1,52 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import CarrierAccount
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+from easypost.services.carrier_account_service import _carrier_account_creation_url
+
+
+class AsyncCarrierAccountService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CarrierAccount.__name__
+
+    async def create(self, **params) -> CarrierAccount:
+        """Create a CarrierAccount."""
+        url = _carrier_account_creation_url(params=params)
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of CarrierAccounts."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CarrierAccount:
+        """Retrieve a CarrierAccount."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def update(self, id: str, **params) -> CarrierAccount:
+        """Update a CarrierAccount."""
+        return await self._update_resource(self._model_class, id, **params)
+
+    async def delete(self, id: str) -> None:
+        """Delete a CarrierAccount."""
+        await self._delete_resource(self._model_class, id)
+
+    async def types(self) -> List[Dict[str, Any]]:
+        """Get the types of CarrierAccounts available to the User."""
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/carrier_types",
+            cacheable=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
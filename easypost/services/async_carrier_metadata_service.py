@@ -0,0 +1,35 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncCarrierMetadataService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+
+    async def retrieve(
+        self,
+        carriers: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get metadata for all carriers on the EasyPost platform or specify optional filters."""
+        params = {
+            "carriers": ",".join(carriers) if carriers else None,
+            "types": ",".join(types) if types else None,
+        }
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/metadata/carriers",
+            params=params,
+            cacheable=True,
+        )
+
+        return self._convert_to_easypost_object(response=response.get("carriers", []))
@@ -0,0 +1,16 @@
+from easypost.models import CustomsInfo
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncCustomsInfoService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CustomsInfo.__name__
+
+    async def create(self, **params) -> CustomsInfo:
+        """Create a CustomsInfo."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CustomsInfo:
+        """Retrieve a CustomsInfo."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -0,0 +1,16 @@
+from easypost.models import CustomsItem
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncCustomsItemService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CustomsItem.__name__
+
+    async def create(self, **params) -> CustomsItem:
+        """Create a CustomsItem."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CustomsItem:
+        """Retrieve a CustomsItem."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -0,0 +1,48 @@
+from typing import (
+    Any,
+    Dict,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import (
+    Address,
+    EndShipper,
+)
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncEndShipperService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Address.__name__
+        self._service_class = EndShipper.__name__
+
+    async def create(self, **params) -> Address:
+        """Create an EndShipper."""
+        url = self._class_url(self._service_class)
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of EndShippers."""
+        return await self._all_resources(self._service_class, **params)
+
+    async def retrieve(self, id: str) -> Address:
+        """Retrieve an EndShipper."""
+        return await self._retrieve_resource(self._service_class, id)
+
+    async def update(self, id: str, **params) -> Address:
+        """Update an EndShipper object.
+
+        This function requires all parameters to be present for an EndShipper.
+        """
+        url = self._instance_url(self._service_class, id)
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.PUT, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
@@ -0,0 +1,87 @@
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+    Union,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import (
+    Event,
+    Payload,
+)
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncEventService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Event.__name__
+
+    async def create(self, **params) -> Event:
+        """Create an Event."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Events."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Event]:
+        """Iterate over all Events, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> AsyncIterator[Event]:
+        """Iterate over all Events created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Events are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
+
+    async def retrieve(self, id: str) -> Event:
+        """Retrieve an Event."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def retrieve_all_payloads(self, event_id: str, **params) -> Dict[str, Any]:
+        """Retrieve a list of Payloads for an Event."""
+        url = f"{self._class_url(self._model_class)}/{event_id}/payloads"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def retrieve_payload(self, event_id: str, payload_id: str, **params) -> Payload:
+        """Retrieve a Payload of an Event."""
+        url = f"{self._class_url(self._model_class)}/{event_id}/payloads/{payload_id}"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def get_next_page(
+        self,
+        events: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Events response."""
+        return await self._get_next_page_resources(self._model_class, events, page_size, optional_params)
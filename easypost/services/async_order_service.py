@@ -0,0 +1,54 @@
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Order
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncOrderService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Order.__name__
+
+    async def create(self, **params) -> Order:
+        """Create an Order."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> Order:
+        """Retrieve an Order."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        insurances: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Order response."""
+        return await self._get_next_page_resources(self._model_class, insurances, page_size, optional_params)
+
+    async def get_rates(self, id: str) -> Order:
+        """Get rates for an Order."""
+        url = f"{self._instance_url(self._model_class, id)}/rates"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def buy(self, id: str, **params) -> Order:
+        """Buy an Order."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=params,
+            idempotent=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
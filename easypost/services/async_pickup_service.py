@@ -0,0 +1,63 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Pickup
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncPickupService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Pickup.__name__
+
+    async def create(self, **params) -> Pickup:
+        """Create a Pickup."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Pickups."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Pickup]:
+        """Iterate over all Pickups, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    async def retrieve(self, id: str) -> Pickup:
+        """Retrieve a Pickup."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        pickups: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Pickup response."""
+        return await self._get_next_page_resources(self._model_class, pickups, page_size, optional_params)
+
+    async def buy(self, id: str, **params) -> Pickup:
+        """Buy a Pickup."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=params,
+            idempotent=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def cancel(self, id: str, **params) -> Pickup:
+        """Cancel a Pickup."""
+        url = f"{self._instance_url(self._model_class, id)}/cancel"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
@@ -0,0 +1,12 @@
+from easypost.models import Rate
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncRateService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Rate.__name__
+
+    async def retrieve(self, id: str) -> Rate:
+        """Retrieve a Rate."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -0,0 +1,198 @@
+import base64
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+from urllib.parse import urlencode
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.constant import (
+    SEND_STRIPE_DETAILS_ERROR,
+    TIMEOUT,
+)
+from easypost.errors import ExternalApiError
+from easypost.models import User
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+from easypost.services.referral_customer_service import _referral_client
+
+
+class AsyncReferralCustomerService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = User.__name__
+
+    async def create(self, **params) -> User:
+        """Create a referral customer.
+
+        This function requires the Partner User's API key.
+        """
+        wrapped_params = {"user": params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/referral_customers",
+            params=wrapped_params,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def update_email(self, id: str, email: str) -> None:
+        """Update a referral customer.
+
+        This function requires the Partner User's API key.
+        """
+        url = f"/referral_customers/{id}"
+        wrapped_params = {
+            "user": {
+                "email": email,
+            }
+        }
+
+        await AsyncRequestor(self._client).request(
+            method=RequestMethod.PUT,
+            url=url,
+            params=wrapped_params,
+        )
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of referral customers.
+
+        This function requires the Partner User's API key.
+        """
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/referral_customers",
+            params=params,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all referral customers, requesting each page as needed.
+
+        This function requires the Partner User's API key.
+        """
+        return self._iter_resources(
+            url="/referral_customers",
+            collection_key="referral_customers",
+            params=params,
+            prefetch=prefetch,
+        )
+
+    async def get_next_page(
+        self,
+        referral_customers: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve next page of referral customers."""
+        return await self._get_next_page_resources("referral_customers", referral_customers, page_size, optional_params)
+
+    async def add_credit_card(
+        self,
+        referral_api_key: str,
+        number: str,
+        expiration_month: int,
+        expiration_year: int,
+        cvc: str,
+        priority: str = "primary",
+    ) -> Dict[str, Any]:
+        """Add credit card to a referral customer.
+
+        This function requires the ReferralCustomer User's API key.
+        """
+        easypost_stripe_api_key = await self._retrieve_easypost_stripe_api_key()
+
+        try:
+            stripe_token = await self._create_stripe_token(
+                number,
+                expiration_month,
+                expiration_year,
+                cvc,
+                easypost_stripe_api_key,
+            )
+        except Exception:
+            raise ExternalApiError(message=SEND_STRIPE_DETAILS_ERROR)
+
+        response = await self._create_easypost_credit_card(
+            referral_api_key,
+            stripe_token.get("id", ""),
+            priority=priority,
+        )
+
+        return self._convert_to_easypost_object(response)
+
+    async def _retrieve_easypost_stripe_api_key(self) -> str:
+        """Retrieve EasyPost's Stripe public API key."""
+        public_key = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/partners/stripe_public_key",
+        )
+
+        return public_key.get("public_key", "")
+
+    async def _create_stripe_token(
+        self,
+        number: str,
+        expiration_month: int,
+        expiration_year: int,
+        cvc: str,
+        easypost_stripe_key: str,
+    ) -> Dict[str, Any]:
+        """Get credit card token from Stripe."""
+        headers = {
+            # This Stripe endpoint only accepts URL form encoded bodies
+            "Content-type": "application/x-www-form-urlencoded",
+        }
+
+        credit_card_dict = {
+            "card": {
+                "number": number,
+                "exp_month": expiration_month,
+                "exp_year": expiration_year,
+                "cvc": cvc,
+            }
+        }
+
+        form_encoded_params = AsyncRequestor.form_encode_params(credit_card_dict)
+        url = "https://api.stripe.com/v1/tokens"
+
+        basic_auth = base64.b64encode(f"{easypost_stripe_key}:".encode()).decode()
+        headers["Authorization"] = f"Basic {basic_auth}"
+
+        stripe_response = await self._client.transport.request(
+            method=RequestMethod.POST,
+            url=f"{url}?{urlencode(form_encoded_params)}",
+            headers=headers,
+            params=None,
+            body=None,
+            timeout=TIMEOUT,
+        )
+
+        return json.loads(stripe_response.body)
+
+    async def _create_easypost_credit_card(
+        self,
+        referral_api_key: str,
+        stripe_object_id: str,
+        priority: str = "primary",
+    ) -> Dict[str, Any]:
+        """Submit Stripe credit card token to EasyPost."""
+        params = {
+            "credit_card": {
+                "stripe_object_id": stripe_object_id,
+                "priority": priority,
+            }
+        }
+
+        response = await AsyncRequestor(_referral_client(self._client, referral_api_key)).request(
+            method=RequestMethod.POST,
+            params=params,
+            url="/credit_cards",
+        )
+
+        return response
@@ -0,0 +1,41 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+)
+
+from easypost.models import Refund
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncRefundService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Refund.__name__
+
+    async def create(self, **params) -> Refund:
+        """Create a Shipment Refund."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> List[Refund]:
+        """Retrieve a list of Shipment Refunds."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Refund]:
+        """Iterate over all Refunds, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    async def retrieve(self, id: str) -> Refund:
+        """Retrieve a Shipment Refund."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        refunds: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Refund response."""
+        return await self._get_next_page_resources(self._model_class, refunds, page_size, optional_params)
@@ -0,0 +1,62 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Report
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+from easypost.services.report_service import _report_type_url
+
+
+class AsyncReportService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Report.__name__
+
+    async def create(self, **params) -> Report:
+        """Create a Report."""
+        url = _report_type_url(report_type=params.pop("type"))
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Reports."""
+        refund_type = params.pop("type")
+        url = _report_type_url(report_type=refund_type)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+        response["type"] = refund_type  # Needed for retrieving the next page
+
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Report]:
+        """Iterate over all Reports, requesting each page as needed."""
+        url = _report_type_url(report_type=params.pop("type", None))
+
+        return self._iter_resources(url=url, collection_key="reports", params=params, prefetch=prefetch)
+
+    async def retrieve(self, id: str) -> Report:
+        """Retrieve a Report."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        reports: Dict[str, Any],
+        page_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Report response."""
+        url = _report_type_url(report_type=reports.get("type"))
+        params = {
+            "before_id": reports["reports"][-1].id,
+            "page_size": page_size,
+        }
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
@@ -0,0 +1,40 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+)
+
+from easypost.models import ScanForm
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncScanFormService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = ScanForm.__name__
+
+    async def create(self, **params) -> ScanForm:
+        """Create a ScanForm."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of ScanForms."""
+        return await self._all_resources(self._model_class, **params)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[ScanForm]:
+        """Iterate over all ScanForms, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    async def retrieve(self, id: str) -> ScanForm:
+        """Retrieve a ScanForm."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        scan_forms: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list ScanForm response."""
+        return await self._get_next_page_resources(self._model_class, scan_forms, page_size, optional_params)
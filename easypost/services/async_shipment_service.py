@@ -0,0 +1,225 @@
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import (
+    Rate,
+    Shipment,
+)
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import (
+    AsyncBaseService,
+    _map_concurrently,
+)
+from easypost.services.shipment_service import (
+    BulkShipmentResult,
+    _buy_params,
+    _form_params,
+)
+from easypost.util import (
+    get_lowest_object_rate,
+    get_lowest_smart_rate,
+)
+
+
+class AsyncShipmentService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Shipment.__name__
+
+    async def create(self, with_carbon_offset: Optional[bool] = False, **params) -> Shipment:
+        """Create a Shipment."""
+        url = self._class_url(self._model_class)
+        wrapped_params = {
+            self._snakecase_name(self._model_class): params,
+            "carbon_offset": with_carbon_offset,
+        }
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Shipments."""
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url="/shipments", params=params)
+        response["include_children"] = params.get("include_children")
+        response["purchased"] = params.get("purchased")
+
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Shipment]:
+        """Iterate over all Shipments, requesting each page as needed.
+
+        Params such as `include_children` and `purchased` are sent with the request of every page.
+        """
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> AsyncIterator[Shipment]:
+        """Iterate over all Shipments created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Shipments are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
+
+    async def retrieve(self, id: str) -> Shipment:
+        """Retrieve a Shipment."""
+        return await self._retrieve_resource(self._model_class, id, cacheable=True)
+
+    async def get_next_page(
+        self,
+        shipments: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Get next page of shipment collection."""
+        optional_params = {
+            "include_children": shipments.get("include_children"),
+            "purchased": shipments.get("purchased"),
+        }
+
+        return await self._get_next_page_resources(self._model_class, shipments, page_size, optional_params)
+
+    async def regenerate_rates(self, id: str, with_carbon_offset: Optional[bool] = False) -> Shipment:
+        """Regenerate Rates for a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/rerate"
+        wrapped_params = {"carbon_offset": with_carbon_offset}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def get_smart_rates(self, id: str) -> List[Rate]:
+        """Get SmartRates for a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/smartrate"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_to_easypost_object(response=response.get("result", []))
+
+    async def buy(
+        self,
+        id: str,
+        with_carbon_offset: Optional[bool] = False,
+        end_shipper_id: Optional[str] = None,
+        **params,
+    ) -> Shipment:
+        """Buy a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+        params = _buy_params(params=params, with_carbon_offset=with_carbon_offset, end_shipper_id=end_shipper_id)
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=params,
+            idempotent=True,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    def bulk_create_and_buy(
+        self,
+        shipments: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        select_rate: Optional[Callable[[Shipment], Rate]] = None,
+        carriers: Optional[List[str]] = None,
+        services: Optional[List[str]] = None,
+        **buy_params,
+    ) -> AsyncIterator[BulkShipmentResult]:
+        """Create, rate, and buy many Shipments, with up to `concurrency` Shipments in progress at once.
+
+        Each item of `shipments` holds the params of a Shipment to create. The rate to buy is chosen by `select_rate`,
+        or is the lowest rate of the Shipment (optionally filtered by `carriers` and `services`). `buy_params` are
+        sent with every purchase. A result is yielded for each Shipment as soon as it completes, in completion order,
+        and errors are reported on their result instead of stopping the run.
+        """
+
+        async def create_and_buy(index: int, params: Dict[str, Any]) -> BulkShipmentResult:
+            result = BulkShipmentResult(index=index, params=params)
+            try:
+                result.shipment = await self.create(**params)
+                if select_rate:
+                    rate = select_rate(result.shipment)
+                else:
+                    rate = get_lowest_object_rate(result.shipment, carriers, services)
+                result.shipment = await self.buy(result.shipment.id, rate=rate, **buy_params)
+            except Exception as error:
+                result.error = error
+
+            return result
+
+        return _map_concurrently(create_and_buy, enumerate(shipments), concurrency)
+
+    async def refund(self, id: str, **params) -> Shipment:
+        """Refund a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/refund"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def insure(self, id: str, **params) -> Shipment:
+        """Insure a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/insure"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def label(self, id: str, **params) -> Shipment:
+        """Convert the label format of a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/label"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def lowest_smart_rate(self, id: str, delivery_days: int, delivery_accuracy: str) -> Rate:
+        """Get the lowest SmartRate of a Shipment."""
+        smartrates = await self.get_smart_rates(id)
+        lowest_smart_rate = get_lowest_smart_rate(smartrates, delivery_days, delivery_accuracy.lower())
+
+        return lowest_smart_rate
+
+    async def generate_form(self, id: str, form_type: str, form_options: Optional[Dict[str, Any]] = {}) -> Shipment:
+        """Generate a form for a Shipment."""
+        wrapped_params = _form_params(form_type=form_type, form_options=form_options)
+        url = f"{self._instance_url(self._model_class, id)}/forms"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def retrieve_estimated_delivery_date(self, id: str, planned_ship_date: str) -> List[Dict[str, Any]]:
+        """Retrieves the estimated delivery date of each Rate via SmartRate."""
+        url = f"{self._instance_url(self._model_class, id)}/smartrate/delivery_date"
+        wrapped_params = {"planned_ship_date": planned_ship_date}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=wrapped_params)
+
+        return self._convert_to_easypost_object(response=response.get("rates", []))
@@ -0,0 +1,90 @@
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import Tracker
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncTrackerService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Tracker.__name__
+
+    async def create(self, **params) -> Tracker:
+        """Create a Tracker."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Trackers."""
+        url = self._class_url(self._model_class)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+        response["tracking_code"] = params.get("tracking_code")
+        response["carrier"] = params.get("carrier")
+
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> AsyncIterator[Tracker]:
+        """Iterate over all Trackers, requesting each page as needed.
+
+        Params such as `tracking_code` and `carrier` are sent with the request of every page.
+        """
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> AsyncIterator[Tracker]:
+        """Iterate over all Trackers created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Trackers are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
+
+    async def retrieve(self, id: str) -> Tracker:
+        """Retrieve a Tracker."""
+        return await self._retrieve_resource(self._model_class, id, cacheable=True)
+
+    async def get_next_page(
+        self,
+        trackers: Dict[str, Any],
+        page_size: int,
+        optional_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve the next page of the list Tracker response."""
+        optional_params = {
+            "tracking_code": trackers.get("tracking_code"),
+            "carrier": trackers.get("carrier"),
+        }
+
+        return await self._get_next_page_resources(self._model_class, trackers, page_size, optional_params)
+
+    async def create_list(self, trackers: List[Dict[str, Any]]) -> None:
+        """Create a list of Trackers."""
+        url = f"{self._class_url(self._model_class)}/create_list"
+        wrapped_params = {"trackers": trackers}
+
+        await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
@@ -0,0 +1,96 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from easypost.async_requestor import AsyncRequestor
+from easypost.models import (
+    ApiKey,
+    User,
+)
+from easypost.requestor import RequestMethod
+from easypost.services.async_base_service import AsyncBaseService
+from easypost.services.user_service import _select_api_keys
+
+
+class AsyncUserService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = User.__name__
+
+    async def create(self, **params) -> User:
+        """Create a User."""
+        user = await self._create_resource(self._model_class, **params)
+        # Child users are listed with their API keys
+        self._invalidate_cached_responses(url="/api_keys")
+
+        return user
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Users."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: Optional[str] = None) -> User:
+        """Retrieve a User.
+
+        If no id is passed, retrieve the authenticated User.
+        """
+        if id:
+            url = self._instance_url(self._model_class, id)
+        else:
+            url = self._class_url(self._model_class)
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url=url,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def update(self, id: str, **params) -> User:
+        """Update a User."""
+        return await self._update_resource(self._model_class, id, **params)
+
+    async def delete(self, id: str) -> None:
+        """Delete a User."""
+        await self._delete_resource(self._model_class, id)
+        self._invalidate_cached_responses(url="/api_keys")
+
+    async def retrieve_me(self) -> User:
+        """Retrieve the authenticated User."""
+        url = self._class_url(self._model_class)
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url=url,
+        )
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def all_api_keys(self) -> Dict[str, Any]:
+        """Retrieve a list of all API keys."""
+        url = "/api_keys"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, cacheable=True)
+
+        return self._convert_to_easypost_object(response=response)
+
+    async def api_keys(self, id: str) -> List[ApiKey]:
+        """Retrieve a list of API keys (works for the authenticated User or a child User)."""
+        api_keys = await self.all_api_keys()
+
+        return _select_api_keys(api_keys=api_keys, id=id)
+
+    async def update_brand(self, id: str, **params) -> User:
+        """Update a User's Brand."""
+        url = self._instance_url(self._model_class, id) + "/brand"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.PATCH,
+            url=url,
+            params=params,
+        )
+
+        return self._convert_to_easypost_object(response=response)
@@ -0,0 +1,33 @@
+from typing import (
+    Any,
+    Dict,
+)
+
+from easypost.models import Webhook
+from easypost.services.async_base_service import AsyncBaseService
+
+
+class AsyncWebhookService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Webhook.__name__
+
+    async def create(self, **params) -> Webhook:
+        """Create a Webhook."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> Dict[str, Any]:
+        """Retrieve a list of Webhooks."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> Webhook:
+        """Retrieve a Webhook."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def update(self, id: str, **params) -> Webhook:
+        """Update a Webhook."""
+        return await self._update_resource(self._model_class, id, **params)
+
+    async def delete(self, id: str) -> None:
+        """Delete a Webhook."""
+        await self._delete_resource(self._model_class, id)
@@ -1,26 +1,193 @@
+import contextvars
+import datetime
+import itertools
+import queue
 import re
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
+    Union,
 )
 
-from easypost.constant import NO_MORE_PAGES_ERROR
-from easypost.easypost_object import convert_to_easypost_object
-from easypost.errors import EndOfPaginationError
+from easypost.constant import (
+    INVALID_DATE_RANGE_ERROR,
+    INVALID_PARTITIONS_ERROR,
+    NO_MORE_PAGES_ERROR,
+)
+from easypost.easypost_object import (
+    ConversionMode,
+    convert_to_compact_easypost_object,
+    convert_to_easypost_object,
+)
+from easypost.errors import (
+    EndOfPaginationError,
+    InvalidParameterError,
+)
 from easypost.requestor import (
     RequestMethod,
     Requestor,
 )
 
 
+_END_OF_ITERATOR = object()
+
+
+def _prefetch(
+    iterators: List[Iterator[Any]],
+    depth: int,
+    stopped: Optional[threading.Event] = None,
+) -> Iterator[Any]:
+    """Advance iterators in background threads, keeping up to `depth` items ahead of the consumer.
+
+    Items of different iterators are yielded in the order they are produced. Errors raised by an iterator are raised
+    to the consumer. The threads stop once `stopped` is set, which happens when the consumer stops iterating early.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=depth)
+    stopped = stopped or threading.Event()
+
+    def put(item: Any, error: Optional[BaseException] = None) -> bool:
+        while not stopped.is_set():  # type: ignore[union-attr]
+            try:
+                buffer.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(iterator: Iterator[Any]) -> None:
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as error:
+            put(None, error)
+        else:
+            put(_END_OF_ITERATOR)
+
+    for iterator in iterators:
+        # Threads run in a copy of the current context so request options apply to the requests they make
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run,
+            args=(produce, iterator),
+            name="easypost-prefetch",
+            daemon=True,
+        ).start()
+
+    def consume() -> Iterator[Any]:
+        remaining = len(iterators)
+        try:
+            while remaining:
+                item, error = buffer.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_ITERATOR:
+                    remaining -= 1
+                    continue
+                yield item
+        except BaseException:
+            stopped.set()  # type: ignore[union-attr]
+            raise
+
+    return consume()
+
+
+def _map_concurrently(
+    function: Callable[..., Any],
+    arguments: Iterable[Tuple[Any, ...]],
+    concurrency: int,
+) -> Iterator[Any]:
+    """Call a function with each tuple of arguments on a thread pool, yielding results as they complete.
+
+    No more than `concurrency` calls are in flight at once and `arguments` is consumed as calls complete, so it
+    may be a lazy iterable of any length.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: Set["Future[Any]"] = set()
+
+        for call_arguments in arguments:
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+            # Calls run in a copy of the current context so request options apply to the requests they make
+            pending.add(executor.submit(contextvars.copy_context().run, function, *call_arguments))
+
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def _parse_datetime(value: Union[datetime.datetime, str]) -> datetime.datetime:
+    """Parse a datetime or an ISO 8601 string, naive datetimes are assumed to be UTC."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+
+    return value.astimezone(datetime.timezone.utc)
+
+
+def _partition_date_range(
+    start_datetime: Union[datetime.datetime, str],
+    end_datetime: Union[datetime.datetime, str],
+    partitions: int,
+) -> List[Tuple[str, str]]:
+    """Split a date range into contiguous windows, newest first, formatted like the `created_at` of API objects."""
+    start = _parse_datetime(start_datetime).replace(microsecond=0)
+    end = _parse_datetime(end_datetime)
+    if end.microsecond:
+        end = end.replace(microsecond=0) + datetime.timedelta(seconds=1)
+
+    if partitions < 1:
+        raise InvalidParameterError(INVALID_PARTITIONS_ERROR)
+    if start >= end:
+        raise InvalidParameterError(INVALID_DATE_RANGE_ERROR)
+
+    # Boundaries are truncated to the second, the precision of timestamps in the API
+    step = (end - start) / partitions
+    boundaries = sorted({(start + step * i).replace(microsecond=0) for i in range(partitions)} | {end})
+    boundary_strings = [boundary.strftime("%Y-%m-%dT%H:%M:%SZ") for boundary in boundaries]
+
+    return list(reversed(list(zip(boundary_strings, boundary_strings[1:]))))
+
+
 class BaseService:
     """The base service that all other services inherit containing shared logic."""
 
     def __init__(self, client):
         self._client = client
 
+    def _convert_to_easypost_object(self, response: Any) -> Any:
+        """Convert a response into objects according to the conversion mode of the client."""
+        conversion_mode = self._client.conversion_mode
+
+        if conversion_mode == ConversionMode.COMPACT:
+            return convert_to_compact_easypost_object(response=response)
+
+        return convert_to_easypost_object(response=response, lazy=conversion_mode == ConversionMode.LAZY)
+
+    def _invalidate_cached_responses(self, url: str) -> None:
+        """Remove the cached responses of the URLs starting with `url` after a request changed their data."""
+        if self._client.response_cache:
+            self._client.response_cache.invalidate(url=url)
+
     def _snakecase_name(self, class_name: str) -> str:
         """Return the class name as snake_case."""
         return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
@@ -44,7 +211,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def _all_resources(self, class_name: str, **params) -> Any:
         """Retrieve a list of EasyPostObjects from the EasyPost API."""
@@ -52,15 +219,121 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def _iter_all_resources(self, class_name: str, prefetch: int = 0, **params) -> Iterator[Any]:
+        """Iterate over every EasyPostObject of a collection, requesting each page from the EasyPost API as needed."""
+        url = self._class_url(class_name)
+
+        return self._iter_resources(url=url, collection_key=url[1:], params=params, prefetch=prefetch)
+
+    def _iter_resources(
+        self,
+        url: str,
+        collection_key: str,
+        params: Dict[str, Any],
+        prefetch: int = 0,
+    ) -> Iterator[Any]:
+        """Iterate over every EasyPostObject of the collection at a URL.
+
+        When `prefetch` is set, up to that many pages are requested in a background thread while the current page
+        is being processed, otherwise each page is only requested once the previous one has been consumed.
+        """
+        pages = self._iter_pages(url=url, collection_key=collection_key, params=params)
+        if prefetch > 0:
+            pages = _prefetch(iterators=[pages], depth=prefetch)
+
+        for page in pages:
+            for item in page:
+                yield self._convert_to_easypost_object(response=item)
+
+    def _iter_all_resources_in_parallel(
+        self,
+        class_name: str,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> Iterator[Any]:
+        """Iterate over every EasyPostObject of a collection created in a date range, paging through sub-ranges of
+        the date range concurrently.
+
+        The date range is split into `partitions` windows, each paged through in its own thread with up to `prefetch`
+        pages buffered. When `ordered`, objects are yielded newest first like `_iter_resources` does, otherwise
+        they are yielded as soon as their page is received.
+        """
+        url = self._class_url(class_name)
+        windows = _partition_date_range(start_datetime, end_datetime, partitions)
+        window_pages = [
+            self._iter_pages(
+                url=url,
+                collection_key=url[1:],
+                params={**params, "start_datetime": window_start, "end_datetime": window_end},
+            )
+            for window_start, window_end in windows
+        ]
+        # Objects created exactly at the boundary of two windows may be returned for both windows
+        boundaries = {window_start for window_start, _ in windows[:-1]}
+
+        return self._iter_windows(window_pages=window_pages, boundaries=boundaries, ordered=ordered, prefetch=prefetch)
+
+    def _iter_windows(
+        self,
+        window_pages: List[Iterator[List[Dict[str, Any]]]],
+        boundaries: Set[str],
+        ordered: bool,
+        prefetch: int,
+    ) -> Iterator[Any]:
+        """Iterate over every EasyPostObject of the pages of each window, skipping duplicates at their boundaries."""
+        boundary_ids: Set[str] = set()
+        stopped = threading.Event()
+
+        try:
+            if ordered:
+                prefetched_windows = [_prefetch([pages], depth=prefetch, stopped=stopped) for pages in window_pages]
+                pages: Iterator[List[Dict[str, Any]]] = itertools.chain.from_iterable(prefetched_windows)
+            else:
+                pages = _prefetch(window_pages, depth=prefetch * len(window_pages), stopped=stopped)
+
+            for page in pages:
+                for item in page:
+                    if item.get("created_at") in boundaries:
+                        if item["id"] in boundary_ids:
+                            continue
+                        boundary_ids.add(item["id"])
+
+                    yield self._convert_to_easypost_object(response=item)
+        finally:
+            stopped.set()
+
+    def _iter_pages(self, url: str, collection_key: str, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over the raw pages of the collection at a URL.
+
+        Every page is requested with the same params, the `before_id` of the next page is the last ID of the current
+        page. Iteration stops after the page where `has_more` is false.
+        """
+        params = dict(params)
+
+        while True:
+            response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+            collection_array = response.get(collection_key) or []
+
+            yield collection_array
+
+            if len(collection_array) == 0 or not response.get("has_more"):
+                return
+
+            params["before_id"] = collection_array[-1]["id"]
 
-    def _retrieve_resource(self, class_name: str, id: str) -> Any:
+    def _retrieve_resource(self, class_name: str, id: str, cacheable: bool = False) -> Any:
         """Retrieve an object from the EasyPost API."""
         url = self._instance_url(class_name, id)
 
-        response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
+        response = Requestor(self._client).request(method=RequestMethod.GET, url=url, cacheable=cacheable)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def _update_resource(self, class_name: str, id: str, method: RequestMethod = RequestMethod.PATCH, **params) -> Any:
         """Update an EasyPost object via the EasyPost API."""
@@ -69,7 +342,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=method, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def _delete_resource(self, class_name: str, id: str) -> Any:
         """Delete an EasyPost object via the EasyPost API."""
@@ -77,7 +350,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.DELETE, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def _get_next_page_resources(
         self,
@@ -107,4 +380,4 @@ class BaseService:
         if response is None or len(response_array) == 0 or not response.get("has_more"):
             raise EndOfPaginationError(NO_MORE_PAGES_ERROR)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
@@ -1,10 +1,10 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Batch
 from easypost.requestor import (
     RequestMethod,
@@ -26,6 +26,10 @@ class BatchService(BaseService):
         """Retrieve a list of Batches."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Batch]:
+        """Iterate over all Batches, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id: str) -> Batch:
         """Retrieve a Batch."""
         return self._retrieve_resource(self._model_class, id)
@@ -35,17 +39,23 @@ class BatchService(BaseService):
         url = f"{self._class_url(self._model_class)}/create_and_buy"
         wrapped_params = {self._snakecase_name(self._model_class): params}
 
-        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+        response = Requestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=wrapped_params,
+            idempotent=True,
+            resumable=False,
+        )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def buy(self, id: str, **params) -> Batch:
         """Buy a Batch."""
         url = f"{self._instance_url(self._model_class, id)}/buy"
 
-        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params, idempotent=True)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def label(self, id: str, **params) -> Batch:
         """Create a Batch label."""
@@ -53,7 +63,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def remove_shipments(self, id: str, **params) -> Batch:
         """Remove Shipments from a Batch."""
@@ -61,7 +71,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def add_shipments(self, id: str, **params) -> Batch:
         """Add Shipments to a Batch."""
@@ -69,7 +79,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def create_scan_form(self, id: str, **params) -> Batch:
         """Create a ScanForm for a Batch."""
@@ -77,7 +87,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def get_next_page(
         self,
@@ -6,7 +6,6 @@ from typing import (
 )
 from warnings import warn
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.requestor import (
     RequestMethod,
     Requestor,
@@ -40,6 +39,7 @@ class BetaCarrierMetadataService(BaseService):
             url="/metadata",
             params=params,
             beta=True,
+            cacheable=True,
         )
 
-        return convert_to_easypost_object(response=response.get("carriers", []))
+        return self._convert_to_easypost_object(response=response.get("carriers", []))
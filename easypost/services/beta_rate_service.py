@@ -3,7 +3,6 @@ from typing import (
     Dict,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Rate
 from easypost.requestor import (
     RequestMethod,
@@ -29,4 +28,4 @@ class BetaRateService(BaseService):
             beta=True,
         )
 
-        return convert_to_easypost_object(response=response.get("rates", None))
+        return self._convert_to_easypost_object(response=response.get("rates", None))
@@ -3,7 +3,6 @@ from typing import (
     Dict,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.requestor import (
     RequestMethod,
     Requestor,
@@ -40,7 +39,7 @@ class BetaReferralCustomerService(BaseService):
             beta=True,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def refund_by_amount(self, refund_amount: int) -> Dict[str, Any]:
         """Refund a ReferralCustomer wallet by specifying an amount."""
@@ -53,7 +52,7 @@ class BetaReferralCustomerService(BaseService):
             beta=True,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def refund_by_payment_log(self, payment_log_id: str) -> Dict[str, Any]:
         """Refund a ReferralCustomer wallet by specifying a payment log ID to completely refund."""
@@ -66,4 +65,4 @@ class BetaReferralCustomerService(BaseService):
             beta=True,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
@@ -8,7 +8,6 @@ from easypost.constant import (
     INVALID_PAYMENT_METHOD_ERROR,
     NO_BILLING_ERROR,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import InvalidObjectError
 from easypost.models import Billing
 from easypost.requestor import (
@@ -18,6 +17,29 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _select_payment_method(payment_methods: Dict[str, Any], priority: str = "primary") -> List[str]:
+    """Select the endpoint and ID of the payment method of a priority, shared with the `AsyncBillingService`."""
+    payment_method_map = {
+        "primary": "primary_payment_method",
+        "secondary": "secondary_payment_method",
+    }
+
+    payment_method_to_use = payment_method_map.get(priority)
+
+    if payment_method_to_use and payment_methods[payment_method_to_use]:
+        payment_method_id = payment_methods[payment_method_to_use]["id"]
+        if payment_method_id.startswith("card_"):
+            endpoint = "/credit_cards"
+        elif payment_method_id.startswith("bank_"):
+            endpoint = "/bank_accounts"
+        else:
+            raise InvalidObjectError(message=INVALID_PAYMENT_METHOD_ERROR)
+    else:
+        raise InvalidObjectError(message=INVALID_PAYMENT_METHOD_ERROR)
+
+    return [endpoint, payment_method_id]
+
+
 class BillingService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -39,6 +61,7 @@ class BillingService(BaseService):
         url = f"{endpoint}/{payment_method_id}"
 
         Requestor(self._client).request(method=RequestMethod.DELETE, url=url)
+        self._invalidate_cached_responses(url="/payment_methods")
 
     def retrieve_payment_methods(self, **params) -> Dict[str, Any]:
         """Retrieve payment methods."""
@@ -46,33 +69,16 @@ class BillingService(BaseService):
             method=RequestMethod.GET,
             url="/payment_methods",
             params=params,
+            cacheable=True,
         )
 
         if response.get("id") is None:
             raise InvalidObjectError(message=NO_BILLING_ERROR)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def _get_payment_method_info(self, priority: str = "primary") -> List[str]:
         """Get payment method info (type of the payment method and ID of the payment method)"""
         payment_methods = self.retrieve_payment_methods()
 
-        payment_method_map = {
-            "primary": "primary_payment_method",
-            "secondary": "secondary_payment_method",
-        }
-
-        payment_method_to_use = payment_method_map.get(priority)
-
-        if payment_method_to_use and payment_methods[payment_method_to_use]:
-            payment_method_id = payment_methods[payment_method_to_use]["id"]
-            if payment_method_id.startswith("card_"):
-                endpoint = "/credit_cards"
-            elif payment_method_id.startswith("bank_"):
-                endpoint = "/bank_accounts"
-            else:
-                raise InvalidObjectError(message=INVALID_PAYMENT_METHOD_ERROR)
-        else:
-            raise InvalidObjectError(message=INVALID_PAYMENT_METHOD_ERROR)
-
-        return [endpoint, payment_method_id]
+        return _select_payment_method(payment_methods=payment_methods, priority=priority)
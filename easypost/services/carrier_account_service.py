@@ -2,14 +2,12 @@ from typing import (
     Any,
     Dict,
     List,
-    Optional,
 )
 
 from easypost.constant import (
     _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_WORKFLOWS,
     MISSING_PARAMETER_ERROR,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import MissingParameterError
 from easypost.models import CarrierAccount
 from easypost.requestor import (
@@ -19,6 +17,19 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _carrier_account_creation_url(params: Dict[str, Any]) -> str:
+    """Determines which API endpoint to use for the creation call, shared with the `AsyncCarrierAccountService`."""
+    carrier_account_type = params.get("type")
+
+    if carrier_account_type is None:
+        raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
+
+    if carrier_account_type in _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_WORKFLOWS:
+        return "/carrier_accounts/register"
+
+    return "/carrier_accounts"
+
+
 class CarrierAccountService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -26,17 +37,12 @@ class CarrierAccountService(BaseService):
 
     def create(self, **params) -> CarrierAccount:
         """Create a CarrierAccount."""
-        carrier_account_type = params.get("type")
-
-        if carrier_account_type is None:
-            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
-
-        url = self._select_carrier_account_creation_endpoint(carrier_account_type=carrier_account_type)
+        url = _carrier_account_creation_url(params=params)
         wrapped_params = {self._snakecase_name(self._model_class): params}
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of CarrierAccounts."""
@@ -56,13 +62,10 @@ class CarrierAccountService(BaseService):
 
     def types(self) -> List[Dict[str, Any]]:
         """Get the types of CarrierAccounts available to the User."""
-        response = Requestor(self._client).request(method=RequestMethod.GET, url="/carrier_types")
-
-        return convert_to_easypost_object(response=response)
-
-    def _select_carrier_account_creation_endpoint(self, carrier_account_type: Optional[Any]) -> str:
-        """Determines which API endpoint to use for the creation call."""
-        if carrier_account_type in _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_WORKFLOWS:
-            return "/carrier_accounts/register"
+        response = Requestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/carrier_types",
+            cacheable=True,
+        )
 
-        return "/carrier_accounts"
+        return self._convert_to_easypost_object(response=response)
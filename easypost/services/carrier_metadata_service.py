@@ -5,7 +5,6 @@ from typing import (
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.requestor import (
     RequestMethod,
     Requestor,
@@ -32,6 +31,7 @@ class CarrierMetadataService(BaseService):
             method=RequestMethod.GET,
             url="/metadata/carriers",
             params=params,
+            cacheable=True,
         )
 
-        return convert_to_easypost_object(response=response.get("carriers", []))
+        return self._convert_to_easypost_object(response=response.get("carriers", []))
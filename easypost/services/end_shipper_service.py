@@ -3,7 +3,6 @@ from typing import (
     Dict,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Address,
     EndShipper,
@@ -28,7 +27,7 @@ class EndShipperService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of EndShippers."""
@@ -48,4 +47,4 @@ class EndShipperService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.PUT, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
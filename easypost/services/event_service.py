@@ -1,10 +1,12 @@
+import datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
+    Union,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Event,
     Payload,
@@ -29,6 +31,34 @@ class EventService(BaseService):
         """Retrieve a list of Events."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Event]:
+        """Iterate over all Events, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> Iterator[Event]:
+        """Iterate over all Events created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Events are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
+
     def retrieve(self, id: str) -> Event:
         """Retrieve an Event."""
         return self._retrieve_resource(self._model_class, id)
@@ -39,7 +69,7 @@ class EventService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def retrieve_payload(self, event_id: str, payload_id: str, **params) -> Payload:
         """Retrieve a Payload of an Event."""
@@ -47,7 +77,7 @@ class EventService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def get_next_page(
         self,
@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
@@ -21,6 +22,10 @@ class InsuranceService(BaseService):
         """Retrieve a list of Insurances."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Insurance]:
+        """Iterate over all Insurances, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id: str) -> Insurance:
         """Retrieve an Insurance."""
         return self._retrieve_resource(self._model_class, id)
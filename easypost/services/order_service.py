@@ -4,7 +4,6 @@ from typing import (
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Order
 from easypost.requestor import (
     RequestMethod,
@@ -41,12 +40,12 @@ class OrderService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def buy(self, id: str, **params) -> Order:
         """Buy an Order."""
         url = f"{self._instance_url(self._model_class, id)}/buy"
 
-        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params, idempotent=True)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
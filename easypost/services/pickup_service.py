@@ -1,10 +1,10 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Pickup
 from easypost.requestor import (
     RequestMethod,
@@ -26,6 +26,10 @@ class PickupService(BaseService):
         """Retrieve a list of Pickups."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Pickup]:
+        """Iterate over all Pickups, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id: str) -> Pickup:
         """Retrieve a Pickup."""
         return self._retrieve_resource(self._model_class, id)
@@ -43,9 +47,9 @@ class PickupService(BaseService):
         """Buy a Pickup."""
         url = f"{self._instance_url(self._model_class, id)}/buy"
 
-        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params, idempotent=True)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def cancel(self, id: str, **params) -> Pickup:
         """Cancel a Pickup."""
@@ -53,4 +57,4 @@ class PickupService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
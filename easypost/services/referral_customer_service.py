@@ -1,7 +1,8 @@
-from copy import deepcopy
+from copy import copy
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
@@ -10,7 +11,6 @@ from easypost.constant import (
     SEND_STRIPE_DETAILS_ERROR,
     TIMEOUT,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import ExternalApiError
 from easypost.models import User
 from easypost.requestor import (
@@ -20,6 +20,21 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _referral_client(client, referral_api_key: str):
+    """Return a copy of a partner's client making requests with the API key of a referral customer, shared with the
+    `AsyncReferralCustomerService`.
+
+    The copy shares the connection pool, hooks, and the state keyed by API key (response cache, idempotency journal,
+    single flight) of the client, but not its rate limiter: it tracks the budget of the partner's API key, which the
+    requests of the referral customer do not spend.
+    """
+    referral_client = copy(client)
+    referral_client.api_key = referral_api_key
+    referral_client.rate_limiter = None
+
+    return referral_client
+
+
 class ReferralCustomerService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -38,7 +53,7 @@ class ReferralCustomerService(BaseService):
             params=wrapped_params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def update_email(self, id: str, email: str) -> None:
         """Update a referral customer.
@@ -69,7 +84,19 @@ class ReferralCustomerService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Dict[str, Any]]:
+        """Iterate over all referral customers, requesting each page as needed.
+
+        This function requires the Partner User's API key.
+        """
+        return self._iter_resources(
+            url="/referral_customers",
+            collection_key="referral_customers",
+            params=params,
+            prefetch=prefetch,
+        )
 
     def get_next_page(
         self,
@@ -112,7 +139,7 @@ class ReferralCustomerService(BaseService):
             priority=priority,
         )
 
-        return convert_to_easypost_object(response)
+        return self._convert_to_easypost_object(response)
 
     def _retrieve_easypost_stripe_api_key(self) -> str:
         """Retrieve EasyPost's Stripe public API key."""
@@ -173,11 +200,7 @@ class ReferralCustomerService(BaseService):
             }
         }
 
-        # Override the API key to use the referral's for this single request
-        referral_client = deepcopy(self._client)
-        referral_client.api_key = referral_api_key
-
-        response = Requestor(referral_client).request(
+        response = Requestor(_referral_client(self._client, referral_api_key)).request(
             method=RequestMethod.POST,
             params=params,
             url="/credit_cards",
@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
 )
@@ -22,6 +23,10 @@ class RefundService(BaseService):
         """Retrieve a list of Shipment Refunds."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Refund]:
+        """Iterate over all Refunds, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id: str) -> Refund:
         """Retrieve a Shipment Refund."""
         return self._retrieve_resource(self._model_class, id)
@@ -1,11 +1,11 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
 from easypost.constant import MISSING_PARAMETER_ERROR
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import MissingParameterError
 from easypost.models import Report
 from easypost.requestor import (
@@ -15,6 +15,14 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _report_type_url(report_type: Optional[str]) -> str:
+    """Return the URL of the Reports of a type (eg: "shipment"), shared with the `AsyncReportService`."""
+    if report_type is None:
+        raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
+
+    return f"/reports/{report_type}"
+
+
 class ReportService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -22,30 +30,27 @@ class ReportService(BaseService):
 
     def create(self, **params) -> Report:
         """Create a Report."""
-        refund_type = params.pop("type")
-
-        if refund_type is None:
-            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
-
-        url = f"{self._class_url(self._model_class)}/{refund_type}"
+        url = _report_type_url(report_type=params.pop("type"))
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of Reports."""
         refund_type = params.pop("type")
-
-        if refund_type is None:
-            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
-
-        url = f"{self._class_url(self._model_class)}/{refund_type}"
+        url = _report_type_url(report_type=refund_type)
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
         response["type"] = refund_type  # Needed for retrieving the next page
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Report]:
+        """Iterate over all Reports, requesting each page as needed."""
+        url = _report_type_url(report_type=params.pop("type", None))
+
+        return self._iter_resources(url=url, collection_key="reports", params=params, prefetch=prefetch)
 
     def retrieve(self, id: str) -> Report:
         """Retrieve a Report."""
@@ -57,12 +62,7 @@ class ReportService(BaseService):
         page_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Retrieve the next page of the list Report response."""
-        refund_type = reports.get("type")
-
-        if refund_type is None:
-            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
-
-        url = f"{self._class_url(self._model_class)}/{refund_type}"
+        url = _report_type_url(report_type=reports.get("type"))
         params = {
             "before_id": reports["reports"][-1].id,
             "page_size": page_size,
@@ -70,4 +70,4 @@ class ReportService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
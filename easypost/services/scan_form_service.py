@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
 )
 
@@ -21,6 +22,10 @@ class ScanFormService(BaseService):
         """Retrieve a list of ScanForms."""
         return self._all_resources(self._model_class, **params)
 
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[ScanForm]:
+        """Iterate over all ScanForms, requesting each page as needed."""
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
     def retrieve(self, id: str) -> ScanForm:
         """Retrieve a ScanForm."""
         return self._retrieve_resource(self._model_class, id)
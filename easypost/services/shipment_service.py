@@ -1,11 +1,15 @@
+import datetime
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Union,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Rate,
     Shipment,
@@ -14,8 +18,57 @@ from easypost.requestor import (
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
-from easypost.util import get_lowest_smart_rate
+from easypost.services.base_service import (
+    BaseService,
+    _map_concurrently,
+)
+from easypost.util import (
+    get_lowest_object_rate,
+    get_lowest_smart_rate,
+)
+
+
+def _buy_params(
+    params: Dict[str, Any],
+    with_carbon_offset: Optional[bool] = False,
+    end_shipper_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Add the options of a purchase to the params buying a Shipment, shared with the `AsyncShipmentService`."""
+    params["carbon_offset"] = with_carbon_offset
+    if end_shipper_id:
+        params["end_shipper_id"] = end_shipper_id
+
+    return params
+
+
+def _form_params(form_type: str, form_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Wrap the type and options of a form generated for a Shipment, shared with the `AsyncShipmentService`."""
+    return {"form": {"type": form_type, **(form_options or {})}}
+
+
+class BulkShipmentResult:
+    """The result of creating and buying one shipment of a bulk run.
+
+    `shipment` is the bought Shipment, or the created Shipment if selecting a rate or buying it failed. `error` is
+    the error that stopped this shipment, if any.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        params: Dict[str, Any],
+        shipment: Optional[Shipment] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.params = params
+        self.shipment = shipment
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the shipment was bought."""
+        return self.error is None and self.shipment is not None
 
 
 class ShipmentService(BaseService):
@@ -33,7 +86,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of Shipments."""
@@ -41,11 +94,42 @@ class ShipmentService(BaseService):
         response["include_children"] = params.get("include_children")
         response["purchased"] = params.get("purchased")
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Shipment]:
+        """Iterate over all Shipments, requesting each page as needed.
+
+        Params such as `include_children` and `purchased` are sent with the request of every page.
+        """
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> Iterator[Shipment]:
+        """Iterate over all Shipments created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Shipments are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
 
     def retrieve(self, id: str) -> Shipment:
         """Retrieve a Shipment."""
-        return self._retrieve_resource(self._model_class, id)
+        return self._retrieve_resource(self._model_class, id, cacheable=True)
 
     def get_next_page(
         self,
@@ -68,7 +152,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def get_smart_rates(self, id: str) -> List[Rate]:
         """Get SmartRates for a Shipment."""
@@ -76,7 +160,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response.get("result", []))
+        return self._convert_to_easypost_object(response=response.get("result", []))
 
     def buy(
         self,
@@ -87,13 +171,44 @@ class ShipmentService(BaseService):
     ) -> Shipment:
         """Buy a Shipment."""
         url = f"{self._instance_url(self._model_class, id)}/buy"
-        params["carbon_offset"] = with_carbon_offset
-        if end_shipper_id:
-            params["end_shipper_id"] = end_shipper_id
+        params = _buy_params(params=params, with_carbon_offset=with_carbon_offset, end_shipper_id=end_shipper_id)
 
-        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+        response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params, idempotent=True)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def bulk_create_and_buy(
+        self,
+        shipments: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        select_rate: Optional[Callable[[Shipment], Rate]] = None,
+        carriers: Optional[List[str]] = None,
+        services: Optional[List[str]] = None,
+        **buy_params,
+    ) -> Iterator[BulkShipmentResult]:
+        """Create, rate, and buy many Shipments, with up to `concurrency` Shipments in progress at once.
+
+        Each item of `shipments` holds the params of a Shipment to create. The rate to buy is chosen by `select_rate`,
+        or is the lowest rate of the Shipment (optionally filtered by `carriers` and `services`). `buy_params` are
+        sent with every purchase. A result is yielded for each Shipment as soon as it completes, in completion order,
+        and errors are reported on their result instead of stopping the run.
+        """
+
+        def create_and_buy(index: int, params: Dict[str, Any]) -> BulkShipmentResult:
+            result = BulkShipmentResult(index=index, params=params)
+            try:
+                result.shipment = self.create(**params)
+                if select_rate:
+                    rate = select_rate(result.shipment)
+                else:
+                    rate = get_lowest_object_rate(result.shipment, carriers, services)
+                result.shipment = self.buy(result.shipment.id, rate=rate, **buy_params)
+            except Exception as error:
+                result.error = error
+
+            return result
+
+        return _map_concurrently(create_and_buy, enumerate(shipments), concurrency)
 
     def refund(self, id: str, **params) -> Shipment:
         """Refund a Shipment."""
@@ -101,7 +216,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def insure(self, id: str, **params) -> Shipment:
         """Insure a Shipment."""
@@ -109,7 +224,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def label(self, id: str, **params) -> Shipment:
         """Convert the label format of a Shipment."""
@@ -117,7 +232,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def lowest_smart_rate(self, id: str, delivery_days: int, delivery_accuracy: str) -> Rate:
         """Get the lowest SmartRate of a Shipment."""
@@ -128,14 +243,12 @@ class ShipmentService(BaseService):
 
     def generate_form(self, id: str, form_type: str, form_options: Optional[Dict[str, Any]] = {}) -> Shipment:
         """Generate a form for a Shipment."""
-        params = {"type": form_type}
-        params.update(form_options)  # type: ignore
-        wrapped_params = {"form": params}
+        wrapped_params = _form_params(form_type=form_type, form_options=form_options)
         url = f"{self._instance_url(self._model_class, id)}/forms"
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def retrieve_estimated_delivery_date(self, id: str, planned_ship_date: str) -> List[Dict[str, Any]]:
         """Retrieves the estimated delivery date of each Rate via SmartRate."""
@@ -144,4 +257,4 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response.get("rates", []))
+        return self._convert_to_easypost_object(response=response.get("rates", []))
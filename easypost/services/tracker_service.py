@@ -1,11 +1,13 @@
+import datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Union,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Tracker
 from easypost.requestor import (
     RequestMethod,
@@ -31,11 +33,42 @@ class TrackerService(BaseService):
         response["tracking_code"] = params.get("tracking_code")
         response["carrier"] = params.get("carrier")
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
+
+    def iter_all(self, prefetch: int = 0, **params) -> Iterator[Tracker]:
+        """Iterate over all Trackers, requesting each page as needed.
+
+        Params such as `tracking_code` and `carrier` are sent with the request of every page.
+        """
+        return self._iter_all_resources(self._model_class, prefetch=prefetch, **params)
+
+    def iter_all_in_parallel(
+        self,
+        start_datetime: Union[datetime.datetime, str],
+        end_datetime: Union[datetime.datetime, str],
+        partitions: int = 4,
+        ordered: bool = True,
+        prefetch: int = 1,
+        **params,
+    ) -> Iterator[Tracker]:
+        """Iterate over all Trackers created between `start_datetime` and `end_datetime`, splitting the date range
+        into `partitions` windows that are paged through concurrently.
+
+        Trackers are yielded newest first, or as soon as their page is received when `ordered` is false.
+        """
+        return self._iter_all_resources_in_parallel(
+            self._model_class,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            partitions=partitions,
+            ordered=ordered,
+            prefetch=prefetch,
+            **params,
+        )
 
     def retrieve(self, id: str) -> Tracker:
         """Retrieve a Tracker."""
-        return self._retrieve_resource(self._model_class, id)
+        return self._retrieve_resource(self._model_class, id, cacheable=True)
 
     def get_next_page(
         self,
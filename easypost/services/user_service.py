@@ -5,7 +5,6 @@ from typing import (
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     ApiKey,
     User,
@@ -17,6 +16,25 @@ from easypost.requestor import (
 from easypost.services.base_service import BaseService
 
 
+def _select_api_keys(api_keys: Dict[str, Any], id: str) -> List[ApiKey]:
+    """Select the API keys of the authenticated User or one of its children, shared with the `AsyncUserService`."""
+    my_api_keys = []
+
+    if api_keys["id"] == id:
+        # This function was called on the authenticated user
+        my_api_keys = api_keys["keys"]
+    else:
+        # This function was called on a child user (authenticated as parent, only return
+        # this child user's details).
+        # Fields are read as items, `keys` is a method of a `CompactEasyPostObject`
+        for child in api_keys["children"]:
+            if child["id"] == id:
+                my_api_keys = child["keys"]
+                break
+
+    return my_api_keys
+
+
 class UserService(BaseService):
     def __init__(self, client):
         self._client = client
@@ -24,7 +42,11 @@ class UserService(BaseService):
 
     def create(self, **params) -> User:
         """Create a User."""
-        return self._create_resource(self._model_class, **params)
+        user = self._create_resource(self._model_class, **params)
+        # Child users are listed with their API keys
+        self._invalidate_cached_responses(url="/api_keys")
+
+        return user
 
     def all(self, **params) -> Dict[str, Any]:
         """Retrieve a list of Users."""
@@ -45,7 +67,7 @@ class UserService(BaseService):
             url=url,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def update(self, id: str, **params) -> User:
         """Update a User."""
@@ -54,6 +76,7 @@ class UserService(BaseService):
     def delete(self, id: str) -> None:
         """Delete a User."""
         self._delete_resource(self._model_class, id)
+        self._invalidate_cached_responses(url="/api_keys")
 
     def retrieve_me(self) -> User:
         """Retrieve the authenticated User."""
@@ -64,33 +87,21 @@ class UserService(BaseService):
             url=url,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def all_api_keys(self) -> Dict[str, Any]:
         """Retrieve a list of all API keys."""
         url = "/api_keys"
 
-        response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
+        response = Requestor(self._client).request(method=RequestMethod.GET, url=url, cacheable=True)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
 
     def api_keys(self, id: str) -> List[ApiKey]:
         """Retrieve a list of API keys (works for the authenticated User or a child User)."""
         api_keys = self.all_api_keys()
-        my_api_keys = []
-
-        if api_keys["id"] == id:
-            # This function was called on the authenticated user
-            my_api_keys = api_keys["keys"]
-        else:
-            # This function was called on a child user (authenticated as parent, only return
-            # this child user's details).
-            for child in api_keys["children"]:
-                if child.id == id:
-                    my_api_keys = child.keys
-                    break
 
-        return my_api_keys
+        return _select_api_keys(api_keys=api_keys, id=id)
 
     def update_brand(self, id: str, **params) -> User:
         """Update a User's Brand."""
@@ -102,4 +113,4 @@ class UserService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_to_easypost_object(response=response)
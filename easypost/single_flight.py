@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from easypost.constant import DEADLINE_EXCEEDED_ERROR
+from easypost.errors import TimeoutError
+
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A call in flight, along with its outcome once it completes."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls: while a call for a key is in flight, callers of the same key wait for
+    it and share its outcome instead of making their own call.
+
+    Calls are shared between the threads of a process with `do`, and between the tasks of an event loop with
+    `do_async`. Nothing is kept once a call completes, calls for a key made afterwards are made again. Callers
+    waiting for a call in flight wait at most `timeout` seconds, then raise a `TimeoutError`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[asyncio.AbstractEventLoop, str], "asyncio.Future[Any]"] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The number of calls made, and of calls which shared the outcome of a call in flight instead."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "coalesced": self._coalesced,
+            }
+
+    def do(self, key: str, fn: Callable[[], T], timeout: Optional[float] = None) -> T:
+        """Call `fn`, or wait up to `timeout` seconds for the call in flight for `key` and return its result (or raise
+        its error).
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._calls += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            if not flight.done.wait(timeout=timeout):
+                raise TimeoutError(DEADLINE_EXCEEDED_ERROR)
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return flight.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        """Await `fn()`, or wait up to `timeout` seconds for the call in flight for `key` and return its result (or
+        raise its error).
+        """
+        # Futures belong to an event loop, calls are only shared by the tasks of the same loop
+        loop = asyncio.get_running_loop()
+        wait_until = loop.time() + timeout if timeout is not None else None
+        future = self._async_flights.get((loop, key))
+        while future is not None:
+            with self._lock:
+                self._coalesced += 1
+            try:
+                # A waiter cancelled while waiting must not cancel the call shared with the other waiters
+                return await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout=max(0.0, wait_until - loop.time()) if wait_until is not None else None,
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(DEADLINE_EXCEEDED_ERROR)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+            # The task leading the call was cancelled, which only concerns that task: the call is made again, led by
+            # the first waiter to get here
+            with self._lock:
+                self._coalesced -= 1
+            future = self._async_flights.get((loop, key))
+
+        future = self._async_flights[(loop, key)] = loop.create_future()
+        with self._lock:
+            self._calls += 1
+
+        try:
+            result = await fn()
+        except BaseException as error:
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # Mark the error as retrieved, it is raised here even when nothing waits for it
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._async_flights[(loop, key)]
+
+        return result
@@ -0,0 +1,429 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from easypost.constant import (
+    STATE_TIMEOUT_ERROR,
+    UNEXPECTED_STATE_ERROR,
+)
+from easypost.errors import (
+    GatewayTimeoutError,
+    HttpError,
+    InternalServerError,
+    InvalidObjectError,
+    RateLimitError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+
+
+BATCH_FAILURE_STATES = ["creation_failed", "purchase_failed"]
+REPORT_FAILURE_STATES = ["failed"]
+
+# Errors which do not stop a wait, the object is polled again after backing off
+TRANSIENT_ERRORS = (
+    GatewayTimeoutError,
+    HttpError,
+    InternalServerError,
+    RateLimitError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+
+
+class _Wait:
+    """An object waited for, along with the state of its polling."""
+
+    def __init__(
+        self,
+        object_name: str,
+        id: str,
+        state_attribute: str,
+        states: Iterable[str],
+        failure_states: Iterable[str],
+        timeout: float,
+    ):
+        self.object_name = object_name
+        self.id = id
+        self.state_attribute = state_attribute
+        self.states = list(states)
+        self.failure_states = list(failure_states)
+        self.deadline = time.monotonic() + timeout
+        self.interval: Optional[float] = None
+        self.state: Optional[str] = None
+
+    def reached(self, easypost_object: Any) -> bool:
+        """Whether the object reached one of the target states, raising an error when it reached a failure
+        state.
+        """
+        state = easypost_object.get(self.state_attribute)
+        if state in self.states:
+            return True
+        elif state in self.failure_states:
+            raise InvalidObjectError(
+                UNEXPECTED_STATE_ERROR.format(self.object_name, self.id, state, ", ".join(self.states))
+            )
+
+        if state != self.state:
+            # The object is progressing, its next transition is likely to come soon
+            self.interval = None
+        self.state = state
+
+        return False
+
+    def timeout_error(self) -> TimeoutError:
+        """The error of a wait whose deadline passed."""
+        return TimeoutError(STATE_TIMEOUT_ERROR.format(self.object_name, self.id, ", ".join(self.states), self.state))
+
+
+class _PollingBackoff:
+    """Spaces the polls of an object: polls start `initial_interval` seconds apart and back off by `multiplier`
+    while its state does not change, up to `max_interval` seconds (or `max_interval` right away when the API
+    answered with a 429). Intervals are jittered so objects waited for together are not polled in lockstep.
+    """
+
+    def __init__(self, initial_interval: float, max_interval: float, multiplier: float):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+
+    def delay(self, wait: _Wait, error: Optional[Exception] = None) -> Optional[float]:
+        """Return the number of seconds to wait before polling the object again, or `None` when its deadline would
+        pass first.
+        """
+        if isinstance(error, RateLimitError):
+            wait.interval = self.max_interval
+        elif wait.interval is None:
+            wait.interval = self.initial_interval
+        else:
+            wait.interval = min(self.max_interval, wait.interval * self.multiplier)
+
+        delay = random.uniform(wait.interval / 2, wait.interval)  # nosec
+        remaining = wait.deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        # Poll one last time at the deadline instead of failing before it
+        return min(delay, remaining)
+
+
+class StateWaiter:
+    """Waits for Batches (eg: created, purchased, or label generated after `client.batch.create_and_buy()` or
+    `client.batch.label()`) and Reports (available) to reach a state, polling them with adaptive backoff.
+
+    Many objects can be waited for at once: a single scheduler thread shares up to `concurrency` threads between
+    the polls of every object, which are retrieved with the `client`. `wait_for_batch` and `wait_for_report`
+    return a `Future` resolved with the object once it reaches one of the target `states`, or failed with a
+    `TimeoutError` once `timeout` seconds pass, with an `InvalidObjectError` when it reaches a failure state, or
+    with the error that prevented retrieving it. Timeouts and server errors do not fail a wait, the object is
+    polled again after backing off. Pass a `callback` to call it with the future once it is resolved, or cancel
+    the future to stop waiting.
+
+    Polls run in a copy of the context the wait was started in, so request options apply to them. Close the
+    waiter (or use it as a context manager) to stop its threads, pending futures are cancelled.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+        concurrency: int = 4,
+    ):
+        self._client = client
+        self.backoff = _PollingBackoff(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            multiplier=multiplier,
+        )
+        self.concurrency = concurrency
+
+        self._condition = threading.Condition()
+        self._scheduled: List[Tuple[float, int, _Wait, Callable[[], Any], "Future[Any]", contextvars.Context]] = []
+        self._sequence = itertools.count()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def wait_for_batch(
+        self,
+        id: str,
+        states: Iterable[str] = ("created",),
+        timeout: float = 300,
+        failure_states: Iterable[str] = BATCH_FAILURE_STATES,
+        callback: Optional[Callable[["Future[Any]"], Any]] = None,
+    ) -> "Future[Any]":
+        """Wait for a Batch to reach one of `states` (eg: "created", "purchased", or "label_generated")."""
+        return self._wait(
+            wait=_Wait(
+                object_name="Batch",
+                id=id,
+                state_attribute="state",
+                states=states,
+                failure_states=failure_states,
+                timeout=timeout,
+            ),
+            retrieve=lambda: self._client.batch.retrieve(id),
+            callback=callback,
+        )
+
+    def wait_for_report(
+        self,
+        id: str,
+        states: Iterable[str] = ("available",),
+        timeout: float = 300,
+        failure_states: Iterable[str] = REPORT_FAILURE_STATES,
+        callback: Optional[Callable[["Future[Any]"], Any]] = None,
+    ) -> "Future[Any]":
+        """Wait for a Report to reach one of `states`, by default until its file is available."""
+        return self._wait(
+            wait=_Wait(
+                object_name="Report",
+                id=id,
+                state_attribute="status",
+                states=states,
+                failure_states=failure_states,
+                timeout=timeout,
+            ),
+            retrieve=lambda: self._client.report.retrieve(id),
+            callback=callback,
+        )
+
+    def close(self) -> None:
+        """Stop the threads of the waiter, cancelling the futures of the objects still waited for."""
+        with self._condition:
+            self._closed = True
+            scheduled, self._scheduled = self._scheduled, []
+            self._condition.notify_all()
+
+        for _, _, _, _, future, _ in scheduled:
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "StateWaiter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _wait(
+        self,
+        wait: _Wait,
+        retrieve: Callable[[], Any],
+        callback: Optional[Callable[["Future[Any]"], Any]],
+    ) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        if callback:
+            future.add_done_callback(callback)
+
+        with self._condition:
+            if self._closed:
+                future.cancel()
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="easypost-waiter")
+                threading.Thread(target=self._schedule, name="easypost-waiter-scheduler", daemon=True).start()
+
+        # The first poll is immediate, the object may already be in one of the states
+        self._reschedule(wait, retrieve, future, contextvars.copy_context(), delay=0)
+
+        return future
+
+    def _reschedule(
+        self,
+        wait: _Wait,
+        retrieve: Callable[[], Any],
+        future: "Future[Any]",
+        context: contextvars.Context,
+        delay: float,
+    ) -> None:
+        with self._condition:
+            if self._closed:
+                future.cancel()
+                return
+            heapq.heappush(
+                self._scheduled,
+                (time.monotonic() + delay, next(self._sequence), wait, retrieve, future, context),
+            )
+            self._condition.notify_all()
+
+    def _schedule(self) -> None:
+        """Submit the polls of the scheduler to the thread pool as they become due."""
+        while True:
+            with self._condition:
+                while not self._closed and (not self._scheduled or self._scheduled[0][0] > time.monotonic()):
+                    timeout = self._scheduled[0][0] - time.monotonic() if self._scheduled else None
+                    self._condition.wait(timeout=timeout)
+                if self._closed:
+                    return
+                _, _, wait, retrieve, future, context = heapq.heappop(self._scheduled)
+                executor = self._executor
+
+            try:
+                executor.submit(self._run_poll, wait, retrieve, future, context)  # type: ignore[union-attr]
+            except RuntimeError:
+                # The waiter was closed meanwhile
+                future.cancel()
+
+    def _run_poll(
+        self, wait: _Wait, retrieve: Callable[[], Any], future: "Future[Any]", context: contextvars.Context
+    ) -> None:
+        """Poll an object in the context of its wait, failing its future with any error the poll raises instead of
+        leaving it unresolved (the thread pool would swallow the error).
+        """
+        try:
+            context.run(self._poll, wait, retrieve, future, context)
+        except Exception as error:
+            if not future.done():
+                _resolve(future, error=error)
+
+    def _poll(
+        self, wait: _Wait, retrieve: Callable[[], Any], future: "Future[Any]", context: contextvars.Context
+    ) -> None:
+        """Retrieve the object waited for, resolving its future or polling it again later."""
+        if future.cancelled():
+            return
+
+        error: Optional[Exception] = None
+        try:
+            easypost_object = retrieve()
+            if wait.reached(easypost_object):
+                _resolve(future, result=easypost_object)
+                return
+        except TRANSIENT_ERRORS as transient_error:
+            error = transient_error
+        except Exception as fatal_error:
+            _resolve(future, error=fatal_error)
+            return
+
+        delay = self.backoff.delay(wait=wait, error=error)
+        if delay is None:
+            _resolve(future, error=wait.timeout_error())
+        else:
+            # The context is still entered by this poll, which may not have returned by the time the next one
+            # starts, the next poll runs in a copy of it
+            self._reschedule(wait, retrieve, future, context.copy(), delay=delay)
+
+
+class AsyncStateWaiter:
+    """Waits for Batches and Reports to reach a state with an `AsyncEasyPostClient`, polling them with the same
+    adaptive backoff as a `StateWaiter`.
+
+    `wait_for_batch` and `wait_for_report` return an `asyncio.Task` of the event loop, which shares the polls of
+    every object waited for, resolved like the futures of a `StateWaiter`. Cancel the task to stop waiting.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+    ):
+        self._client = client
+        self.backoff = _PollingBackoff(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            multiplier=multiplier,
+        )
+
+    def wait_for_batch(
+        self,
+        id: str,
+        states: Iterable[str] = ("created",),
+        timeout: float = 300,
+        failure_states: Iterable[str] = BATCH_FAILURE_STATES,
+        callback: Optional[Callable[["asyncio.Task[Any]"], Any]] = None,
+    ) -> "asyncio.Task[Any]":
+        """Wait for a Batch to reach one of `states` (eg: "created", "purchased", or "label_generated")."""
+        return self._wait(
+            wait=_Wait(
+                object_name="Batch",
+                id=id,
+                state_attribute="state",
+                states=states,
+                failure_states=failure_states,
+                timeout=timeout,
+            ),
+            retrieve=lambda: self._client.batch.retrieve(id),
+            callback=callback,
+        )
+
+    def wait_for_report(
+        self,
+        id: str,
+        states: Iterable[str] = ("available",),
+        timeout: float = 300,
+        failure_states: Iterable[str] = REPORT_FAILURE_STATES,
+        callback: Optional[Callable[["asyncio.Task[Any]"], Any]] = None,
+    ) -> "asyncio.Task[Any]":
+        """Wait for a Report to reach one of `states`, by default until its file is available."""
+        return self._wait(
+            wait=_Wait(
+                object_name="Report",
+                id=id,
+                state_attribute="status",
+                states=states,
+                failure_states=failure_states,
+                timeout=timeout,
+            ),
+            retrieve=lambda: self._client.report.retrieve(id),
+            callback=callback,
+        )
+
+    def _wait(
+        self,
+        wait: _Wait,
+        retrieve: Callable[[], Awaitable[Any]],
+        callback: Optional[Callable[["asyncio.Task[Any]"], Any]],
+    ) -> "asyncio.Task[Any]":
+        task = asyncio.ensure_future(self._poll(wait=wait, retrieve=retrieve))
+        if callback:
+            task.add_done_callback(callback)
+
+        return task
+
+    async def _poll(self, wait: _Wait, retrieve: Callable[[], Awaitable[Any]]) -> Any:
+        """Retrieve the object waited for until it reaches one of the states, its deadline passes, or it fails."""
+        while True:
+            error: Optional[Exception] = None
+            try:
+                easypost_object = await retrieve()
+                if wait.reached(easypost_object):
+                    return easypost_object
+            except TRANSIENT_ERRORS as transient_error:
+                error = transient_error
+
+            delay = self.backoff.delay(wait=wait, error=error)
+            if delay is None:
+                raise wait.timeout_error()
+            await asyncio.sleep(delay)
+
+
+def _resolve(future: "Future[Any]", result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Resolve a future unless it was cancelled while its object was polled."""
+    if not future.set_running_or_notify_cancel():
+        return
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -0,0 +1,10 @@
+# flake8: noqa
+from easypost.transports.aiohttp_transport import AiohttpTransport
+from easypost.transports.base_transport import (
+    AsyncTransport,
+    Timeout,
+    Transport,
+    TransportResponse,
+)
+from easypost.transports.requests_transport import RequestsTransport
+from easypost.transports.urlfetch_transport import UrlfetchTransport
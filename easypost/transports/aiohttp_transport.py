@@ -0,0 +1,177 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from easypost.constant import (
+    INVALID_AIOHTTP_VERSION_ERROR,
+    SUPPORT_EMAIL,
+)
+from easypost.json_codecs import (
+    JsonCodec,
+    default_json_codec,
+)
+from easypost.requestor import RequestMethod
+from easypost.transports.base_transport import (
+    AsyncTransport,
+    Timeout,
+    TransportResponse,
+)
+
+
+class AiohttpTransport(AsyncTransport):
+    """Sends requests with an `aiohttp.ClientSession`, the default transport of an `AsyncEasyPostClient`."""
+
+    timeout_exceptions = (asyncio.TimeoutError,)
+    encodes_object_references = True
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keep_alive: bool = True,
+        keepalive_timeout: Optional[float] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
+        """Configure the connection pool of the transport.
+
+        - `max_connections`: the maximum number of connections open at once, 0 means no limit
+        - `max_connections_per_host`: the maximum number of connections open at once per host, 0 means no limit
+        - `keep_alive`: keep connections open between requests, disabling it closes them after each response
+        - `keepalive_timeout`: how long an idle connection is kept open, defaults to the `aiohttp` default
+        - `json_codec`: encodes request bodies, defaults to the standard library
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(INVALID_AIOHTTP_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+        self._aiohttp = aiohttp
+        self.json_codec = json_codec or default_json_codec()
+        self._connector_options: Dict[str, Any] = {
+            "limit": max_connections,
+            "limit_per_host": max_connections_per_host,
+            "force_close": not keep_alive,
+        }
+        if keepalive_timeout is not None:
+            self._connector_options["keepalive_timeout"] = keepalive_timeout
+        # The session must be created inside a running event loop, it is created on the first request
+        self._session: Optional[Any] = None
+
+    async def request(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request by using the `aiohttp` library, the body of the response is returned as bytes.
+
+        `aiohttp` negotiates compressed responses (gzip and deflate, and brotli when it is installed) and
+        decompresses them.
+        """
+        session = self._get_session()
+        data: Any = None
+        if body is not None:
+            headers, data = self.encode_body(body=body, headers=headers)
+            if not isinstance(data, bytes):
+                data = self._stream(chunks=data)
+
+        async with session.request(
+            method=method.value,
+            url=url,
+            params=self.encode_query_params(params=params) if params else None,
+            headers=headers,
+            data=data,
+            timeout=self._client_timeout(timeout=timeout),
+        ) as result:
+            response_body = await result.read()
+            # `total_raw_bytes` counts the bytes received before decompression, on recent `aiohttp` versions
+            wire_size = getattr(result.content, "total_raw_bytes", None)
+            if wire_size is None and result.content_length is not None:
+                wire_size = result.content_length
+
+            return TransportResponse(
+                body=response_body,
+                status=result.status,
+                headers=result.headers,
+                wire_size=wire_size,
+            )
+
+    @staticmethod
+    async def _stream(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+        """Stream the chunks of a body, `aiohttp` sends async iterables with chunked transfer encoding."""
+        for chunk in chunks:
+            yield chunk
+
+    def _client_timeout(self, timeout: Timeout) -> Any:
+        """Build the `aiohttp.ClientTimeout` of a request."""
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return self._aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+
+        return self._aiohttp.ClientTimeout(total=timeout)
+
+    async def warm_up(self, url: str, connections: int) -> int:
+        """Open connections to the host of `url` ahead of time and keep them in the connection pool.
+
+        `aiohttp` has no API to open a connection without a request, so `connections` concurrent HEAD
+        requests are sent. Their connections stay in the pool once the responses are read.
+        """
+        if self._connector_options["force_close"]:
+            return 0
+
+        session = self._get_session()
+
+        async def _head() -> bool:
+            try:
+                async with session.head(url, allow_redirects=False):
+                    return True
+            except Exception:
+                return False
+
+        results = await asyncio.gather(*[_head() for _ in range(connections)])
+
+        return sum(results)
+
+    async def close(self) -> None:
+        """Close the connection pool of the session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
+    def _get_session(self) -> Any:
+        """Return the `aiohttp` session of this transport, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(**self._connector_options),
+            )
+
+        return self._session
+
+    @staticmethod
+    def encode_query_params(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Encode query params the same way the `requests` library does.
+
+        `aiohttp` rejects `None` and boolean values, so drop `None` values and stringify everything else.
+        """
+        query_params: List[Tuple[str, str]] = []
+
+        for key, value in params.items():
+            if value is None:
+                continue
+            elif isinstance(value, (list, tuple)):
+                query_params.extend((key, str(item)) for item in value if item is not None)
+            else:
+                query_params.append((key, str(value)))
+
+        return query_params
@@ -0,0 +1,179 @@
+import io
+import shutil
+import socket
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from easypost.json_codecs import (
+    JsonCodec,
+    StdlibJsonCodec,
+)
+from easypost.requestor import RequestMethod
+from easypost.transports.request_body import encode_request_body
+
+
+# A timeout in seconds, or a `(connect timeout, read timeout)` tuple
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TransportResponse:
+    """The raw HTTP response returned by a transport, transports should return the body as the bytes received so
+    the JSON codec of the client can decode them without decoding them into a string first.
+
+    The body is returned decompressed, `wire_size` is the number of bytes of the body received over the wire before
+    decompressing it, or `None` when the transport cannot tell.
+    """
+
+    def __init__(
+        self,
+        body: Union[str, bytes],
+        status: int,
+        headers: Dict[str, Any],
+        wire_size: Optional[int] = None,
+    ):
+        self.body = body
+        self.status = status
+        self.headers = headers
+        self.wire_size = wire_size
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of the decompressed body."""
+        return len(self.body) if isinstance(self.body, bytes) else len(self.body.encode(encoding="utf-8"))
+
+
+class Transport:
+    """The interface every synchronous HTTP transport of an `EasyPostClient` implements.
+
+    A transport only sends a request and returns the raw response. Hooks, timeouts, and the translation of
+    HTTP statuses and exceptions into EasyPost errors are handled by the `Requestor` for every transport:
+    exceptions listed in `timeout_exceptions` are raised as a `TimeoutError`, any other exception as an `HttpError`.
+    The `timeout` of a request is either a number of seconds or a `(connect timeout, read timeout)` tuple.
+    """
+
+    timeout_exceptions: Tuple[Type[BaseException], ...] = (TimeoutError, socket.timeout)
+    # Whether `body` is encoded with a `JsonCodec`, which replaces objects with their IDs while encoding. Otherwise
+    # objects passed as params are replaced with their IDs in a copy of the params before they reach the transport
+    encodes_object_references = False
+    # Encodes the bodies sent with `encode_body`
+    json_codec: JsonCodec = StdlibJsonCodec()
+
+    def request(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request. `params` are sent as the query string and `body` as a JSON body."""
+        raise NotImplementedError
+
+    def encode_body(
+        self,
+        body: Dict[str, Any],
+        headers: Dict[str, Any],
+        streaming: bool = True,
+    ) -> Tuple[Dict[str, Any], Union[bytes, Iterator[bytes]]]:
+        """Encode a JSON body with the `json_codec` of the transport, returning the headers to send it with.
+
+        Within a `request_options(stream_body=True)` block, the body is returned as a generator which encodes it as
+        it is sent, unless the transport cannot send generators (`streaming=False`). Within a
+        `request_options(compress_body=True)` block, the body is gzip-compressed on the fly.
+        """
+        return encode_request_body(json_codec=self.json_codec, body=body, headers=headers, streaming=streaming)
+
+    def download(
+        self,
+        url: str,
+        headers: Dict[str, Any],
+        destination: BinaryIO,
+        timeout: Timeout,
+        chunk_size: int,
+    ) -> TransportResponse:
+        """Download a file (eg: a label) with a GET request, writing its body to `destination` in chunks of up to
+        `chunk_size` bytes.
+
+        The body of the returned response is empty once it was written to `destination`, only the body of an
+        unsuccessful response is returned instead. Transports which cannot stream responses receive the whole file
+        before it is written.
+        """
+        response = self.request(
+            method=RequestMethod.GET,
+            url=url,
+            headers=headers,
+            params=None,
+            body=None,
+            timeout=timeout,
+        )
+        if response.status < 200 or response.status >= 300:
+            return response
+
+        body = response.body if isinstance(response.body, bytes) else response.body.encode(encoding="utf-8")
+        shutil.copyfileobj(io.BytesIO(body), destination, chunk_size)
+
+        return TransportResponse(
+            body=b"", status=response.status, headers=response.headers, wire_size=response.wire_size
+        )
+
+    def warm_up(self, url: str, connections: int) -> int:
+        """Open up to `connections` connections to the host of `url` ahead of time, returns the number opened."""
+        return 0
+
+    def close(self) -> None:
+        """Release the connections held by this transport."""
+        pass
+
+
+class AsyncTransport:
+    """The interface every asyncio HTTP transport of an `AsyncEasyPostClient` implements.
+
+    Behaves like a `Transport`, except that `request`, `warm_up`, and `close` are awaitable.
+    """
+
+    timeout_exceptions: Tuple[Type[BaseException], ...] = (TimeoutError, socket.timeout)
+    encodes_object_references = False
+    json_codec: JsonCodec = StdlibJsonCodec()
+
+    async def request(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request. `params` are sent as the query string and `body` as a JSON body."""
+        raise NotImplementedError
+
+    def encode_body(
+        self,
+        body: Dict[str, Any],
+        headers: Dict[str, Any],
+        streaming: bool = True,
+    ) -> Tuple[Dict[str, Any], Union[bytes, Iterator[bytes]]]:
+        """Encode a JSON body with the `json_codec` of the transport, returning the headers to send it with.
+
+        Within a `request_options(stream_body=True)` block, the body is returned as a generator which encodes it as
+        it is sent, unless the transport cannot send generators (`streaming=False`). Within a
+        `request_options(compress_body=True)` block, the body is gzip-compressed on the fly.
+        """
+        return encode_request_body(json_codec=self.json_codec, body=body, headers=headers, streaming=streaming)
+
+    async def warm_up(self, url: str, connections: int) -> int:
+        """Open up to `connections` connections to the host of `url` ahead of time, returns the number opened."""
+        return 0
+
+    async def close(self) -> None:
+        """Release the connections held by this transport."""
+        pass
@@ -0,0 +1,72 @@
+import gzip
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Tuple,
+    Union,
+)
+
+from easypost.json_codecs import JsonCodec
+from easypost.request_options import get_request_options
+
+
+# Chunks of a streamed body are sent once they reach this size, before compression
+STREAM_CHUNK_SIZE = 64 * 1024
+# The default level of zlib, used for whole bodies too (`gzip.compress` defaults to 9) so both compress alike
+COMPRESSION_LEVEL = 6
+
+
+def encode_request_body(
+    json_codec: JsonCodec,
+    body: Any,
+    headers: Dict[str, Any],
+    streaming: bool = True,
+) -> Tuple[Dict[str, Any], Union[bytes, Iterator[bytes]]]:
+    """Encode a JSON request body along with its headers.
+
+    Within a `request_options(stream_body=True)` block, the body is returned as a generator encoding the body as
+    it is sent (unless the transport does not support `streaming` bodies), and within a
+    `request_options(compress_body=True)` block, the body is gzip-compressed on the fly.
+    """
+    options = get_request_options()
+    compress = options.get("compress_body", False)
+    headers = {**headers, "Content-Type": "application/json"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    if streaming and options.get("stream_body", False):
+        chunks = _buffer_chunks(json_codec.iter_dumps(body))
+        return headers, _gzip_chunks(chunks) if compress else chunks
+
+    encoded_body = json_codec.dumps(body)
+    if compress:
+        encoded_body = gzip.compress(encoded_body, compresslevel=COMPRESSION_LEVEL)
+
+    return headers, encoded_body
+
+
+def _buffer_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Merge the small chunks of an encoder into chunks of at least `STREAM_CHUNK_SIZE` bytes."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Compress chunks into a gzip stream as they are generated."""
+    # A `wbits` of 16 + 15 writes the gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+        if compressed_chunk:
+            yield compressed_chunk
+
+    yield compressor.flush()
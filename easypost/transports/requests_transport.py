@@ -0,0 +1,198 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Optional,
+)
+
+import requests
+from easypost.constant import (
+    INVALID_REQUESTS_VERSION_ERROR,
+    SUPPORT_EMAIL,
+)
+from easypost.json_codecs import (
+    JsonCodec,
+    default_json_codec,
+)
+from easypost.requestor import RequestMethod
+from easypost.transports.base_transport import (
+    Timeout,
+    Transport,
+    TransportResponse,
+)
+
+
+# The number of seconds to wait for the responses of the requests opening connections in `warm_up`
+WARM_UP_TIMEOUT = 10
+
+
+class RequestsTransport(Transport):
+    """Sends requests with a `requests.Session`, the default transport of an `EasyPostClient`."""
+
+    timeout_exceptions = (requests.exceptions.Timeout,)
+    encodes_object_references = True
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+    ):
+        """Configure the connection pool of the transport.
+
+        - `pool_connections`: the number of hosts to keep a connection pool for
+        - `pool_maxsize`: the maximum number of connections kept open per host, set this to the number of
+          threads sharing the client so threads do not wait for a free connection
+        - `pool_block`: when all connections to a host are in use, wait for one to be returned to the pool
+          instead of opening a connection that is discarded after use
+        - `keep_alive`: keep connections open between requests, disabling it closes them after each response
+        - `json_codec`: encodes request bodies, defaults to the standard library
+        """
+        try:
+            requests_version = requests.__version__
+            major_version, _, _ = [int(i) for i in requests_version.split(".")]
+        except Exception:
+            raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+        else:
+            if major_version < 1:
+                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+        self.session = requests.Session()
+        self.pool_maxsize = pool_maxsize
+        self.json_codec = json_codec or default_json_codec()
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        def _http_adapter() -> requests.adapters.HTTPAdapter:
+            return requests.adapters.HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+                pool_block=pool_block,
+            )
+
+        # The base URL gets an adapter of its own, the other hosts this transport talks to (eg: the hosts label
+        # files are downloaded from) share one configured the same way instead of the default adapter of `requests`
+        if base_url:
+            self.session.mount(prefix=base_url, adapter=_http_adapter())
+        requests_http_adapter = _http_adapter()
+        for prefix in ["https://", "http://"]:
+            self.session.mount(prefix=prefix, adapter=requests_http_adapter)
+
+    def request(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request by using the `requests` library.
+
+        `requests` negotiates compressed responses (gzip and deflate, and brotli when it is installed) and
+        decompresses them. The body of the response is returned as bytes, the JSON codec of the client decodes them
+        without decoding them into a string first.
+        """
+        data = None
+        if body is not None:
+            # Streamed bodies are sent with chunked transfer encoding
+            headers, data = self.encode_body(body=body, headers=headers)
+
+        result = self.session.request(
+            method=method.value,
+            url=url,
+            params=params,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            verify=True,
+        )
+
+        return TransportResponse(
+            body=result.content,
+            status=result.status_code,
+            headers=result.headers,  # type: ignore
+            wire_size=self._wire_size(result=result),
+        )
+
+    def download(
+        self,
+        url: str,
+        headers: Dict[str, Any],
+        destination: BinaryIO,
+        timeout: Timeout,
+        chunk_size: int,
+    ) -> TransportResponse:
+        """Download a file with the session of the transport, streaming its body to `destination` as it is received
+        so it is never held in memory whole.
+        """
+        result = self.session.get(url=url, headers=headers, timeout=timeout, stream=True, verify=True)
+        try:
+            if result.status_code < 200 or result.status_code >= 300:
+                return TransportResponse(
+                    body=result.content,
+                    status=result.status_code,
+                    headers=result.headers,  # type: ignore
+                )
+
+            for chunk in result.iter_content(chunk_size=chunk_size):
+                destination.write(chunk)
+
+            return TransportResponse(
+                body=b"",
+                status=result.status_code,
+                headers=result.headers,  # type: ignore
+                wire_size=self._wire_size(result=result),
+            )
+        finally:
+            # Return the connection to the pool
+            result.close()
+
+    @staticmethod
+    def _wire_size(result: requests.Response) -> Optional[int]:
+        """Return the number of bytes of the body received over the wire, before `urllib3` decompressed it."""
+        try:
+            return int(result.raw.tell())
+        except Exception:
+            # Responses which were not read from a socket (eg: mocked responses) fall back to their headers
+            content_length = result.headers.get("Content-Length")
+            return int(content_length) if content_length else None
+
+    def warm_up(self, url: str, connections: int) -> int:
+        """Open connections to the host of `url` ahead of time and keep them in the connection pool.
+
+        Up to `pool_maxsize` concurrent HEAD requests are sent through the session. Their responses are only
+        released once every request completed, so each one opens a distinct connection, which then stays in the
+        pool.
+        """
+        if self.session.headers.get("Connection") == "close":
+            return 0
+
+        def _head(_: int) -> Optional[requests.Response]:
+            try:
+                return self.session.head(url, allow_redirects=False, timeout=WARM_UP_TIMEOUT, stream=True)
+            except Exception:
+                return None
+
+        connections = min(connections, self.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max(connections, 1)) as executor:
+            results = list(executor.map(_head, range(connections)))
+
+        for result in results:
+            if result is not None:
+                # Reading the empty body of the response returns its connection to the pool
+                result.content
+                result.close()
+
+        return len([result for result in results if result is not None])
+
+    def close(self) -> None:
+        """Close the connection pool of the session."""
+        self.session.close()
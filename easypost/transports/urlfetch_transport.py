@@ -0,0 +1,107 @@
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from easypost.json_codecs import (
+    JsonCodec,
+    default_json_codec,
+)
+from easypost.requestor import (
+    RequestMethod,
+    Requestor,
+)
+from easypost.transports.base_transport import (
+    Timeout,
+    Transport,
+    TransportResponse,
+)
+
+
+class UrlfetchTransport(Transport):
+    """Sends requests with the `urlfetch` service of Google App Engine.
+
+    This is the default transport of an `EasyPostClient` when running on Google App Engine. Constructing it
+    anywhere else raises an `ImportError`.
+    """
+
+    encodes_object_references = True
+
+    def __init__(self, json_codec: Optional[JsonCodec] = None):
+        from google.appengine.api import urlfetch  # type: ignore
+
+        self._urlfetch = urlfetch
+        self.json_codec = json_codec or default_json_codec()
+        self.timeout_exceptions = (getattr(urlfetch, "DeadlineExceededError", TimeoutError),)
+
+        try:
+            import brotli  # type: ignore
+        except ImportError:
+            brotli = None
+        self._brotli = brotli
+        self.accept_encoding = "gzip, deflate, br" if brotli else "gzip, deflate"
+
+    def request(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request by using the `urlfetch` library.
+
+        `urlfetch` returns compressed responses as they were received, they are decompressed here.
+        """
+        fetch_args: Dict[str, Any] = {
+            "method": method.value,
+            "headers": {**headers, "Accept-Encoding": self.accept_encoding},
+            "validate_certificate": False,
+            # urlfetch has a single deadline for the whole request
+            "deadline": sum(timeout) if isinstance(timeout, tuple) else timeout,
+        }
+
+        if params:
+            # GET/DELETE requests use query params
+            fetch_args["url"] = Requestor.add_params_to_url(url=url, params=params, method=method)
+        else:
+            fetch_args["url"] = url
+
+        if body is not None:
+            # POST/PUT/PATCH requests use body params
+            # urlfetch cannot stream bodies
+            fetch_args["headers"], fetch_args["payload"] = self.encode_body(
+                body=body,
+                headers=fetch_args["headers"],
+                streaming=False,
+            )
+
+        result = self._urlfetch.fetch(**fetch_args)
+
+        return TransportResponse(
+            body=self._decompress(body=result.content, headers=result.headers),
+            status=result.status_code,
+            headers=result.headers,
+            wire_size=len(result.content),
+        )
+
+    def _decompress(self, body: bytes, headers: Dict[str, Any]) -> bytes:
+        """Decompress a body according to its `Content-Encoding` header."""
+        content_encoding = next((value for key, value in headers.items() if key.lower() == "content-encoding"), "")
+        content_encoding = content_encoding.strip().lower()
+
+        if content_encoding == "gzip":
+            return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif content_encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate streams without the zlib header
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        elif content_encoding == "br" and self._brotli:
+            return self._brotli.decompress(body)
+
+        return body
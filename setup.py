@@ -8,7 +8,20 @@ REQUIREMENTS = [
     "requests >= 2.4.3",
 ]
 
+ASYNC_REQUIREMENTS = [
+    "aiohttp >= 3.8",
+]
+
+ORJSON_REQUIREMENTS = [
+    "orjson >= 3",
+]
+
+PDF_REQUIREMENTS = [
+    "pypdf >= 3",
+]
+
 DEV_REQUIREMENTS = [
+    "aiohttp >= 3.8",
     "bandit==1.7.5",
     "black==23.*",
     "build==0.10.*",
@@ -16,7 +29,9 @@ DEV_REQUIREMENTS = [
     "flake8==5.*",  # TODO: flake8 v6 requires Python 3.8.1+
     "isort==5.*",
     "mypy==1.3.*",
+    "orjson >= 3",
     "pdoc==13.*",
+    "pypdf >= 3",
     "pytest-cov==4.*",
     "pytest-vcr==1.*",
     "pytest==7.*",
@@ -46,7 +61,10 @@ setup(
     ),
     install_requires=REQUIREMENTS,
     extras_require={
+        "async": ASYNC_REQUIREMENTS,
         "dev": DEV_REQUIREMENTS,
+        "orjson": ORJSON_REQUIREMENTS,
+        "pdf": PDF_REQUIREMENTS,
     },
     package_data={
         "easypost": ["py.typed"],
@@ -0,0 +1,65 @@
+"""Test doubles shared by the unit tests that run without cassettes."""
+
+import json
+
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+class InMemoryTransport(Transport):
+    """A transport that serves canned responses and records every request it receives."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.requests.append(
+            {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "params": params,
+                "body": body,
+                "timeout": timeout,
+            }
+        )
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        status, body = response
+        return TransportResponse(body=json.dumps(body), status=status, headers={})
+
+
+class InMemoryAsyncTransport(AsyncTransport):
+    """An async transport that serves canned responses."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.closed = False
+
+    async def request(self, method, url, headers, params, body, timeout):
+        status, body = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(body), status=status, headers={})
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    """Stands in for `time.monotonic` and `time.sleep` so time-based behavior can be tested without waiting."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
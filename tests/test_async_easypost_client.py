@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.errors import (
+    NotFoundError,
+    TimeoutError,
+)
+from easypost.models import (
+    Shipment,
+    Tracker,
+)
+
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import (  # noqa: E402
+    test_utils,
+    web,
+)
+
+
+async def start_server(routes):
+    """Start a local HTTP server that stands in for the EasyPost API."""
+    app = web.Application()
+    app.add_routes(routes)
+    server = test_utils.TestServer(app)
+    await server.start_server()
+
+    return server
+
+
+def test_async_client_retrieve():
+    """Tests that an awaited retrieve call returns the correct model."""
+
+    async def handler(request):
+        assert request.headers["Authorization"] == "Bearer 123"
+        return web.json_response({"id": request.match_info["id"], "object": "Shipment"})
+
+    async def run():
+        server = await start_server([web.get("/v2/shipments/{id}", handler)])
+        async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2"))) as client:
+            shipment = await client.shipment.retrieve("shp_123")
+        await server.close()
+
+        return shipment
+
+    shipment = asyncio.run(run())
+
+    assert isinstance(shipment, Shipment)
+    assert shipment.id == "shp_123"
+
+
+def test_async_client_concurrent_requests():
+    """Tests that many requests can be in flight at once on a single client."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return web.json_response({"id": request.match_info["id"], "object": "Tracker"})
+
+    async def run():
+        server = await start_server([web.get("/v2/trackers/{id}", handler)])
+        async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2"))) as client:
+            trackers = await asyncio.gather(*[client.tracker.retrieve(f"trk_{i}") for i in range(20)])
+        await server.close()
+
+        return trackers
+
+    trackers = asyncio.run(run())
+
+    assert [tracker.id for tracker in trackers] == [f"trk_{i}" for i in range(20)]
+    assert all(isinstance(tracker, Tracker) for tracker in trackers)
+    assert max_in_flight > 1
+
+
+def test_async_client_query_params():
+    """Tests that query params are encoded like the synchronous client does, dropping `None` values."""
+    received_query = {}
+
+    async def handler(request):
+        received_query.update(request.query)
+        return web.json_response({"carriers": []})
+
+    async def run():
+        server = await start_server([web.get("/v2/metadata/carriers", handler)])
+        async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2"))) as client:
+            metadata = await client.carrier_metadata.retrieve(carriers=["usps", "fedex"])
+        await server.close()
+
+        return metadata
+
+    metadata = asyncio.run(run())
+
+    assert metadata == []
+    assert received_query == {"carriers": "usps,fedex"}
+
+
+def test_async_client_error_mapping():
+    """Tests that API errors are mapped to the same error classes as the synchronous client."""
+
+    async def handler(request):
+        return web.json_response({"error": {"code": "NOT_FOUND", "message": "not found"}}, status=404)
+
+    async def run():
+        server = await start_server([web.get("/v2/shipments/{id}", handler)])
+        try:
+            async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2"))) as client:
+                await client.shipment.retrieve("shp_123")
+        finally:
+            await server.close()
+
+    with pytest.raises(NotFoundError) as error:
+        asyncio.run(run())
+
+    assert error.value.http_status == 404
+    assert error.value.message == "not found"
+
+
+def test_async_client_hooks():
+    """Tests that request and response hooks fire for async requests."""
+    hook_calls = []
+
+    async def handler(request):
+        return web.json_response({"id": "prcl_123", "object": "Parcel"}, status=201)
+
+    async def run():
+        server = await start_server([web.post("/v2/parcels", handler)])
+        async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2"))) as client:
+            client.subscribe_to_request_hook(lambda **kwargs: hook_calls.append(("request", kwargs)))
+            client.subscribe_to_response_hook(lambda **kwargs: hook_calls.append(("response", kwargs)))
+            await client.parcel.create(weight=10)
+        await server.close()
+
+    asyncio.run(run())
+
+    assert [name for name, _ in hook_calls] == ["request", "response"]
+    assert hook_calls[0][1]["request_body"] == {"parcel": {"weight": 10}}
+    assert hook_calls[1][1]["http_status"] == 201
+    assert hook_calls[0][1]["request_uuid"] == hook_calls[1][1]["request_uuid"]
+
+
+def test_async_client_timeout():
+    """Tests that the timeout gets used properly in async requests when set."""
+
+    async def handler(request):
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def run():
+        server = await start_server([web.get("/v2/shipments/{id}", handler)])
+        try:
+            async with AsyncEasyPostClient("123", api_base=str(server.make_url("/v2")), timeout=0.1) as client:
+                await client.shipment.retrieve("shp_123")
+        finally:
+            await server.close()
+
+    with pytest.raises(TimeoutError) as error:
+        asyncio.run(run())
+
+    assert error.value.message == "Request timed out."
@@ -73,7 +73,12 @@ def test_billing_retrieve_payment_methods(mock_request, prod_client):
     """Tests that we throw an error when we cannot retrieve payment methods due to no billing being setup."""
     response = prod_client.billing.retrieve_payment_methods()
 
-    mock_request.assert_called_once_with(method=easypost.requestor.RequestMethod.GET, url="/payment_methods", params={})
+    mock_request.assert_called_once_with(
+        method=easypost.requestor.RequestMethod.GET,
+        url="/payment_methods",
+        params={},
+        cacheable=True,
+    )
     assert isinstance(response, easypost.easypost_object.EasyPostObject)
 
 
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+import time
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    FilteringError,
+    InvalidRequestError,
+)
+from easypost.models import Shipment
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+RATES = [
+    {"id": "rate_fedex", "object": "Rate", "carrier": "FedEx", "service": "Ground", "rate": "9.00"},
+    {"id": "rate_usps", "object": "Rate", "carrier": "USPS", "service": "Priority", "rate": "7.50"},
+]
+
+
+def respond(method, url, body):
+    """Serve the create and buy requests of a shipment, failing to create shipments referenced `invalid`."""
+    if url.endswith("/shipments"):
+        reference = body["shipment"]["reference"]
+        if reference == "invalid":
+            error = {"error": {"code": "SHIPMENT.INVALID_PARAMS", "message": "invalid params"}}
+            return TransportResponse(body=json.dumps(error), status=422, headers={})
+
+        shipment = {"id": f"shp_{reference}", "object": "Shipment", "rates": RATES}
+        return TransportResponse(body=json.dumps(shipment), status=201, headers={})
+
+    shipment_id = url.split("/")[-2]
+    bought_shipment = {"id": shipment_id, "object": "Shipment", "selected_rate": body["rate"]}
+    return TransportResponse(body=json.dumps(bought_shipment), status=200, headers={})
+
+
+class BulkTransport(Transport):
+    """A thread-safe transport that records the number of requests in flight."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request(self, method, url, headers, params, body, timeout):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+
+        return respond(method, url, body)
+
+
+def test_bulk_create_and_buy():
+    """Tests that shipments are created and bought with the lowest rate, with bounded concurrency."""
+    transport = BulkTransport()
+    client = EasyPostClient("123", transport=transport)
+    shipments = ({"reference": str(i)} for i in range(20))
+
+    results = list(client.shipment.bulk_create_and_buy(shipments, concurrency=4, end_shipper_id="es_123"))
+
+    assert sorted(result.index for result in results) == list(range(20))
+    assert all(result.succeeded for result in results)
+    assert all(isinstance(result.shipment, Shipment) for result in results)
+    assert all(result.shipment.id == f"shp_{result.params['reference']}" for result in results)
+    assert all(result.shipment.selected_rate.id == "rate_usps" for result in results)
+    assert 1 < transport.max_in_flight <= 4
+
+
+def test_bulk_create_and_buy_errors():
+    """Tests that errors are reported on the result of their shipment instead of stopping the run."""
+    client = EasyPostClient("123", transport=BulkTransport())
+    shipments = [{"reference": "1"}, {"reference": "invalid"}, {"reference": "3"}]
+
+    results = {result.index: result for result in client.shipment.bulk_create_and_buy(shipments, carriers=["UPS"])}
+    results_with_select = {
+        result.index: result
+        for result in client.shipment.bulk_create_and_buy(
+            shipments,
+            select_rate=lambda shipment: shipment.rates[0],
+        )
+    }
+
+    assert isinstance(results[1].error, InvalidRequestError)
+    assert results[1].shipment is None
+    assert isinstance(results[0].error, FilteringError)
+    assert results[0].shipment.id == "shp_1"
+    assert not results[0].succeeded
+    assert results_with_select[0].shipment.selected_rate.id == "rate_fedex"
+    assert results_with_select[2].succeeded
+    assert not results_with_select[1].succeeded
+
+
+def test_async_bulk_create_and_buy():
+    """Tests that async clients create and buy shipments concurrently."""
+    in_flight = 0
+    max_in_flight = 0
+
+    class AsyncBulkTransport(AsyncTransport):
+        async def request(self, method, url, headers, params, body, timeout):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return respond(method, url, body)
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=AsyncBulkTransport()) as client:
+            shipments = [{"reference": str(i)} for i in range(10)] + [{"reference": "invalid"}]
+            return [result async for result in client.shipment.bulk_create_and_buy(shipments, concurrency=3)]
+
+    results = asyncio.run(run())
+
+    assert sorted(result.index for result in results) == list(range(11))
+    assert sum(result.succeeded for result in results) == 10
+    assert max_in_flight == 3
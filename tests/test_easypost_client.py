@@ -4,7 +4,20 @@ from unittest.mock import patch
 import pytest
 import requests
 from easypost.easypost_client import EasyPostClient
-from easypost.errors import TimeoutError
+from easypost.easypost_object import (
+    CompactEasyPostObject,
+    ConversionMode,
+)
+from easypost.errors import (
+    InvalidParameterError,
+    TimeoutError,
+)
+from easypost.models import Shipment
+from easypost.requestor import (
+    Requestor,
+    get_user_agent,
+)
+from tests.helpers import InMemoryTransport
 
 
 def test_api_key():
@@ -52,3 +65,92 @@ def test_client_timeout(mock_session, basic_shipment):
         assert False
     except TimeoutError as error:
         assert error.message == "Request timed out."
+
+
+def test_client_headers():
+    """Tests that extra static headers of a client are sent along with the default headers."""
+    client = EasyPostClient(api_key="123", headers={"X-Request-Source": "tracker-poller"})
+
+    _, headers, _ = Requestor(client)._prepare_request(url="/trackers")
+
+    assert headers["X-Request-Source"] == "tracker-poller"
+    assert headers["Authorization"] == "Bearer 123"
+    assert headers["User-Agent"] == get_user_agent()
+
+
+@patch("platform.uname")
+def test_user_agent_is_cached(mock_uname):
+    """Tests that the User-Agent is built once and reused by every request."""
+    get_user_agent.cache_clear()
+    mock_uname.return_value = ("Linux", "host", "6.0", "#1", "x86_64")
+    requestor = Requestor(EasyPostClient(api_key="123"))
+
+    user_agents = {requestor._prepare_request(url="/trackers")[1]["User-Agent"] for _ in range(3)}
+
+    assert mock_uname.call_count == 1
+    assert user_agents == {get_user_agent()}
+    assert "OS/Linux OSVersion/6.0 OSArch/x86_64" in get_user_agent()
+    get_user_agent.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "conversion_mode, object_class",
+    [("eager", Shipment), ("lazy", Shipment), (ConversionMode.COMPACT, CompactEasyPostObject)],
+)
+def test_client_conversion_mode(conversion_mode, object_class):
+    """Tests that responses are converted according to the conversion mode of the client."""
+    response = {"id": "shp_123", "object": "Shipment", "postage_label": {"label_url": "https://example.com"}}
+    client = EasyPostClient(
+        api_key="123",
+        transport=InMemoryTransport(responses=[(200, response)]),
+        conversion_mode=conversion_mode,
+    )
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert client.conversion_mode == ConversionMode(conversion_mode)
+    assert type(shipment) is object_class
+    assert shipment.postage_label.label_url == "https://example.com"
+
+
+def test_client_invalid_conversion_mode():
+    """Tests that we raise an error when an invalid conversion mode is passed to the client."""
+    with pytest.raises(InvalidParameterError) as error:
+        EasyPostClient(api_key="123", conversion_mode="sloppy")
+
+    assert error.value.message == "Invalid conversion_mode value, must be one of: ['eager', 'lazy', 'compact']"
+
+
+@pytest.mark.parametrize("conversion_mode", ["eager", "lazy", "compact"])
+def test_client_conversion_mode_services(conversion_mode):
+    """Tests that services reading fields of their responses work in every conversion mode, including fields named
+    like the methods of a `CompactEasyPostObject`.
+    """
+    api_keys_response = {
+        "id": "user_123",
+        "keys": [{"object": "ApiKey", "key": "parent_key"}],
+        "children": [{"id": "user_456", "keys": [{"object": "ApiKey", "key": "child_key"}], "children": []}],
+    }
+    payment_methods_response = {
+        "id": "cust_123",
+        "object": "PaymentMethod",
+        "primary_payment_method": {"id": "card_123"},
+        "secondary_payment_method": None,
+    }
+    transport = InMemoryTransport(
+        responses=[
+            (200, api_keys_response),
+            (200, api_keys_response),
+            (200, payment_methods_response),
+            (200, {}),
+        ]
+    )
+    client = EasyPostClient(api_key="123", transport=transport, conversion_mode=conversion_mode)
+
+    child_keys = client.user.api_keys("user_456")
+    parent_keys = client.user.api_keys("user_123")
+    client.billing.fund_wallet(amount="2000")
+
+    assert [api_key["key"] for api_key in child_keys] == ["child_key"]
+    assert [api_key["key"] for api_key in parent_keys] == ["parent_key"]
+    assert transport.requests[-1]["url"].endswith("/credit_cards/card_123/charges")
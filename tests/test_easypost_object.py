@@ -0,0 +1,162 @@
+import copy
+import json
+import pickle
+
+import pytest
+from easypost.easypost_object import (
+    EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP,
+    OBJECT_CLASS_NAME_OVERRIDES,
+    CompactEasyPostObject,
+    EasyPostObject,
+    convert_to_compact_easypost_object,
+    convert_to_easypost_object,
+)
+from easypost.models import (
+    Address,
+    PostageLabel,
+    Rate,
+    Report,
+    Shipment,
+)
+from easypost.requestor import Requestor
+from easypost.util import get_lowest_object_rate
+
+
+@pytest.mark.parametrize("prefix, class_name", EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.items())
+def test_convert_to_easypost_object_id_prefix(prefix, class_name):
+    """Tests that the ID prefix of an object is used to find its model class."""
+    obj = convert_to_easypost_object(response={"id": f"{prefix}_123"})
+
+    assert type(obj).__name__ == class_name
+
+
+@pytest.mark.parametrize("object_type", OBJECT_CLASS_NAME_OVERRIDES.keys())
+def test_convert_to_easypost_object_object_type(object_type):
+    """Tests that objects without an ID use their object type to find their model class."""
+    obj = convert_to_easypost_object(response={"object": object_type})
+
+    assert isinstance(obj, Report)
+
+
+def test_convert_to_easypost_object_unknown_class():
+    """Tests that objects of an unknown class are converted into a plain EasyPostObject."""
+    assert type(convert_to_easypost_object(response={"id": "unknown_123"})) is EasyPostObject
+    assert type(convert_to_easypost_object(response={"object": "Shipment"})) is EasyPostObject
+    assert type(convert_to_easypost_object(response={"foo": "bar"})) is EasyPostObject
+
+
+def test_convert_to_easypost_object_nested():
+    """Tests that nested dicts and lists are converted into their model classes."""
+    shipment = convert_to_easypost_object(
+        response={
+            "id": "shp_123",
+            "to_address": {"id": "adr_123"},
+            "rates": [{"id": "rate_123"}, {"id": "rate_456"}],
+            "options": {"label_format": "PNG"},
+        }
+    )
+
+    assert isinstance(shipment, Shipment)
+    assert isinstance(shipment.to_address, Address)
+    assert all(isinstance(rate, Rate) for rate in shipment.rates)
+    assert type(shipment.options) is EasyPostObject
+    assert shipment.to_address._parent is shipment
+
+
+SHIPMENT_RESPONSE = {
+    "id": "shp_123",
+    "object": "Shipment",
+    "to_address": {"id": "adr_123", "city": "Redondo Beach"},
+    "rates": [
+        {"id": "rate_123", "carrier": "USPS", "service": "First", "rate": "5.50"},
+        {"id": "rate_456", "carrier": "USPS", "service": "Priority", "rate": "7.10"},
+    ],
+    "tags": ["a", "b"],
+    "insurance": None,
+}
+
+
+def test_compact_easypost_object_attributes():
+    """Tests that a compact object exposes the fields of a response as attributes and items."""
+    shipment = convert_to_compact_easypost_object(response=SHIPMENT_RESPONSE)
+
+    assert isinstance(shipment, CompactEasyPostObject)
+    assert shipment.id == "shp_123"
+    assert shipment["object"] == "Shipment"
+    assert shipment.to_address.city == "Redondo Beach"
+    assert shipment.rates[1].service == "Priority"
+    assert shipment.tags == ["a", "b"]
+    assert shipment.insurance is None
+    assert shipment.get("missing", "default") == "default"
+    assert "rates" in shipment
+    assert shipment.keys() == list(SHIPMENT_RESPONSE.keys())
+
+    with pytest.raises(AttributeError) as error:
+        shipment.missing
+
+    assert str(error.value) == "CompactEasyPostObject object has no attribute missing"
+
+
+def test_compact_easypost_object_lazy_children():
+    """Tests that nested objects are only wrapped once they are accessed, and only once."""
+    shipment = convert_to_compact_easypost_object(response=SHIPMENT_RESPONSE)
+
+    assert shipment._children is None
+    assert shipment.to_address is shipment.to_address
+    assert list(shipment._children) == ["to_address"]
+    assert not hasattr(shipment, "__dict__")
+
+
+def test_compact_easypost_object_serialization():
+    """Tests that compact objects serialize to the response they were built from."""
+    shipment = convert_to_compact_easypost_object(response=SHIPMENT_RESPONSE)
+    shipment.rates
+
+    assert shipment.to_dict() == SHIPMENT_RESPONSE
+    assert shipment.to_dict() is not SHIPMENT_RESPONSE
+    assert json.loads(shipment.to_json()) == SHIPMENT_RESPONSE
+    assert shipment.to_json(indent=2) == str(shipment)
+    assert shipment == convert_to_compact_easypost_object(response=copy.deepcopy(SHIPMENT_RESPONSE))
+    assert pickle.loads(pickle.dumps(shipment)) == shipment
+    assert copy.copy(shipment).rates[0].id == "rate_123"
+
+
+def test_compact_easypost_object_helpers():
+    """Tests that compact objects can be used with the lowest rate helpers and as request params."""
+    shipment = convert_to_compact_easypost_object(response=SHIPMENT_RESPONSE)
+
+    assert get_lowest_object_rate(shipment).id == "rate_123"
+    assert Requestor._objects_to_ids({"shipment": shipment}) == {"shipment": {"id": "shp_123"}}
+
+
+def test_convert_to_easypost_object_lazy():
+    """Tests that lazily converted objects convert nested objects on first access and cache them."""
+    response = copy.deepcopy(SHIPMENT_RESPONSE)
+    response["postage_label"] = {"id": "pl_123", "label_url": "https://example.com/label.png"}
+    shipment = convert_to_easypost_object(response=response, lazy=True)
+
+    assert isinstance(shipment, Shipment)
+    assert shipment.id == "shp_123"
+    assert "postage_label" not in shipment.__dict__
+
+    assert isinstance(shipment.postage_label, PostageLabel)
+    assert shipment.postage_label.label_url == "https://example.com/label.png"
+    assert shipment.postage_label is shipment["postage_label"]
+    assert shipment.postage_label._parent is shipment
+    assert "rates" not in shipment.__dict__
+
+    assert get_lowest_object_rate(shipment).id == "rate_123"
+    assert shipment.get("missing") is None
+    with pytest.raises(AttributeError):
+        shipment.missing
+
+
+def test_convert_to_easypost_object_lazy_serialization():
+    """Tests that lazily converted objects serialize exactly like eagerly converted objects."""
+    eager_shipment = convert_to_easypost_object(response=SHIPMENT_RESPONSE)
+    lazy_shipment = convert_to_easypost_object(response=SHIPMENT_RESPONSE, lazy=True)
+
+    assert lazy_shipment.to_dict() == eager_shipment.to_dict()
+    assert str(lazy_shipment) == str(eager_shipment)
+    assert lazy_shipment == eager_shipment
+    assert pickle.loads(pickle.dumps(lazy_shipment)) == eager_shipment
@@ -0,0 +1,217 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    InvalidRequestError,
+    TimeoutError,
+)
+from easypost.idempotency import IdempotencyJournal
+from easypost.retry_policy import RetryPolicy
+from tests.helpers import (
+    InMemoryAsyncTransport,
+    InMemoryTransport,
+)
+
+
+UNAVAILABLE_RESPONSE = (503, {"error": {"code": "SERVICE_UNAVAILABLE", "message": "unavailable"}})
+INVALID_RESPONSE = (422, {"error": {"code": "SHIPMENT.POSTAGE.FAILURE", "message": "invalid rate"}})
+SHIPMENT_RESPONSE = (200, {"id": "shp_123", "object": "Shipment", "tracking_code": "9400"})
+
+
+def test_buy_retries_reuse_idempotency_key():
+    """Tests that a purchase retried by the retry policy sends the same generated idempotency key every time."""
+    transport = InMemoryTransport(responses=[UNAVAILABLE_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    shipment = client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert shipment.id == "shp_123"
+    assert len(transport.requests) == 2
+    idempotency_keys = [request["headers"]["Idempotency-Key"] for request in transport.requests]
+    assert idempotency_keys[0] == idempotency_keys[1]
+
+
+def test_buy_without_retries_has_no_idempotency_key():
+    """Tests that purchases are sent without an idempotency key when nothing needs one."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport)
+
+    client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert "Idempotency-Key" not in transport.requests[0]["headers"]
+
+
+def test_request_options_idempotency_key():
+    """Tests that the idempotency key of a `request_options` block is sent."""
+    transport = InMemoryTransport(responses=[(200, {"id": "pickup_123", "object": "Pickup"})])
+    client = EasyPostClient("123", transport=transport)
+
+    with client.request_options(idempotency_key="my-key"):
+        client.pickup.buy("pickup_123", carrier="USPS", service="NextDay")
+
+    assert transport.requests[0]["headers"]["Idempotency-Key"] == "my-key"
+
+
+def test_request_options_idempotency_key_only_sent_with_purchases():
+    """Tests that the idempotency key of a `request_options` block is only sent with the purchase of the block, so
+    its other requests are not made retry-safe with it.
+    """
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE, SHIPMENT_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport)
+
+    with client.request_options(idempotency_key="my-key"):
+        client.shipment.create(to_address={"id": "adr_123"})
+        client.shipment.retrieve("shp_123")
+        client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert [request["headers"].get("Idempotency-Key") for request in transport.requests] == [None, None, "my-key"]
+
+
+def test_request_options_idempotency_key_not_retry_safe():
+    """Tests that requests other than purchases are not retried after a timeout because of an idempotency key."""
+    transport = InMemoryTransport(responses=[socket.timeout("timed out"), SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with client.request_options(idempotency_key="my-key"):
+        with pytest.raises(TimeoutError):
+            client.shipment.create(to_address={"id": "adr_123"})
+
+    assert len(transport.requests) == 1
+
+
+def test_idempotency_journal_resumes_purchase(tmp_path):
+    """Tests that a purchase interrupted before its response is resumed with the same key by another client,
+    and that a completed purchase is answered from the journal.
+    """
+    path = str(tmp_path / "journal.sqlite3")
+    crashed_transport = InMemoryTransport(responses=[socket.timeout("timed out")])
+    crashed_client = EasyPostClient("123", transport=crashed_transport, idempotency_journal=IdempotencyJournal(path))
+
+    with pytest.raises(TimeoutError):
+        crashed_client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, idempotency_journal=IdempotencyJournal(path))
+    shipment = client.shipment.buy("shp_123", rate={"id": "rate_123"})
+    replayed_shipment = client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert shipment.tracking_code == "9400"
+    assert replayed_shipment.tracking_code == "9400"
+    assert len(transport.requests) == 1
+    assert (
+        transport.requests[0]["headers"]["Idempotency-Key"]
+        == crashed_transport.requests[0]["headers"]["Idempotency-Key"]
+    )
+
+
+def test_idempotency_journal_discards_rejected_purchase():
+    """Tests that a purchase rejected by the API is sent with a new key the next time it is made."""
+    transport = InMemoryTransport(responses=[INVALID_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, idempotency_journal=IdempotencyJournal())
+
+    with pytest.raises(InvalidRequestError):
+        client.shipment.buy("shp_123", rate={"id": "rate_123"})
+    client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert len(transport.requests) == 2
+    assert transport.requests[0]["headers"]["Idempotency-Key"] != transport.requests[1]["headers"]["Idempotency-Key"]
+
+
+def test_idempotency_journal_fingerprint():
+    """Tests that requests are told apart by their API key, method, URL, and params."""
+    fingerprint = IdempotencyJournal.fingerprint("123", "post", "/shipments/shp_1/buy", {"rate": {"id": "rate_1"}})
+
+    assert fingerprint == IdempotencyJournal.fingerprint(
+        "123", "post", "/shipments/shp_1/buy", {"rate": {"id": "rate_1"}}
+    )
+    assert fingerprint != IdempotencyJournal.fingerprint(
+        "456", "post", "/shipments/shp_1/buy", {"rate": {"id": "rate_1"}}
+    )
+    assert fingerprint != IdempotencyJournal.fingerprint(
+        "123", "post", "/shipments/shp_1/buy", {"rate": {"id": "rate_2"}}
+    )
+
+
+def test_idempotency_journal_expiry():
+    """Tests that expired entries are forgotten."""
+    journal = IdempotencyJournal(ttl=-1)
+
+    first_key, _ = journal.begin("fingerprint")
+    second_key, _ = journal.begin("fingerprint")
+
+    assert first_key != second_key
+
+
+def test_async_idempotency_journal():
+    """Tests that the async client answers completed purchases from the idempotency journal."""
+    transport = InMemoryAsyncTransport(responses=[SHIPMENT_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport, idempotency_journal=IdempotencyJournal()) as client:
+            first_shipment = await client.shipment.buy("shp_123", rate={"id": "rate_123"})
+            second_shipment = await client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+        return first_shipment, second_shipment
+
+    first_shipment, second_shipment = asyncio.run(run())
+
+    assert first_shipment.id == second_shipment.id == "shp_123"
+    assert transport.responses == []
+
+
+def test_idempotency_journal_create_and_buy():
+    """Tests that identical `create_and_buy` calls made on purpose are all sent, and are only answered from the
+    journal when made with the same idempotency key.
+    """
+    batch_response = (200, {"id": "batch_123", "object": "Batch"})
+    transport = InMemoryTransport(responses=[batch_response] * 4)
+    client = EasyPostClient("123", transport=transport, idempotency_journal=IdempotencyJournal())
+
+    client.batch.create_and_buy(shipments=[{"id": "shp_123"}])
+    client.batch.create_and_buy(shipments=[{"id": "shp_123"}])
+
+    assert len(transport.requests) == 2
+
+    for _ in range(2):
+        with client.request_options(idempotency_key="batch-key"):
+            client.batch.create_and_buy(shipments=[{"id": "shp_123"}])
+    with client.request_options(idempotency_key="other-batch-key"):
+        client.batch.create_and_buy(shipments=[{"id": "shp_123"}])
+
+    assert [request["headers"].get("Idempotency-Key") for request in transport.requests[2:]] == [
+        "batch-key",
+        "other-batch-key",
+    ]
+
+
+def test_async_idempotency_journal_off_event_loop():
+    """Tests that the async client calls the idempotency journal from an executor instead of the event loop."""
+
+    class ThreadRecordingJournal(IdempotencyJournal):
+        def __init__(self):
+            super().__init__()
+            self.threads = set()
+
+        def begin(self, fingerprint, idempotency_key=None):
+            self.threads.add(threading.get_ident())
+            return super().begin(fingerprint=fingerprint, idempotency_key=idempotency_key)
+
+        def complete(self, fingerprint, response):
+            self.threads.add(threading.get_ident())
+            super().complete(fingerprint=fingerprint, response=response)
+
+    journal = ThreadRecordingJournal()
+    transport = InMemoryAsyncTransport(responses=[SHIPMENT_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport, idempotency_journal=journal) as client:
+            return await client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    shipment = asyncio.run(run())
+
+    assert shipment.id == "shp_123"
+    assert len(journal.threads) >= 1 and threading.get_ident() not in journal.threads
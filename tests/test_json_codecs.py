@@ -0,0 +1,206 @@
+import json
+import sys
+
+import pytest
+from easypost.easypost_client import EasyPostClient
+from easypost.easypost_object import (
+    convert_to_compact_easypost_object,
+    convert_to_easypost_object,
+)
+from easypost.errors import (
+    InvalidRequestError,
+    JsonError,
+)
+from easypost.json_codecs import (
+    JsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    default_json_codec,
+)
+from easypost.requestor import (
+    RequestMethod,
+    Requestor,
+)
+from easypost.transports import (
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+SHIPMENT = {"id": "shp_123", "object": "Shipment", "tracking_code": "9400"}
+
+
+class BytesTransport(Transport):
+    """A transport that returns response bodies as the bytes received, like the built-in transports."""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, method, url, headers, params, body, timeout):
+        status, body = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(body).encode(), status=status, headers={})
+
+
+class ObjectReferenceTransport(Transport):
+    """A transport that records the bodies it receives and encodes object references itself."""
+
+    encodes_object_references = True
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.bodies = []
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.bodies.append(body)
+        status, body = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(body), status=status, headers={})
+
+
+class CountingJsonCodec(StdlibJsonCodec):
+    """A codec that records what it decodes."""
+
+    def __init__(self):
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+@pytest.mark.parametrize("codec_class", [StdlibJsonCodec, OrjsonJsonCodec])
+def test_json_codecs(codec_class):
+    """Tests that every codec decodes strings and bytes, and encodes bytes values as strings."""
+    if codec_class is OrjsonJsonCodec:
+        pytest.importorskip("orjson")
+    codec = codec_class()
+
+    assert codec.loads('{"id": "shp_123"}') == {"id": "shp_123"}
+    assert codec.loads('{"name": "Zoë"}'.encode()) == {"name": "Zoë"}
+    assert json.loads(codec.dumps({"name": "Zoë", "token": b"tok_123"})) == {"name": "Zoë", "token": "tok_123"}
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>")
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_stdlib_json_codec_object_references():
+    """Tests that encoding params in a single pass matches encoding them once their objects are replaced by IDs."""
+    params = {
+        "batch": {
+            "shipments": [convert_to_easypost_object({"id": f"shp_{i}", "object": "Shipment"}) for i in range(3)]
+            + [{"to_address": convert_to_compact_easypost_object({"id": "adr_123", "object": "Address"})}],
+            "reference": "Zoë",
+        },
+    }
+
+    encoded = StdlibJsonCodec().dumps(params)
+
+    assert encoded == json.dumps(Requestor._objects_to_ids(params)).encode()
+
+
+def test_orjson_json_codec_object_references():
+    """Tests that orjson encodes objects as references to their IDs."""
+    pytest.importorskip("orjson")
+    params = {"trackers": [convert_to_easypost_object({"id": "trk_123", "object": "Tracker"})]}
+
+    assert json.loads(OrjsonJsonCodec().dumps(params)) == {"trackers": [{"id": "trk_123"}]}
+
+
+def test_body_is_not_copied_for_encoding_transports():
+    """Tests that params reach a transport encoding object references as-is, and other transports as a copy with
+    objects replaced by their IDs.
+    """
+    shipments = [convert_to_easypost_object({"id": "shp_123", "object": "Shipment"})]
+    transport = ObjectReferenceTransport(responses=[(200, {"id": "batch_123", "object": "Batch"})])
+    EasyPostClient("123", transport=transport).batch.create(shipments=shipments)
+
+    assert transport.bodies[0]["batch"]["shipments"] is shipments
+
+    transport = ObjectReferenceTransport(responses=[(200, {"id": "batch_123", "object": "Batch"})])
+    transport.encodes_object_references = False
+    EasyPostClient("123", transport=transport).batch.create(shipments=shipments)
+
+    assert transport.bodies[0] == {"batch": {"shipments": [{"id": "shp_123"}]}}
+
+
+def test_default_json_codec(monkeypatch):
+    """Tests that the default codec is the standard library's whether or not orjson is installed."""
+    assert isinstance(default_json_codec(), StdlibJsonCodec)
+    assert isinstance(EasyPostClient("123").json_codec, StdlibJsonCodec)
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    assert isinstance(default_json_codec(), StdlibJsonCodec)
+    with pytest.raises(ImportError):
+        OrjsonJsonCodec()
+
+
+def test_client_json_codec():
+    """Tests that responses are decoded by the codec of the client straight from the bytes of the transport."""
+    codec = CountingJsonCodec()
+    client = EasyPostClient("123", transport=BytesTransport(responses=[(200, SHIPMENT)]), json_codec=codec)
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert shipment.tracking_code == "9400"
+    assert isinstance(codec.decoded[0], bytes)
+    assert isinstance(client.json_codec, JsonCodec)
+
+
+def test_json_codec_errors():
+    """Tests that invalid bodies raise a `JsonError`, and that errors carry the body as a string."""
+    transport = BytesTransport(responses=[(422, {"error": {"code": "INVALID", "message": "invalid"}})])
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(InvalidRequestError) as error:
+        client.shipment.retrieve("shp_123")
+
+    assert error.value.http_body == '{"error": {"code": "INVALID", "message": "invalid"}}'
+    assert error.value.code == "INVALID"
+
+    transport = Transport()
+    transport.request = lambda *args, **kwargs: TransportResponse(body=b"<html>", status=200, headers={})
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(JsonError) as json_error:
+        client.shipment.retrieve("shp_123")
+
+    assert "<html>" in json_error.value.message
+
+
+def test_response_hook_body_is_decoded():
+    """Tests that subscribers of the response hook receive the body as a string."""
+    response_bodies = []
+    client = EasyPostClient("123", transport=BytesTransport(responses=[(200, SHIPMENT)]))
+    client.subscribe_to_response_hook(lambda **kwargs: response_bodies.append(kwargs["response_body"]))
+
+    client.shipment.retrieve("shp_123")
+
+    assert response_bodies == [json.dumps(SHIPMENT)]
+
+
+def test_requests_transport_encodes_with_json_codec(monkeypatch):
+    """Tests that the requests transport encodes bodies with its codec and returns the bytes it receives."""
+    sent = {}
+
+    class Result:
+        content = b'{"id": "shp_123"}'
+        status_code = 200
+        headers = {}
+
+    transport = RequestsTransport(json_codec=StdlibJsonCodec())
+    monkeypatch.setattr(transport.session, "request", lambda **kwargs: sent.update(kwargs) or Result())
+
+    response = transport.request(
+        method=RequestMethod.POST,
+        url="https://api.easypost.com/v2/shipments",
+        headers={"Authorization": "Bearer 123"},
+        params=None,
+        body={"shipment": {"reference": "Zoë"}},
+        timeout=60,
+    )
+
+    assert sent["data"] == json.dumps({"shipment": {"reference": "Zoë"}}).encode()
+    assert sent["headers"]["Content-Type"] == "application/json"
+    assert response.body == b'{"id": "shp_123"}'
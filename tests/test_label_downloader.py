@@ -0,0 +1,264 @@
+import io
+import mmap
+import os
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from typing import (
+    Dict,
+    List,
+)
+
+import pytest
+from easypost.easypost_client import EasyPostClient
+from easypost.easypost_object import convert_to_easypost_object
+from easypost.errors import (
+    InvalidObjectError,
+    InvalidParameterError,
+    NotFoundError,
+)
+from easypost.label_downloader import LabelDownloader
+from easypost.transports import (
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+ZPL_LABELS = {f"/files/label_{i}.zpl": f"^XA^FO50,50^FDShipment {i}^FS^XZ\n".encode() * 200 for i in range(4)}
+
+
+class LabelHandler(BaseHTTPRequestHandler):
+    """Serves the label files of `files`, recording the headers of each request."""
+
+    files: Dict[str, bytes] = {}
+    headers_received: List[Dict[str, str]] = []
+
+    def do_GET(self):
+        self.headers_received.append(dict(self.headers))
+        body = self.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            body = b"<Error><Code>NoSuchKey</Code></Error>"
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def label_server():
+    LabelHandler.files = dict(ZPL_LABELS)
+    LabelHandler.headers_received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LabelHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def label_client():
+    return EasyPostClient("123", transport=RequestsTransport())
+
+
+def test_download_connection_pool(label_server):
+    """Tests that labels are downloaded from hosts other than the API over a pool configured like the API's."""
+    transport = RequestsTransport(base_url="https://api.easypost.com", pool_maxsize=16, max_retries=5)
+    downloads = list(
+        LabelDownloader(EasyPostClient("123", transport=transport), concurrency=16).download(
+            [f"{label_server}/files/label_{i}.zpl" for i in range(4)]
+        )
+    )
+
+    label_adapter = transport.session.get_adapter(f"{label_server}/files/label_0.zpl")
+    api_adapter = transport.session.get_adapter("https://api.easypost.com/v2/shipments")
+
+    assert all(download.succeeded for download in downloads)
+    assert label_adapter is not api_adapter
+    assert label_adapter is transport.session.get_adapter("https://easypost-files.s3.amazonaws.com/label.pdf")
+    assert label_adapter._pool_maxsize == api_adapter._pool_maxsize == 16
+    assert label_adapter.max_retries.total == 5
+    assert len(label_adapter.poolmanager.pools) == 1
+
+
+def make_pdf(pages):
+    pypdf = pytest.importorskip("pypdf")
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=288, height=432)
+    pdf = io.BytesIO()
+    writer.write(pdf)
+
+    return pdf.getvalue()
+
+
+def test_download_labels_to_directory(label_server, label_client, tmp_path):
+    """Tests that labels of Shipments, Batches, and URLs are streamed to a directory, reporting their progress."""
+    labels = [
+        convert_to_easypost_object(
+            {"id": "shp_0", "object": "Shipment", "postage_label": {"label_url": f"{label_server}/files/label_0.zpl"}}
+        ),
+        convert_to_easypost_object(
+            {"id": "batch_1", "object": "Batch", "label_url": f"{label_server}/files/label_1.zpl"}
+        ),
+        f"{label_server}/files/label_2.zpl",
+    ]
+    progress = []
+    downloader = LabelDownloader(
+        label_client,
+        concurrency=2,
+        chunk_size=1024,
+        progress=lambda download: progress.append((download.index, download.size)),
+    )
+
+    downloads = sorted(downloader.download(labels, directory=str(tmp_path)), key=lambda download: download.index)
+
+    assert all(download.succeeded for download in downloads)
+    for index, download in enumerate(downloads):
+        assert download.path == os.path.join(str(tmp_path), f"{index:05d}_label_{index}.zpl")
+        with open(download.path, "rb") as label_file:
+            assert label_file.read() == ZPL_LABELS[f"/files/label_{index}.zpl"]
+    assert downloads[1].label.id == "batch_1"
+    assert downloader.stats == {"downloaded": 3, "failed": 0, "bytes": sum(download.size for download in downloads)}
+    # Chunks are reported as they are written
+    sizes = [size for index, size in progress if index == 0]
+    assert sizes == sorted(sizes) and len(sizes) > 1 and sizes[-1] == downloads[0].size
+    # Label files are not sent the API key
+    assert all("Authorization" not in headers for headers in LabelHandler.headers_received)
+
+
+def test_download_labels_to_memory(label_server, label_client):
+    """Tests that labels downloaded without a directory are memory mapped."""
+    downloads = list(LabelDownloader(label_client).download([f"{label_server}/files/label_3.zpl"]))
+
+    download = downloads[0]
+    assert isinstance(download.buffer, mmap.mmap)
+    assert download.buffer[:] == ZPL_LABELS["/files/label_3.zpl"]
+    with download.open() as label_file:
+        assert label_file.read() == ZPL_LABELS["/files/label_3.zpl"]
+    download.close()
+    assert download.buffer is None
+
+
+def test_download_label_errors(label_server, label_client, tmp_path):
+    """Tests that failed downloads are reported on their result without stopping the others or leaving files."""
+    labels = [
+        f"{label_server}/files/missing.zpl",
+        convert_to_easypost_object({"id": "shp_123", "object": "Shipment", "postage_label": None}),
+        f"{label_server}/files/label_0.zpl",
+    ]
+    downloader = LabelDownloader(label_client)
+
+    downloads = sorted(downloader.download(labels, directory=str(tmp_path)), key=lambda download: download.index)
+
+    assert isinstance(downloads[0].error, NotFoundError)
+    assert downloads[0].error.http_status == 404
+    assert "NoSuchKey" in downloads[0].error.message
+    assert isinstance(downloads[1].error, InvalidObjectError)
+    assert "shp_123" in downloads[1].error.message
+    assert downloads[2].succeeded
+    assert os.listdir(str(tmp_path)) == ["00002_label_0.zpl"]
+    assert downloader.stats["failed"] == 2
+
+
+def test_download_shipment_labels_in_format(label_server, label_client):
+    """Tests that Shipment labels are downloaded in the format requested when it was generated."""
+    LabelHandler.files["/files/label.pdf"] = b"%PDF"
+    shipment = convert_to_easypost_object(
+        {
+            "id": "shp_123",
+            "object": "Shipment",
+            "postage_label": {
+                "label_url": f"{label_server}/files/label.png",
+                "label_pdf_url": f"{label_server}/files/label.pdf",
+            },
+        }
+    )
+
+    downloads = list(LabelDownloader(label_client).download([shipment], file_format="PDF"))
+
+    assert downloads[0].url.endswith("/files/label.pdf")
+    assert downloads[0].file_format == "pdf"
+    assert downloads[0].buffer[:] == b"%PDF"
+
+    downloads = list(LabelDownloader(label_client).download([shipment], file_format="zpl"))
+
+    assert isinstance(downloads[0].error, InvalidObjectError)
+
+
+def test_merge_zpl_labels(label_server, label_client, tmp_path):
+    """Tests that ZPL labels are concatenated in the order they were requested, skipping failed downloads."""
+    urls = [f"{label_server}/files/label_{i}.zpl" for i in [2, 0, 1]] + [f"{label_server}/files/missing.zpl"]
+    downloader = LabelDownloader(label_client, concurrency=4)
+
+    merged_path = downloader.merge(downloader.download(urls), path=str(tmp_path / "labels.zpl"))
+
+    with open(merged_path, "rb") as merged_file:
+        assert merged_file.read() == b"".join(ZPL_LABELS[f"/files/label_{i}.zpl"] for i in [2, 0, 1])
+
+
+@pytest.mark.parametrize("directory", [False, True])
+def test_merge_pdf_labels(label_server, label_client, tmp_path, directory):
+    """Tests that PDF labels are merged into a single document with `pypdf`."""
+    pypdf = pytest.importorskip("pypdf")
+    LabelHandler.files["/files/label_0.pdf"] = make_pdf(pages=1)
+    LabelHandler.files["/files/label_1.pdf"] = make_pdf(pages=2)
+    downloader = LabelDownloader(label_client)
+    downloads = list(
+        downloader.download(
+            [f"{label_server}/files/label_0.pdf", f"{label_server}/files/label_1.pdf"],
+            directory=str(tmp_path / "labels") if directory else None,
+        )
+    )
+
+    merged_path = downloader.merge(downloads, path=str(tmp_path / "labels.pdf"))
+
+    assert len(pypdf.PdfReader(merged_path).pages) == 3
+
+
+def test_merge_label_formats(label_server, label_client, tmp_path):
+    """Tests that labels of different formats, or of formats which cannot be merged, are not merged."""
+    LabelHandler.files["/files/label.pdf"] = b"%PDF"
+    LabelHandler.files["/files/label.png"] = b"\x89PNG"
+    downloader = LabelDownloader(label_client)
+
+    downloads = list(downloader.download([f"{label_server}/files/label.pdf", f"{label_server}/files/label_0.zpl"]))
+    with pytest.raises(InvalidParameterError) as error:
+        downloader.merge(downloads, path=str(tmp_path / "labels"))
+
+    assert error.value.message == "Labels of different formats cannot be merged: pdf, zpl"
+
+    downloads = list(downloader.download([f"{label_server}/files/label.png"]))
+    with pytest.raises(InvalidParameterError):
+        downloader.merge(downloads, path=str(tmp_path / "labels"))
+
+
+def test_transport_download_fallback():
+    """Tests that transports which cannot stream responses write the whole body they receive."""
+
+    class BufferedTransport(Transport):
+        def request(self, method, url, headers, params, body, timeout):
+            return TransportResponse(body=b"^XA^XZ" * 10, status=200, headers={})
+
+    chunks = []
+    destination = io.BytesIO()
+    destination.write = lambda chunk: chunks.append(chunk) or len(chunk)
+
+    response = BufferedTransport().download(
+        url="https://example.com/label.zpl",
+        headers={},
+        destination=destination,
+        timeout=5,
+        chunk_size=12,
+    )
+
+    assert response.status == 200
+    assert chunks == [b"^XA^XZ^XA^XZ"] * 5
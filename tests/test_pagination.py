@@ -0,0 +1,308 @@
+import asyncio
+import datetime
+import json
+import threading
+import time
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    InvalidParameterError,
+    MissingParameterError,
+    NotFoundError,
+)
+from easypost.models import (
+    Report,
+    Shipment,
+    Tracker,
+)
+from easypost.services.base_service import _partition_date_range
+from easypost.transports import (
+    Transport,
+    TransportResponse,
+)
+from tests.helpers import (
+    InMemoryAsyncTransport,
+    InMemoryTransport,
+)
+
+
+def shipments_page(ids, has_more):
+    """Build a page of a shipment list response."""
+    return 200, {"shipments": [{"id": id, "object": "Shipment"} for id in ids], "has_more": has_more}
+
+
+def test_iter_all():
+    """Tests that iterating over all shipments requests every page, including the last one."""
+    transport = InMemoryTransport(
+        responses=[
+            shipments_page(["shp_3", "shp_2"], has_more=True),
+            shipments_page(["shp_1"], has_more=False),
+        ]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = list(client.shipment.iter_all(page_size=2, purchased=False, include_children=True))
+
+    assert [shipment.id for shipment in shipments] == ["shp_3", "shp_2", "shp_1"]
+    assert all(isinstance(shipment, Shipment) for shipment in shipments)
+    assert [request["params"] for request in transport.requests] == [
+        {"page_size": 2, "purchased": False, "include_children": True},
+        {"page_size": 2, "purchased": False, "include_children": True, "before_id": "shp_2"},
+    ]
+
+
+def test_iter_all_is_lazy():
+    """Tests that the next page is only requested once the current page has been consumed."""
+    transport = InMemoryTransport(
+        responses=[
+            (200, {"trackers": [{"id": "trk_2"}, {"id": "trk_1"}], "has_more": True}),
+            (200, {"trackers": [], "has_more": False}),
+        ]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    trackers = client.tracker.iter_all(tracking_code="EZ1000000001", carrier="USPS")
+
+    assert len(transport.requests) == 0
+    assert isinstance(next(trackers), Tracker)
+    assert next(trackers).id == "trk_1"
+    assert len(transport.requests) == 1
+    assert list(trackers) == []
+    assert transport.requests[1]["params"] == {"tracking_code": "EZ1000000001", "carrier": "USPS", "before_id": "trk_1"}
+
+
+def test_iter_all_reports():
+    """Tests that iterating over reports uses the URL of the report type."""
+    transport = InMemoryTransport(
+        responses=[(200, {"reports": [{"id": "shprep_1", "object": "ShipmentReport"}], "has_more": False})]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    reports = list(client.report.iter_all(type="shipment"))
+
+    assert isinstance(reports[0], Report)
+    assert transport.requests[0]["url"] == "https://api.easypost.com/v2/reports/shipment"
+
+    with pytest.raises(MissingParameterError):
+        client.report.iter_all()
+
+
+def test_iter_all_referral_customers():
+    """Tests that iterating over referral customers uses the referral customers collection."""
+    transport = InMemoryTransport(
+        responses=[(200, {"referral_customers": [{"id": "user_1", "object": "User"}], "has_more": False})]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    referral_customers = list(client.referral_customer.iter_all(page_size=5))
+
+    assert [referral_customer.id for referral_customer in referral_customers] == ["user_1"]
+    assert transport.requests[0]["url"] == "https://api.easypost.com/v2/referral_customers"
+
+
+def test_async_iter_all():
+    """Tests that async clients can iterate over all objects of a collection with `async for`."""
+    transport = InMemoryAsyncTransport(
+        responses=[
+            shipments_page(["shp_3", "shp_2"], has_more=True),
+            shipments_page(["shp_1"], has_more=False),
+        ]
+    )
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport) as client:
+            return [shipment.id async for shipment in client.shipment.iter_all(page_size=2)]
+
+    assert asyncio.run(run()) == ["shp_3", "shp_2", "shp_1"]
+
+
+def wait_for(condition, timeout=2):
+    """Wait until a condition is true, failing the test if it is still false after the timeout."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_iter_all_prefetch():
+    """Tests that the next pages are requested in the background while the current page is being processed."""
+    transport = InMemoryTransport(
+        responses=[
+            shipments_page(["shp_5", "shp_4"], has_more=True),
+            shipments_page(["shp_3", "shp_2"], has_more=True),
+            shipments_page(["shp_1"], has_more=False),
+        ]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = client.shipment.iter_all(prefetch=2, page_size=2, purchased=True)
+
+    assert next(shipments).id == "shp_5"
+    wait_for(lambda: len(transport.requests) == 3)
+    assert [shipment.id for shipment in shipments] == ["shp_4", "shp_3", "shp_2", "shp_1"]
+    assert transport.requests[2]["params"] == {"page_size": 2, "purchased": True, "before_id": "shp_2"}
+
+
+def test_iter_all_prefetch_bounded():
+    """Tests that no more than `prefetch` pages are buffered ahead of the consumer."""
+    responses = [shipments_page([f"shp_{i}"], has_more=True) for i in range(10)]
+    transport = InMemoryTransport(responses=responses)
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = client.shipment.iter_all(prefetch=2)
+    next(shipments)
+    time.sleep(0.2)
+
+    # The consumed page, two buffered pages, and one page waiting for room in the buffer
+    assert len(transport.requests) == 4
+    shipments.close()
+
+
+def test_iter_all_prefetch_error():
+    """Tests that errors raised while prefetching a page are raised to the consumer."""
+    transport = InMemoryTransport(
+        responses=[
+            shipments_page(["shp_2"], has_more=True),
+            (404, {"error": {"code": "NOT_FOUND", "message": "not found"}}),
+        ]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = client.shipment.iter_all(prefetch=1)
+
+    assert next(shipments).id == "shp_2"
+    with pytest.raises(NotFoundError):
+        next(shipments)
+
+
+def test_async_iter_all_prefetch():
+    """Tests that async clients can prefetch pages in a background task."""
+    transport = InMemoryAsyncTransport(
+        responses=[
+            shipments_page(["shp_3", "shp_2"], has_more=True),
+            shipments_page(["shp_1"], has_more=False),
+        ]
+    )
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport) as client:
+            return [shipment.id async for shipment in client.shipment.iter_all(prefetch=2)]
+
+    assert asyncio.run(run()) == ["shp_3", "shp_2", "shp_1"]
+    assert transport.responses == []
+
+
+class DateRangeTransport(Transport):
+    """A transport that serves the trackers created in the date range of each request, one tracker per page."""
+
+    def __init__(self, trackers, barrier=None):
+        self.trackers = trackers
+        self.barrier = barrier
+        self.requests = []
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.requests.append(params)
+        if self.barrier and "before_id" not in params:
+            # Wait until the first page of every window has been requested at the same time
+            self.barrier.wait()
+
+        in_range = [
+            tracker
+            for tracker in self.trackers
+            if params["start_datetime"] <= tracker["created_at"] <= params["end_datetime"]
+        ]
+        if "before_id" in params:
+            next_index = [tracker["id"] for tracker in in_range].index(params["before_id"]) + 1
+            in_range = in_range[next_index:]
+
+        body = {"trackers": in_range[:1], "has_more": len(in_range) > 1}
+        return TransportResponse(body=json.dumps(body), status=200, headers={})
+
+
+TRACKERS = [
+    {"id": f"trk_{day}", "object": "Tracker", "created_at": f"2023-01-{day:02d}T12:00:00Z"} for day in range(31, 0, -1)
+] + [{"id": "trk_boundary", "object": "Tracker", "created_at": "2023-01-16T12:00:00Z"}]
+TRACKERS.sort(key=lambda tracker: tracker["created_at"], reverse=True)
+
+
+def test_partition_date_range():
+    """Tests that a date range is split into contiguous windows, newest first."""
+    windows = _partition_date_range("2023-01-01T00:00:00Z", datetime.datetime(2023, 1, 31), 3)
+
+    assert windows == [
+        ("2023-01-21T00:00:00Z", "2023-01-31T00:00:00Z"),
+        ("2023-01-11T00:00:00Z", "2023-01-21T00:00:00Z"),
+        ("2023-01-01T00:00:00Z", "2023-01-11T00:00:00Z"),
+    ]
+    # Boundaries are converted to UTC and rounded to the second without creating empty windows
+    assert _partition_date_range("2023-01-01T00:00:00+02:00", "2022-12-31T22:00:01.5Z", 5) == [
+        ("2022-12-31T22:00:01Z", "2022-12-31T22:00:02Z"),
+        ("2022-12-31T22:00:00Z", "2022-12-31T22:00:01Z"),
+    ]
+
+    with pytest.raises(InvalidParameterError):
+        _partition_date_range("2023-01-31", "2023-01-01", 2)
+    with pytest.raises(InvalidParameterError):
+        _partition_date_range("2023-01-01", "2023-01-31", 0)
+
+
+def test_iter_all_in_parallel():
+    """Tests that the windows of a date range are paged through concurrently and merged newest first."""
+    transport = DateRangeTransport(trackers=TRACKERS, barrier=threading.Barrier(2, timeout=2))
+    client = EasyPostClient("123", transport=transport)
+
+    trackers = list(
+        client.tracker.iter_all_in_parallel(
+            start_datetime="2023-01-01T00:00:00Z",
+            end_datetime="2023-02-01T00:00:00Z",
+            partitions=2,
+            carrier="USPS",
+        )
+    )
+
+    assert [tracker.id for tracker in trackers] == [tracker["id"] for tracker in TRACKERS]
+    assert all(isinstance(tracker, Tracker) for tracker in trackers)
+    assert all(params["carrier"] == "USPS" for params in transport.requests)
+
+
+def test_iter_all_in_parallel_unordered():
+    """Tests that unordered parallel iteration yields every object once."""
+    transport = DateRangeTransport(trackers=TRACKERS)
+    client = EasyPostClient("123", transport=transport)
+
+    trackers = client.tracker.iter_all_in_parallel(
+        start_datetime=datetime.datetime(2023, 1, 1),
+        end_datetime=datetime.datetime(2023, 2, 1),
+        partitions=4,
+        ordered=False,
+    )
+
+    assert sorted(tracker.id for tracker in trackers) == sorted(tracker["id"] for tracker in TRACKERS)
+
+
+def test_async_iter_all_in_parallel():
+    """Tests that async clients page through the windows of a date range concurrently."""
+    trackers_by_window = {
+        "2023-01-16T12:00:00Z": [{"id": "trk_2", "created_at": "2023-01-20T00:00:00Z"}],
+        "2023-01-01T00:00:00Z": [{"id": "trk_1", "created_at": "2023-01-10T00:00:00Z"}],
+    }
+
+    class WindowTransport(InMemoryAsyncTransport):
+        async def request(self, method, url, headers, params, body, timeout):
+            body = {"trackers": trackers_by_window[params["start_datetime"]], "has_more": False}
+            return TransportResponse(body=json.dumps(body), status=200, headers={})
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=WindowTransport(responses=[])) as client:
+            return [
+                tracker.id
+                async for tracker in client.tracker.iter_all_in_parallel(
+                    start_datetime="2023-01-01T00:00:00Z",
+                    end_datetime="2023-02-01T00:00:00Z",
+                    partitions=2,
+                )
+            ]
+
+    assert asyncio.run(run()) == ["trk_2", "trk_1"]
@@ -0,0 +1,307 @@
+import asyncio
+import json
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+)
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    RateLimitError,
+    TimeoutError,
+)
+from easypost.rate_limiter import RateLimiter
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+    TransportResponse,
+)
+from tests.helpers import FakeClock
+
+
+RATE_LIMIT_RESPONSE = (429, {"error": {"code": "RATE_LIMITED", "message": "rate limited"}}, {"Retry-After": "2"})
+SHIPMENT_RESPONSE: Tuple[int, Dict[str, Any], Dict[str, str]] = (200, {"id": "shp_123", "object": "Shipment"}, {})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("easypost.rate_limiter.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("easypost.rate_limiter.time.sleep", clock.sleep)
+
+    return clock
+
+
+class HeadersTransport(Transport):
+    """A transport that serves canned responses along with their headers."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = 0
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.requests += 1
+        status, body, response_headers = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(body), status=status, headers=response_headers)
+
+
+class AsyncHeadersTransport(AsyncTransport):
+    """An async transport that serves canned responses along with their headers."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = 0
+
+    async def request(self, method, url, headers, params, body, timeout):
+        self.requests += 1
+        status, body, response_headers = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(body), status=status, headers=response_headers)
+
+    async def close(self):
+        pass
+
+
+def test_rate_limiter_burst(clock):
+    """Tests that a burst of requests is sent at once and later requests wait for the bucket to refill."""
+    rate_limiter = RateLimiter(rate=2, burst=3)
+
+    for _ in range(5):
+        rate_limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+    assert clock.now == 101.0
+
+
+def test_rate_limiter_throttled_response(clock):
+    """Tests that a 429 decreases the rate and pauses every request for the duration of its Retry-After header."""
+    rate_limiter = RateLimiter(rate=10, decrease_factor=0.5)
+
+    rate_limiter.record_response(http_status=429, headers={"retry-after": "3"})
+
+    assert rate_limiter.state == {
+        "rate": 5.0,
+        "max_rate": 10,
+        "tokens": 0.0,
+        "paused_for": 3.0,
+        "throttled_responses": 1,
+    }
+
+    rate_limiter.acquire()
+
+    assert clock.sleeps[0] == 3.0
+    assert clock.now > 103.0
+
+
+def test_rate_limiter_decreases_once_per_interval(clock):
+    """Tests that throttled responses to requests that were in flight together only decrease the rate once."""
+    rate_limiter = RateLimiter(rate=8, min_rate=1)
+
+    for _ in range(4):
+        rate_limiter.record_response(http_status=503)
+
+    assert rate_limiter.state["rate"] == 4.0
+    assert rate_limiter.state["throttled_responses"] == 4
+
+    clock.now += 1
+    rate_limiter.record_response(http_status=429)
+    clock.now += 1
+    rate_limiter.record_response(http_status=429)
+    clock.now += 1
+    rate_limiter.record_response(http_status=429)
+
+    assert rate_limiter.state["rate"] == 1
+
+
+def test_rate_limiter_additive_increase(clock):
+    """Tests that successful responses raise the rate back up to its maximum."""
+    rate_limiter = RateLimiter(rate=4, min_rate=1, increase=1)
+    rate_limiter.record_response(http_status=429)
+    rate_limiter.record_response(http_status=200)
+
+    assert rate_limiter.state["rate"] == 2.5
+
+    for _ in range(20):
+        rate_limiter.record_response(http_status=200)
+
+    assert rate_limiter.state["rate"] == 4
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        (None, None),
+        ({}, None),
+        ({"Retry-After": "5"}, 5.0),
+        ({"retry-after": "1.5"}, 1.5),
+        ({"Retry-After": "-1"}, 0.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_rate_limiter_parse_retry_after(headers, expected):
+    """Tests that the Retry-After header is read in seconds or as an HTTP date."""
+    assert RateLimiter.parse_retry_after(headers) == expected
+
+
+def test_rate_limiter_parse_retry_after_future_date():
+    """Tests that a Retry-After HTTP date in the future is converted into the number of seconds until then."""
+    retry_after = RateLimiter.parse_retry_after({"Retry-After": "Fri, 01 Jan 9999 00:00:00 GMT"})
+
+    assert retry_after > 0
+
+
+def test_client_rate_limiter_retries_rate_limited_requests(clock):
+    """Tests that a client retries requests rejected with a 429 after the pause of the rate limiter."""
+    transport = HeadersTransport(responses=[RATE_LIMIT_RESPONSE, SHIPMENT_RESPONSE])
+    rate_limiter = RateLimiter(rate=10)
+    client = EasyPostClient("123", transport=transport, rate_limiter=rate_limiter)
+    hook_statuses = []
+    client.subscribe_to_response_hook(lambda **kwargs: hook_statuses.append(kwargs["http_status"]))
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert shipment.id == "shp_123"
+    assert transport.requests == 2
+    assert hook_statuses == [429, 200]
+    assert clock.sleeps[0] == 2.0
+
+
+def test_client_rate_limiter_max_retries(clock):
+    """Tests that the RateLimitError is raised once a request was rejected more than `max_retries` times."""
+    transport = HeadersTransport(responses=[RATE_LIMIT_RESPONSE] * 3)
+    client = EasyPostClient("123", transport=transport, rate_limiter=RateLimiter(max_retries=2))
+
+    with pytest.raises(RateLimitError):
+        client.shipment.retrieve("shp_123")
+
+    assert transport.requests == 3
+
+
+def test_client_without_rate_limiter_does_not_retry():
+    """Tests that requests are not retried when the client has no rate limiter."""
+    transport = HeadersTransport(responses=[RATE_LIMIT_RESPONSE])
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(RateLimitError):
+        client.shipment.retrieve("shp_123")
+
+    assert transport.requests == 1
+
+
+def test_async_client_rate_limiter(clock, monkeypatch):
+    """Tests that the async client waits for the rate limiter without blocking and retries rate limited requests."""
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr("easypost.rate_limiter.time.sleep", lambda seconds: pytest.fail("blocked the event loop"))
+    monkeypatch.setattr("easypost.rate_limiter.asyncio.sleep", fake_sleep)
+    transport = AsyncHeadersTransport(responses=[RATE_LIMIT_RESPONSE, SHIPMENT_RESPONSE])
+    rate_limiter = RateLimiter(rate=10)
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport, rate_limiter=rate_limiter) as client:
+            return await client.shipment.retrieve("shp_123")
+
+    shipment = asyncio.run(run())
+
+    assert shipment.id == "shp_123"
+    assert transport.requests == 2
+    assert rate_limiter.state["throttled_responses"] == 1
+    assert clock.now > 102.0
+
+
+def test_rate_limiter_deadline(clock):
+    """Tests that a paused rate limiter waits at most until the deadline of a request, then raises a timeout."""
+    rate_limiter = RateLimiter(rate=10)
+    rate_limiter.record_response(http_status=429, headers={"Retry-After": "5"})
+
+    with pytest.raises(TimeoutError) as error:
+        rate_limiter.acquire(deadline_at=clock.now + 0.5)
+
+    assert error.value.message == "Request deadline exceeded."
+    assert clock.sleeps == [0.5]
+
+
+def test_client_rate_limiter_deadline(clock):
+    """Tests that requests waiting for a paused rate limiter fail once the deadline of their block passes."""
+    transport = HeadersTransport(responses=[RATE_LIMIT_RESPONSE, SHIPMENT_RESPONSE])
+    rate_limiter = RateLimiter(rate=10, max_retries=0)
+    client = EasyPostClient("123", transport=transport, rate_limiter=rate_limiter)
+    with pytest.raises(RateLimitError):
+        client.shipment.retrieve("shp_123")
+
+    with client.request_options(deadline=0.5):
+        with pytest.raises(TimeoutError):
+            client.shipment.retrieve("shp_123")
+
+    assert transport.requests == 1
+    assert clock.sleeps == [0.5]
+
+
+def test_async_client_rate_limiter_deadline(clock, monkeypatch):
+    """Tests that async requests waiting for a paused rate limiter fail once the deadline of their block passes."""
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr("easypost.rate_limiter.asyncio.sleep", fake_sleep)
+    transport = AsyncHeadersTransport(responses=[SHIPMENT_RESPONSE])
+    rate_limiter = RateLimiter(rate=10)
+    rate_limiter.record_response(http_status=429, headers={"Retry-After": "5"})
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport, rate_limiter=rate_limiter) as client:
+            with client.request_options(deadline=0.5):
+                await client.shipment.retrieve("shp_123")
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+    assert transport.requests == 0
+    assert sleeps == [0.5]
+
+
+def test_referral_credit_card_bypasses_partner_rate_limiter(clock):
+    """Tests that the request made with the API key of a referral customer neither waits for nor throttles the rate
+    limiter of the partner's client.
+    """
+    transport = HeadersTransport(responses=[RATE_LIMIT_RESPONSE, (200, {"id": "card_123", "object": "CreditCard"}, {})])
+    rate_limiter = RateLimiter(rate=10)
+    rate_limiter.record_response(http_status=429, headers={"Retry-After": "5"})
+    client = EasyPostClient("partner_key", transport=transport, rate_limiter=rate_limiter)
+    state = rate_limiter.state
+
+    with pytest.raises(RateLimitError):
+        client.referral_customer._create_easypost_credit_card("referral_key", "tok_123")
+
+    credit_card = client.referral_customer._create_easypost_credit_card("referral_key", "tok_123")
+
+    assert credit_card["id"] == "card_123"
+    assert clock.sleeps == []
+    assert rate_limiter.state == state
+    assert client.rate_limiter is rate_limiter
+
+
+def test_async_referral_credit_card_bypasses_partner_rate_limiter(clock, monkeypatch):
+    """Tests that the async request made with the API key of a referral customer does not wait for the rate limiter of
+    the partner's client.
+    """
+    monkeypatch.setattr("easypost.rate_limiter.asyncio.sleep", lambda seconds: pytest.fail("waited for the partner"))
+    transport = AsyncHeadersTransport(responses=[(200, {"id": "card_123", "object": "CreditCard"}, {})])
+    rate_limiter = RateLimiter(rate=10)
+    rate_limiter.record_response(http_status=429, headers={"Retry-After": "5"})
+
+    async def run():
+        async with AsyncEasyPostClient("partner_key", transport=transport, rate_limiter=rate_limiter) as client:
+            return await client.referral_customer._create_easypost_credit_card("referral_key", "tok_123")
+
+    credit_card = asyncio.run(run())
+
+    assert credit_card["id"] == "card_123"
+    assert rate_limiter.state["throttled_responses"] == 1
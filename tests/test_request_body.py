@@ -0,0 +1,137 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from easypost.easypost_client import EasyPostClient
+from easypost.json_codecs import (
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+)
+from easypost.request_options import request_options
+from easypost.retry_policy import RetryPolicy
+from easypost.transports import (
+    AiohttpTransport,
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+)
+from easypost.transports.request_body import (
+    STREAM_CHUNK_SIZE,
+    encode_request_body,
+)
+
+
+TRACKERS = {"trackers": [{"tracking_code": f"EZ{i:010d}", "carrier": "USPS"} for i in range(5000)]}
+
+
+class EncodingTransport(Transport):
+    """A transport that encodes bodies like the built-in transports and records what would be sent."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def request(self, method, url, headers, params, body, timeout):
+        headers, data = self.encode_body(body=body, headers=headers)
+        self.requests.append((headers, data if isinstance(data, bytes) else b"".join(data)))
+        status, response_body = self.responses.pop(0)
+        return TransportResponse(body=json.dumps(response_body), status=status, headers={})
+
+
+def test_encode_request_body():
+    """Tests that bodies are encoded whole with a JSON content type by default."""
+    headers, data = encode_request_body(json_codec=StdlibJsonCodec(), body=TRACKERS, headers={"Accept": "*/*"})
+
+    assert data == json.dumps(TRACKERS).encode()
+    assert headers == {"Accept": "*/*", "Content-Type": "application/json"}
+
+
+def test_encode_request_body_streamed():
+    """Tests that streamed bodies are generated in chunks matching the whole body byte for byte."""
+    with request_options(stream_body=True):
+        headers, chunks = encode_request_body(json_codec=StdlibJsonCodec(), body=TRACKERS, headers={})
+    chunks = list(chunks)
+
+    assert b"".join(chunks) == json.dumps(TRACKERS).encode()
+    assert len(chunks) > 1
+    assert all(len(chunk) >= STREAM_CHUNK_SIZE for chunk in chunks[:-1])
+    assert "Content-Encoding" not in headers
+
+
+@pytest.mark.parametrize("stream_body", [False, True])
+def test_encode_request_body_compressed(stream_body):
+    """Tests that compressed bodies are gzip streams of the whole body, streamed or not."""
+    with request_options(stream_body=stream_body, compress_body=True):
+        headers, data = encode_request_body(json_codec=StdlibJsonCodec(), body=TRACKERS, headers={})
+
+    assert isinstance(data, bytes) is not stream_body
+    compressed_body = data if isinstance(data, bytes) else b"".join(data)
+    assert gzip.decompress(compressed_body) == json.dumps(TRACKERS).encode()
+    assert len(compressed_body) < len(json.dumps(TRACKERS)) / 5
+    assert headers["Content-Encoding"] == "gzip"
+
+
+def test_encode_request_body_without_streaming():
+    """Tests that bodies are encoded whole for transports which cannot stream them, and with codecs which cannot
+    encode incrementally.
+    """
+    with request_options(stream_body=True):
+        _, data = encode_request_body(json_codec=StdlibJsonCodec(), body=TRACKERS, headers={}, streaming=False)
+
+    assert data == json.dumps(TRACKERS).encode()
+
+    pytest.importorskip("orjson")
+    with request_options(stream_body=True):
+        _, chunks = encode_request_body(json_codec=OrjsonJsonCodec(), body=TRACKERS, headers={})
+
+    assert json.loads(b"".join(chunks)) == TRACKERS
+
+
+def test_streamed_body_is_encoded_for_every_attempt():
+    """Tests that every attempt of a retried request sends the whole compressed body."""
+    transport = EncodingTransport(
+        responses=[(503, {"error": {"code": "SERVICE_UNAVAILABLE", "message": "unavailable"}}), (200, {})]
+    )
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with client.request_options(stream_body=True, compress_body=True, retry_safe=True):
+        client.tracker.create_list(trackers=TRACKERS["trackers"])
+
+    assert len(transport.requests) == 2
+    for headers, data in transport.requests:
+        assert headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(data)) == TRACKERS
+
+
+def test_requests_transport_streams_body(monkeypatch):
+    """Tests that the requests transport sends streamed bodies as a generator."""
+    sent = {}
+
+    class Result:
+        content = b"{}"
+        status_code = 200
+        headers = {}
+
+    transport = RequestsTransport(json_codec=StdlibJsonCodec())
+    monkeypatch.setattr(transport.session, "request", lambda **kwargs: sent.update(kwargs) or Result())
+
+    with request_options(stream_body=True, compress_body=True):
+        EasyPostClient("123", transport=transport).tracker.create_list(trackers=TRACKERS["trackers"])
+
+    assert not isinstance(sent["data"], bytes)
+    assert json.loads(gzip.decompress(b"".join(sent["data"]))) == TRACKERS
+    assert sent["headers"]["Content-Encoding"] == "gzip"
+
+
+def test_aiohttp_transport_streams_body():
+    """Tests that the aiohttp transport sends streamed bodies as an async iterable."""
+    pytest.importorskip("aiohttp")
+
+    async def run():
+        with request_options(stream_body=True):
+            _, chunks = AiohttpTransport(json_codec=StdlibJsonCodec()).encode_body(body=TRACKERS, headers={})
+
+        return [chunk async for chunk in AiohttpTransport._stream(chunks=chunks)]
+
+    assert json.loads(b"".join(asyncio.run(run()))) == TRACKERS
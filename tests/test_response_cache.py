@@ -0,0 +1,465 @@
+import asyncio
+import fnmatch
+import json
+import threading
+import time
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.cache_backends import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SqliteCacheBackend,
+)
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import NotFoundError
+from easypost.response_cache import ResponseCache
+from easypost.transports import (
+    Transport,
+    TransportResponse,
+)
+from tests.helpers import (
+    FakeClock,
+    InMemoryAsyncTransport,
+    InMemoryTransport,
+)
+
+
+CARRIER_TYPES_RESPONSE = (200, [{"object": "CarrierType", "type": "UspsAccount"}])
+PAYMENT_METHODS_RESPONSE = (
+    200,
+    {"id": "cust_123", "object": "PaymentMethod", "primary_payment_method": {"id": "card_123"}},
+)
+
+
+class FakeRedis:
+    """Implements the part of the `redis.Redis` interface used by the Redis cache backend, storing bytes like Redis."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, name):
+        value, expires_at = self.values.get(name.encode(), (None, 0))
+        if expires_at <= time.monotonic():
+            return None
+
+        return value
+
+    def set(self, name, value, px):
+        self.values[name.encode()] = (value.encode(), time.monotonic() + px / 1000)
+
+    def delete(self, *names):
+        for name in names:
+            self.values.pop(name.encode() if isinstance(name, str) else name, None)
+
+    def scan_iter(self, match):
+        return [name for name in list(self.values) if fnmatch.fnmatchcase(name.decode(), match)]
+
+
+class ConditionalTransport(Transport):
+    """A transport that serves the current version of a tracker along with its `ETag`, and answers conditional
+    requests for an unchanged version with an empty 304 like the API.
+    """
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.requests = []
+
+    @property
+    def etag(self):
+        return f'"{self.tracker["status"]}"'
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == self.etag:
+            return TransportResponse(body="", status=304, headers={"ETag": self.etag})
+
+        return TransportResponse(body=json.dumps(self.tracker), status=200, headers={"etag": self.etag})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("easypost.cache_backends.memory_cache_backend.time.monotonic", clock.monotonic)
+
+    return clock
+
+
+def test_response_cache_hit():
+    """Tests that a cached response is returned without sending a request."""
+    transport = InMemoryTransport(responses=[CARRIER_TYPES_RESPONSE])
+    cache = ResponseCache()
+    client = EasyPostClient("123", transport=transport, response_cache=cache)
+
+    first_types = client.carrier_account.types()
+    second_types = client.carrier_account.types()
+
+    assert first_types[0].type == second_types[0].type == "UspsAccount"
+    assert first_types[0] is not second_types[0]
+    assert len(transport.requests) == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "revalidations": 0}
+
+
+def test_response_cache_disabled_by_default():
+    """Tests that responses are not cached unless the client has a response cache."""
+    transport = InMemoryTransport(responses=[CARRIER_TYPES_RESPONSE, CARRIER_TYPES_RESPONSE])
+    client = EasyPostClient("123", transport=transport)
+
+    client.carrier_account.types()
+    client.carrier_account.types()
+
+    assert len(transport.requests) == 2
+
+
+def test_response_cache_key():
+    """Tests that responses are cached per API key and params."""
+    transport = InMemoryTransport(responses=[(200, {"carriers": []})] * 3)
+    cache = ResponseCache()
+    client = EasyPostClient("123", transport=transport, response_cache=cache)
+    other_client = EasyPostClient("456", transport=transport, response_cache=cache)
+
+    client.carrier_metadata.retrieve(carriers=["usps"])
+    client.carrier_metadata.retrieve(carriers=["usps"])
+    client.carrier_metadata.retrieve(carriers=["fedex"])
+    other_client.carrier_metadata.retrieve(carriers=["usps"])
+
+    assert len(transport.requests) == 3
+
+
+def test_response_cache_ttl(clock):
+    """Tests that responses expire after the TTL of the longest matching prefix of their URL."""
+    cache = ResponseCache(ttl=10, ttls={"/carrier": 60, "/carrier_types": 100, "/api_keys": 0})
+
+    assert cache.ttl_for("/payment_methods") == 10
+    assert cache.ttl_for("/carrier_types") == 100
+
+    transport = InMemoryTransport(responses=[CARRIER_TYPES_RESPONSE, CARRIER_TYPES_RESPONSE])
+    client = EasyPostClient("123", transport=transport, response_cache=cache)
+
+    client.carrier_account.types()
+    clock.now += 99
+    client.carrier_account.types()
+    clock.now += 1
+    client.carrier_account.types()
+
+    assert len(transport.requests) == 2
+
+
+def test_response_cache_zero_ttl():
+    """Tests that responses of URLs with a TTL of 0 are not cached."""
+    transport = InMemoryTransport(responses=[(200, {"id": "user_123", "keys": []})] * 2)
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache(ttls={"/api_keys": 0}))
+
+    client.user.all_api_keys()
+    client.user.all_api_keys()
+
+    assert len(transport.requests) == 2
+
+
+def test_memory_cache_backend_lru_eviction():
+    """Tests that the least recently used value is evicted once the memory backend is full."""
+    backend = MemoryCacheBackend(max_size=2)
+
+    backend.set("key_1", "1", ttl=60)
+    backend.set("key_2", "2", ttl=60)
+    backend.get("key_1")
+    backend.set("key_3", "3", ttl=60)
+
+    assert backend.get("key_1") == "1"
+    assert backend.get("key_2") is None
+    assert backend.get("key_3") == "3"
+    assert backend.evictions == 1
+
+
+def test_response_cache_errors_are_not_cached():
+    """Tests that error responses are not cached."""
+    transport = InMemoryTransport(
+        responses=[(404, {"error": {"code": "NOT_FOUND", "message": "not found"}}), CARRIER_TYPES_RESPONSE]
+    )
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache())
+
+    with pytest.raises(NotFoundError):
+        client.carrier_account.types()
+    client.carrier_account.types()
+
+    assert len(transport.requests) == 2
+
+
+def test_response_cache_billing():
+    """Tests that billing functions reuse cached payment methods and that deleting one invalidates them."""
+    transport = InMemoryTransport(responses=[PAYMENT_METHODS_RESPONSE, (200, {}), (200, {}), PAYMENT_METHODS_RESPONSE])
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache())
+
+    client.billing.fund_wallet(amount="2000")
+    client.billing.delete_payment_method(priority="primary")
+    client.billing.retrieve_payment_methods()
+
+    assert [(request["method"].value, request["url"].split("/v2")[1]) for request in transport.requests] == [
+        ("get", "/payment_methods"),
+        ("post", "/credit_cards/card_123/charges"),
+        ("delete", "/credit_cards/card_123"),
+        ("get", "/payment_methods"),
+    ]
+
+
+def test_response_cache_invalidate():
+    """Tests that responses can be invalidated by URL, including the URLs below it, or all at once."""
+    cache = ResponseCache()
+    metadata_key = ResponseCache.make_key("123", "/metadata/carriers", {})
+    types_key = ResponseCache.make_key("123", "/carrier_types", {})
+    cache.set(metadata_key, "{}", 200)
+    cache.set(types_key, "[]", 200)
+
+    cache.invalidate(url="/carrier")
+
+    assert cache.get(types_key).http_body == "[]"
+
+    cache.invalidate(url="/metadata")
+
+    assert cache.get(metadata_key) is None
+    assert cache.get(types_key).http_body == "[]"
+
+    cache.invalidate()
+
+    assert len(cache.backend) == 0
+
+
+def test_response_cache_shipments():
+    """Tests that Shipments are only cached once a TTL is set for them, and that changing one invalidates it."""
+    shipment_response = (200, {"id": "shp_123", "object": "Shipment"})
+    transport = InMemoryTransport(responses=[shipment_response] * 2)
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache())
+
+    client.shipment.retrieve("shp_123")
+    client.shipment.retrieve("shp_123")
+
+    assert len(transport.requests) == 2
+
+    transport = InMemoryTransport(responses=[shipment_response, shipment_response, shipment_response])
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache(ttls={"/shipments": 30}))
+
+    client.shipment.retrieve("shp_123")
+    client.shipment.retrieve("shp_123")
+    client.shipment.buy("shp_123", rate={"id": "rate_123"})
+    client.shipment.retrieve("shp_123")
+
+    assert [request["method"].value for request in transport.requests] == ["get", "post", "get"]
+
+
+def test_response_cache_conditional_requests():
+    """Tests that expired responses are revalidated with their ETag, and served from the cache when unchanged."""
+    transport = ConditionalTransport(tracker={"id": "trk_123", "object": "Tracker", "status": "in_transit"})
+    cache = ResponseCache()
+    client = EasyPostClient("123", transport=transport, response_cache=cache)
+
+    first_tracker = client.tracker.retrieve("trk_123")
+    second_tracker = client.tracker.retrieve("trk_123")
+    transport.tracker = {**transport.tracker, "status": "delivered"}
+    third_tracker = client.tracker.retrieve("trk_123")
+
+    assert [first_tracker.status, second_tracker.status, third_tracker.status] == [
+        "in_transit",
+        "in_transit",
+        "delivered",
+    ]
+    assert [headers.get("If-None-Match") for headers in transport.requests] == [
+        None,
+        '"in_transit"',
+        '"in_transit"',
+    ]
+    assert cache.stats == {"hits": 0, "misses": 3, "revalidations": 1}
+
+
+def test_response_cache_conditional_requests_disabled():
+    """Tests that responses of URLs with a TTL of 0 are not kept for revalidation when it is disabled."""
+    transport = ConditionalTransport(tracker={"id": "trk_123", "object": "Tracker", "status": "in_transit"})
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache(revalidation=False))
+
+    client.tracker.retrieve("trk_123")
+    client.tracker.retrieve("trk_123")
+
+    assert [headers.get("If-None-Match") for headers in transport.requests] == [None, None]
+
+
+def test_cached_response_conditional_headers():
+    """Tests that cached responses keep their validators and send them as conditional headers."""
+    cache = ResponseCache(ttl=60)
+    key = ResponseCache.make_key("123", "/trackers/trk_123", {})
+    cache.set(key, "{}", 200, headers={"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"})
+
+    cached_response = cache.get(key)
+
+    assert cached_response.fresh is False
+    assert cached_response.conditional_headers == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+    }
+
+
+@pytest.mark.parametrize("backend_name", ["memory", "sqlite", "redis"])
+def test_cache_backends(backend_name, tmp_path):
+    """Tests that every cache backend stores, expires, and deletes values by prefix."""
+    if backend_name == "memory":
+        backend = MemoryCacheBackend()
+    elif backend_name == "sqlite":
+        backend = SqliteCacheBackend(str(tmp_path / "cache.sqlite3"))
+    else:
+        backend = RedisCacheBackend(FakeRedis())
+
+    backend.set("/carrier_types|v2|abc|{}", "200:[]", ttl=60)
+    backend.set("/metadata/carriers|v2|abc|{}", "200:{}", ttl=60)
+    backend.set("/metadata/carriers|v2|abc|[*]", "200:{}", ttl=60)
+    backend.set("/expired|v2|abc|{}", "200:{}", ttl=-1)
+
+    assert backend.get("/carrier_types|v2|abc|{}") == "200:[]"
+    assert backend.get("/expired|v2|abc|{}") is None
+    assert backend.get("/missing") is None
+
+    backend.delete_prefix("/metadata/")
+
+    assert backend.get("/metadata/carriers|v2|abc|{}") is None
+    assert backend.get("/metadata/carriers|v2|abc|[*]") is None
+    assert backend.get("/carrier_types|v2|abc|{}") == "200:[]"
+
+    backend.clear()
+
+    assert backend.get("/carrier_types|v2|abc|{}") is None
+
+
+def test_sqlite_cache_backend_shared(tmp_path):
+    """Tests that responses cached through a SQLite backend are shared by the clients using the same file."""
+    path = str(tmp_path / "cache.sqlite3")
+    transport = InMemoryTransport(responses=[CARRIER_TYPES_RESPONSE])
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache(backend=SqliteCacheBackend(path)))
+    other_client = EasyPostClient(
+        "123", transport=transport, response_cache=ResponseCache(backend=SqliteCacheBackend(path))
+    )
+
+    client.carrier_account.types()
+    carrier_types = other_client.carrier_account.types()
+
+    assert carrier_types[0].type == "UspsAccount"
+    assert len(transport.requests) == 1
+
+
+def test_sqlite_cache_backend_lru_eviction(tmp_path, monkeypatch):
+    """Tests that the least recently used values are evicted once the SQLite backend is full."""
+    clock = FakeClock()
+    monkeypatch.setattr("easypost.cache_backends.sqlite_cache_backend.time.time", clock.monotonic)
+    backend = SqliteCacheBackend(str(tmp_path / "cache.sqlite3"), max_size=2, eviction_interval=1)
+
+    backend.set("key_1", "1", ttl=60)
+    clock.now += 1
+    backend.set("key_2", "2", ttl=60)
+    clock.now += 1
+    backend.get("key_1")
+    backend.set("key_3", "3", ttl=60)
+
+    assert backend.get("key_1") == "1"
+    assert backend.get("key_2") is None
+    assert backend.get("key_3") == "3"
+
+
+def test_sqlite_cache_backend_approximate_lru(tmp_path, monkeypatch):
+    """Tests that the SQLite backend only checks its size every `eviction_interval` writes, and only records the
+    use of a value when the recorded one is older than `touch_interval`.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr("easypost.cache_backends.sqlite_cache_backend.time.time", clock.monotonic)
+    path = str(tmp_path / "cache.sqlite3")
+    backend = SqliteCacheBackend(path, max_size=2, eviction_interval=3, touch_interval=5)
+
+    def used_at(key):
+        return backend._connection.execute("SELECT used_at FROM response_cache WHERE key = ?", (key,)).fetchone()[0]
+
+    backend.set("key_1", "1", ttl=60)
+    backend.set("key_2", "2", ttl=60)
+    clock.now += 1
+    backend.get("key_1")
+
+    assert used_at("key_1") == 100.0
+
+    clock.now += 5
+    backend.get("key_1")
+
+    assert used_at("key_1") == 106.0
+
+    backend.set("key_3", "3", ttl=60)
+
+    assert backend.get("key_1") == "1"
+    assert backend.get("key_2") is None
+    assert backend.get("key_3") == "3"
+
+    backend.set("key_4", "4", ttl=60)
+
+    assert backend.get("key_4") == "4"
+    assert backend._connection.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0] == 3
+
+
+def test_redis_cache_backend():
+    """Tests that the Redis backend stores keys under its prefix with an expiry."""
+    redis = FakeRedis()
+    client = EasyPostClient(
+        "123",
+        transport=InMemoryTransport(responses=[CARRIER_TYPES_RESPONSE]),
+        response_cache=ResponseCache(backend=RedisCacheBackend(redis, prefix="test:")),
+    )
+
+    client.carrier_account.types()
+    client.carrier_account.types()
+
+    [(key, (value, expires_at))] = redis.values.items()
+    assert key.startswith(b"test:/carrier_types|")
+    assert value.startswith(b"200\n")
+    assert expires_at > time.monotonic()
+
+
+def test_async_response_cache():
+    """Tests that the async client answers cacheable requests from its response cache."""
+    transport = InMemoryAsyncTransport(responses=[CARRIER_TYPES_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport, response_cache=ResponseCache()) as client:
+            await client.carrier_account.types()
+            return await client.carrier_account.types()
+
+    carrier_types = asyncio.run(run())
+
+    assert carrier_types[0].type == "UspsAccount"
+    assert transport.responses == []
+
+
+def test_async_response_cache_blocking_backend():
+    """Tests that the async client calls blocking cache backends from an executor instead of the event loop."""
+
+    class ThreadRecordingBackend(MemoryCacheBackend):
+        blocking = True
+
+        def __init__(self):
+            super().__init__()
+            self.threads = set()
+
+        def get(self, key):
+            self.threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value, ttl):
+            self.threads.add(threading.get_ident())
+            super().set(key, value, ttl)
+
+    backend = ThreadRecordingBackend()
+    transport = InMemoryAsyncTransport(responses=[CARRIER_TYPES_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient(
+            "123", transport=transport, response_cache=ResponseCache(backend=backend)
+        ) as client:
+            await client.carrier_account.types()
+            return await client.carrier_account.types()
+
+    carrier_types = asyncio.run(run())
+
+    assert carrier_types[0].type == "UspsAccount"
+    assert transport.responses == []
+    assert backend.threads and threading.get_ident() not in backend.threads
+    assert SqliteCacheBackend.blocking and not MemoryCacheBackend.blocking
@@ -0,0 +1,150 @@
+import gzip
+import json
+import threading
+import zlib
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+
+import pytest
+from easypost.easypost_client import EasyPostClient
+from easypost.json_codecs import StdlibJsonCodec
+from easypost.requestor import RequestMethod
+from easypost.transports import (
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+    UrlfetchTransport,
+)
+
+
+SHIPMENTS = {"shipments": [{"id": f"shp_{i}", "object": "Shipment", "status": "delivered"} for i in range(500)]}
+
+
+class CompressedTransport(Transport):
+    """A transport that answers with a decompressed body and the size it had on the wire."""
+
+    def request(self, method, url, headers, params, body, timeout):
+        response_body = json.dumps(SHIPMENTS).encode()
+        return TransportResponse(
+            body=response_body, status=200, headers={}, wire_size=len(gzip.compress(response_body))
+        )
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Answers every request with a JSON body, gzip-compressed when the request accepts it."""
+
+    def do_GET(self):
+        body = json.dumps(SHIPMENTS).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gzip_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_response_size():
+    """Tests that the size of a response is the number of bytes of its decompressed body."""
+    assert TransportResponse(body=b'{"name": "Zo\xc3\xab"}', status=200, headers={}).size == 16
+    assert TransportResponse(body='{"name": "Zoë"}', status=200, headers={}).size == 16
+    assert TransportResponse(body=b"", status=200, headers={}).wire_size is None
+
+
+def test_response_hook_sizes():
+    """Tests that the response hook reports the decompressed and wire sizes of the body."""
+    sizes = []
+    client = EasyPostClient("123", transport=CompressedTransport())
+    client.subscribe_to_response_hook(
+        lambda **kwargs: sizes.append((kwargs["response_size"], kwargs["response_wire_size"]))
+    )
+
+    client.shipment.all()
+
+    response_size, response_wire_size = sizes[0]
+    assert response_size == len(json.dumps(SHIPMENTS))
+    assert response_wire_size < response_size / 5
+
+
+def test_requests_transport_wire_size(gzip_server):
+    """Tests that the requests transport negotiates gzip responses and reports the size they had on the wire."""
+    response = RequestsTransport(json_codec=StdlibJsonCodec()).request(
+        method=RequestMethod.GET,
+        url=f"{gzip_server}/v2/shipments",
+        headers={},
+        params=None,
+        body=None,
+        timeout=5,
+    )
+
+    assert json.loads(response.body) == SHIPMENTS
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.wire_size == len(gzip.compress(json.dumps(SHIPMENTS).encode()))
+    assert response.wire_size < response.size / 5
+
+
+@pytest.mark.parametrize(
+    "content_encoding, compress",
+    [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data, wbits=-zlib.MAX_WBITS)),
+        ("", lambda data: data),
+    ],
+)
+def test_urlfetch_transport_decompress(content_encoding, compress):
+    """Tests that the urlfetch transport decompresses bodies according to their `Content-Encoding`."""
+    # urlfetch is only available on App Engine, the transport is not initialized
+    transport = UrlfetchTransport.__new__(UrlfetchTransport)
+    transport._brotli = None
+    body = json.dumps(SHIPMENTS).encode()
+
+    assert transport._decompress(body=compress(body), headers={"content-encoding": content_encoding}) == body
+
+
+def test_response_hook_sizes_optional():
+    """Tests that the response sizes are only passed to subscribers accepting them, by name or with `**kwargs`."""
+    responses = []
+
+    def explicit_subscriber(http_status, method, path, headers, response_body, request_timestamp, **kwargs):
+        responses.append(("kwargs", sorted(kwargs)))
+
+    def legacy_subscriber(
+        http_status, method, path, headers, response_body, request_timestamp, response_timestamp, request_uuid
+    ):
+        responses.append(("legacy", http_status))
+
+    def sized_subscriber(http_status, response_size, *args, **kwargs):
+        responses.append(("sized", response_size))
+
+    client = EasyPostClient("123", transport=CompressedTransport())
+    client.subscribe_to_response_hook(explicit_subscriber)
+    client.subscribe_to_response_hook(legacy_subscriber)
+    client.subscribe_to_response_hook(sized_subscriber)
+
+    client.shipment.all()
+
+    assert responses == [
+        ("kwargs", ["request_uuid", "response_size", "response_timestamp", "response_wire_size"]),
+        ("legacy", 200),
+        ("sized", len(json.dumps(SHIPMENTS))),
+    ]
+
+    client.unsubscribe_from_response_hook(legacy_subscriber)
+    assert len(client._response_hook) == 2
@@ -0,0 +1,150 @@
+import asyncio
+import socket
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    GatewayTimeoutError,
+    InvalidParameterError,
+    NotFoundError,
+    ServiceUnavailableError,
+)
+from easypost.request_options import get_request_options
+from easypost.requestor import RequestMethod
+from easypost.retry_policy import RetryPolicy
+from tests.helpers import (
+    InMemoryAsyncTransport,
+    InMemoryTransport,
+)
+
+
+UNAVAILABLE_RESPONSE = (503, {"error": {"code": "SERVICE_UNAVAILABLE", "message": "unavailable"}})
+GATEWAY_TIMEOUT_RESPONSE = (504, {"error": {"code": "GATEWAY_TIMEOUT", "message": "gateway timeout"}})
+SHIPMENT_RESPONSE = (200, {"id": "shp_123", "object": "Shipment"})
+
+
+def test_retry_policy_retries_get_requests():
+    """Tests that GET requests answered with a retryable status are sent again, firing hooks for every attempt."""
+    transport = InMemoryTransport(responses=[UNAVAILABLE_RESPONSE, GATEWAY_TIMEOUT_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+    hook_statuses = []
+    client.subscribe_to_response_hook(lambda **kwargs: hook_statuses.append(kwargs["http_status"]))
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert shipment.id == "shp_123"
+    assert len(transport.requests) == 3
+    assert hook_statuses == [503, 504, 200]
+
+
+def test_retry_policy_retries_timeouts():
+    """Tests that requests which timed out are sent again."""
+    transport = InMemoryTransport(responses=[socket.timeout("timed out"), SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert shipment.id == "shp_123"
+    assert len(transport.requests) == 2
+
+
+def test_retry_policy_max_attempts():
+    """Tests that the last error is raised once a request was sent `max_attempts` times."""
+    transport = InMemoryTransport(responses=[GATEWAY_TIMEOUT_RESPONSE] * 2)
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0))
+
+    with pytest.raises(GatewayTimeoutError):
+        client.shipment.retrieve("shp_123")
+
+    assert len(transport.requests) == 2
+
+
+def test_retry_policy_does_not_retry_other_statuses():
+    """Tests that requests answered with a status outside of the retry policy are not sent again."""
+    transport = InMemoryTransport(responses=[(404, {"error": {"code": "NOT_FOUND", "message": "not found"}})])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with pytest.raises(NotFoundError):
+        client.shipment.retrieve("shp_123")
+
+    assert len(transport.requests) == 1
+
+
+def test_retry_policy_does_not_retry_post_requests():
+    """Tests that POST requests are not retried unless they are marked as safe to retry."""
+    transport = InMemoryTransport(responses=[UNAVAILABLE_RESPONSE])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with pytest.raises(ServiceUnavailableError):
+        client.parcel.create(weight=10)
+
+    assert len(transport.requests) == 1
+
+
+def test_retry_policy_retries_safe_post_requests():
+    """Tests that POST requests made within a `retry_safe` block are retried."""
+    transport = InMemoryTransport(responses=[UNAVAILABLE_RESPONSE, (201, {"id": "prcl_123", "object": "Parcel"})])
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with client.request_options(retry_safe=True):
+        parcel = client.parcel.create(weight=10)
+
+    assert parcel.id == "prcl_123"
+    assert len(transport.requests) == 2
+    assert get_request_options() == {}
+
+
+def test_retry_policy_delay():
+    """Tests that retry delays back off exponentially with jitter and respect Retry-After and the deadline."""
+    retry_policy = RetryPolicy(max_attempts=5, backoff_factor=1, max_backoff=3, deadline=10)
+
+    for _ in range(100):
+        assert 0 <= retry_policy.delay(attempt=1, elapsed=0) <= 2
+        assert 0 <= retry_policy.delay(attempt=4, elapsed=0) <= 3
+
+    assert retry_policy.delay(attempt=1, elapsed=0, retry_after=5) == 5
+    assert retry_policy.delay(attempt=1, elapsed=6, retry_after=5) is None
+    assert retry_policy.delay(attempt=5, elapsed=0) is None
+
+
+def test_retry_policy_methods():
+    """Tests that the methods of a retry policy can be given as strings."""
+    retry_policy = RetryPolicy(methods=["get", "PUT"])
+
+    assert retry_policy.allows(RequestMethod.GET)
+    assert retry_policy.allows(RequestMethod.PUT)
+    assert not retry_policy.allows(RequestMethod.DELETE)
+    assert retry_policy.allows(RequestMethod.DELETE, retry_safe=True)
+
+
+def test_request_options():
+    """Tests that request options of nested blocks are merged and reset when leaving a block."""
+    client = EasyPostClient("123")
+
+    with client.request_options(retry_safe=True):
+        with client.request_options(retry_safe=False) as options:
+            assert options == {"retry_safe": False}
+        assert get_request_options() == {"retry_safe": True}
+
+    assert get_request_options() == {}
+
+    with pytest.raises(InvalidParameterError):
+        with client.request_options(retry=True):
+            pass
+
+
+def test_async_retry_policy():
+    """Tests that the async client retries requests with its retry policy."""
+    transport = InMemoryAsyncTransport(responses=[UNAVAILABLE_RESPONSE, SHIPMENT_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient(
+            "123", transport=transport, retry_policy=RetryPolicy(backoff_factor=0)
+        ) as client:
+            return await client.shipment.retrieve("shp_123")
+
+    shipment = asyncio.run(run())
+
+    assert shipment.id == "shp_123"
+    assert transport.responses == []
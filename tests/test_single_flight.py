@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    NotFoundError,
+    TimeoutError,
+)
+from easypost.single_flight import SingleFlight
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+)
+from tests.helpers import InMemoryTransport
+
+
+SHIPMENT_RESPONSE = (200, {"id": "shp_123", "object": "Shipment", "tracking_code": "9400"})
+
+
+class BlockingTransport(Transport):
+    """A transport that holds every request until `release` is set, so concurrent requests overlap."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.release = threading.Event()
+
+    def request(self, method, url, headers, params, body, timeout):
+        self.release.wait(timeout=5)
+        return self.transport.request(method, url, headers, params, body, timeout)
+
+
+class SlowAsyncTransport(AsyncTransport):
+    """An async transport that answers every request after yielding to the event loop."""
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def request(self, method, url, headers, params, body, timeout):
+        await asyncio.sleep(0.01)
+        return self.transport.request(method, url, headers, params, body, timeout)
+
+    async def close(self):
+        pass
+
+
+def retrieve_concurrently(client, transport, shipment_ids):
+    """Retrieve shipments from several threads at once, releasing the transport once every thread is waiting."""
+    single_flight = client.single_flight
+    expected_calls = sum(single_flight.stats.values()) + len(shipment_ids)
+    with ThreadPoolExecutor(max_workers=len(shipment_ids)) as executor:
+        futures = [executor.submit(client.shipment.retrieve, shipment_id) for shipment_id in shipment_ids]
+        while sum(single_flight.stats.values()) < expected_calls:
+            threading.Event().wait(0.001)
+        transport.release.set()
+
+        return [future.result() for future in futures]
+
+
+def test_single_flight_coalesces_identical_gets():
+    """Tests that concurrent identical GET requests share one request and each get their own object."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+    blocking_transport = BlockingTransport(transport)
+    client = EasyPostClient("123", transport=blocking_transport, single_flight=SingleFlight())
+
+    shipments = retrieve_concurrently(client, blocking_transport, ["shp_123"] * 5)
+
+    assert len(transport.requests) == 1
+    assert all(shipment.tracking_code == "9400" for shipment in shipments)
+    assert len({id(shipment) for shipment in shipments}) == 5
+    assert client.single_flight.stats == {"calls": 1, "coalesced": 4}
+
+
+def test_single_flight_different_requests():
+    """Tests that requests for different objects are not coalesced."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE, SHIPMENT_RESPONSE])
+    blocking_transport = BlockingTransport(transport)
+    client = EasyPostClient("123", transport=blocking_transport, single_flight=SingleFlight())
+
+    retrieve_concurrently(client, blocking_transport, ["shp_123", "shp_456"])
+
+    assert sorted(request["url"].rsplit("/", 1)[1] for request in transport.requests) == ["shp_123", "shp_456"]
+
+
+def test_single_flight_shares_errors():
+    """Tests that the callers of a coalesced request all receive its error."""
+    transport = InMemoryTransport(responses=[(404, {"error": {"code": "NOT_FOUND", "message": "not found"}})])
+    blocking_transport = BlockingTransport(transport)
+    client = EasyPostClient("123", transport=blocking_transport, single_flight=SingleFlight())
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            retrieve_concurrently(client, blocking_transport, ["shp_123"] * 3)
+        blocking_transport.release.clear()
+        transport.responses.append((404, {"error": {"code": "NOT_FOUND", "message": "not found"}}))
+
+    assert len(transport.requests) == 2
+
+
+def test_single_flight_ignores_other_methods():
+    """Tests that requests other than GET requests are never coalesced."""
+    single_flight = SingleFlight()
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", transport=transport, single_flight=single_flight)
+
+    client.shipment.buy("shp_123", rate={"id": "rate_123"})
+    client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    assert len(transport.requests) == 2
+    assert single_flight.stats == {"calls": 0, "coalesced": 0}
+
+
+def test_async_single_flight():
+    """Tests that concurrent identical GET requests of the async client share one request."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+
+    async def run():
+        async with AsyncEasyPostClient(
+            "123",
+            transport=SlowAsyncTransport(transport),
+            single_flight=SingleFlight(),
+        ) as client:
+            return await asyncio.gather(*[client.shipment.retrieve("shp_123") for _ in range(3)])
+
+    shipments = asyncio.run(run())
+
+    assert len(transport.requests) == 1
+    assert [shipment.tracking_code for shipment in shipments] == ["9400", "9400", "9400"]
+    assert shipments[0] is not shipments[1]
+
+
+def test_async_single_flight_leader_cancelled():
+    """Tests that cancelling the task leading a call does not cancel the tasks waiting for it, which make the call
+    again.
+    """
+    single_flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(asyncio.current_task())
+        await asyncio.sleep(0.05)
+        return "shp_123"
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do_async(key="/shipments/shp_123", fn=call))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(single_flight.do_async(key="/shipments/shp_123", fn=call)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return results
+
+    results = asyncio.run(run())
+
+    assert results == ["shp_123", "shp_123"]
+    assert len(calls) == 2
+    assert single_flight.stats == {"calls": 2, "coalesced": 1}
+
+
+def test_single_flight_follower_deadline():
+    """Tests that a request waiting for an identical request in flight gives up once its own deadline passes."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+    blocking_transport = BlockingTransport(transport)
+    client = EasyPostClient("123", transport=blocking_transport, single_flight=SingleFlight())
+
+    def retrieve_with_deadline():
+        with client.request_options(deadline=0.1):
+            started_at = time.monotonic()
+            try:
+                client.shipment.retrieve("shp_123")
+            except TimeoutError as error:
+                return error, time.monotonic() - started_at
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(client.shipment.retrieve, "shp_123")
+        while client.single_flight.stats["calls"] < 1:
+            threading.Event().wait(0.001)
+        error, waited = executor.submit(retrieve_with_deadline).result(timeout=5)
+        blocking_transport.release.set()
+
+        assert leader.result().tracking_code == "9400"
+
+    assert error.message == "Request deadline exceeded."
+    assert waited < 1
+    assert len(transport.requests) == 1
+
+
+def test_async_single_flight_follower_deadline():
+    """Tests that an async request waiting for an identical request in flight gives up once its deadline passes."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+
+    class HeldAsyncTransport(SlowAsyncTransport):
+        async def request(self, method, url, headers, params, body, timeout):
+            await self.release.wait()
+            return self.transport.request(method, url, headers, params, body, timeout)
+
+    async def run():
+        held_transport = HeldAsyncTransport(transport)
+        held_transport.release = asyncio.Event()
+        async with AsyncEasyPostClient("123", transport=held_transport, single_flight=SingleFlight()) as client:
+            leader = asyncio.ensure_future(client.shipment.retrieve("shp_123"))
+            await asyncio.sleep(0.01)
+            with client.request_options(deadline=0.05):
+                with pytest.raises(TimeoutError):
+                    await client.shipment.retrieve("shp_123")
+            held_transport.release.set()
+
+            return await leader, client.single_flight.stats
+
+    shipment, stats = asyncio.run(run())
+
+    assert shipment.tracking_code == "9400"
+    assert stats == {"calls": 1, "coalesced": 1}
+    assert len(transport.requests) == 1
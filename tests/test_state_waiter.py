@@ -0,0 +1,259 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    InvalidObjectError,
+    NotFoundError,
+    RateLimitError,
+    TimeoutError,
+)
+from easypost.state_waiter import (
+    AsyncStateWaiter,
+    StateWaiter,
+    _PollingBackoff,
+    _Wait,
+)
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+FAST_POLLING = {"initial_interval": 0.01, "max_interval": 0.05, "multiplier": 2}
+
+
+class StatesTransport(Transport):
+    """A transport that answers the retrieval of each object with the next of its canned responses, repeating the
+    last one once the others are used.
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers, params, body, timeout):
+        id = url.rsplit("/", 1)[1]
+        with self._lock:
+            self.requests.append(id)
+            responses = self.responses[id]
+            status, response_body = responses.pop(0) if len(responses) > 1 else responses[0]
+
+        return TransportResponse(body=json.dumps(response_body), status=status, headers={})
+
+
+class AsyncStatesTransport(AsyncTransport):
+    """An async transport answering requests with a `StatesTransport`."""
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def request(self, method, url, headers, params, body, timeout):
+        return self.transport.request(method, url, headers, params, body, timeout)
+
+    async def close(self):
+        pass
+
+
+def batch(id, state):
+    return 200, {"id": id, "object": "Batch", "state": state}
+
+
+def test_wait_for_batch():
+    """Tests that a Batch is polled until it reaches the target state, resolving its future and callback."""
+    transport = StatesTransport(
+        responses={
+            "batch_123": [
+                batch("batch_123", "creating"),
+                batch("batch_123", "creating"),
+                batch("batch_123", "created"),
+                batch("batch_123", "purchasing"),
+                batch("batch_123", "purchased"),
+            ]
+        }
+    )
+    callbacks = []
+
+    with StateWaiter(EasyPostClient("123", transport=transport), **FAST_POLLING) as waiter:
+        created = waiter.wait_for_batch("batch_123", callback=callbacks.append).result(timeout=5)
+        purchased = waiter.wait_for_batch("batch_123", states=["purchased", "label_generated"]).result(timeout=5)
+
+    assert created.state == "created"
+    assert purchased.state == "purchased"
+    assert transport.requests == ["batch_123"] * 5
+    assert callbacks[0].result() is created
+
+
+def test_wait_for_many_batches():
+    """Tests that many Batches are waited for at once by a single scheduler thread."""
+    transport = StatesTransport(
+        responses={
+            f"batch_{i}": [batch(f"batch_{i}", "creating")] * i + [batch(f"batch_{i}", "created")] for i in range(20)
+        }
+    )
+
+    with StateWaiter(EasyPostClient("123", transport=transport), concurrency=2, **FAST_POLLING) as waiter:
+        futures = [waiter.wait_for_batch(f"batch_{i}") for i in range(20)]
+        batches = [future.result(timeout=10) for future in futures]
+        schedulers = [thread for thread in threading.enumerate() if thread.name == "easypost-waiter-scheduler"]
+
+    assert [batch.id for batch in batches] == [f"batch_{i}" for i in range(20)]
+    assert all(batch.state == "created" for batch in batches)
+    assert len(schedulers) == 1
+    assert len(transport.requests) == sum(i + 1 for i in range(20))
+
+
+def test_wait_for_report():
+    """Tests that a Report is polled until its file is available."""
+    transport = StatesTransport(
+        responses={
+            "shprep_123": [
+                (200, {"id": "shprep_123", "object": "ShipmentReport", "status": "new"}),
+                (200, {"id": "shprep_123", "object": "ShipmentReport", "status": "available", "url": "https://a.b"}),
+            ]
+        }
+    )
+
+    with StateWaiter(EasyPostClient("123", transport=transport), **FAST_POLLING) as waiter:
+        report = waiter.wait_for_report("shprep_123").result(timeout=5)
+
+    assert report.url == "https://a.b"
+
+
+def test_wait_errors():
+    """Tests that waits fail on failure states, timeouts, and client errors, and survive server errors."""
+    rate_limited = (429, {"error": {"code": "RATE_LIMIT_EXCEEDED", "message": "rate limited"}})
+    unavailable = (503, {"error": {"code": "SERVICE_UNAVAILABLE", "message": "unavailable"}})
+    transport = StatesTransport(
+        responses={
+            "batch_failed": [batch("batch_failed", "creating"), batch("batch_failed", "creation_failed")],
+            "batch_stuck": [batch("batch_stuck", "purchasing")],
+            "batch_missing": [(404, {"error": {"code": "NOT_FOUND", "message": "not found"}})],
+            "batch_flaky": [unavailable, rate_limited, batch("batch_flaky", "created")],
+        }
+    )
+
+    with StateWaiter(EasyPostClient("123", transport=transport), **FAST_POLLING) as waiter:
+        failed = waiter.wait_for_batch("batch_failed")
+        stuck = waiter.wait_for_batch("batch_stuck", states=["purchased"], timeout=0.2)
+        missing = waiter.wait_for_batch("batch_missing")
+        flaky = waiter.wait_for_batch("batch_flaky")
+
+        with pytest.raises(InvalidObjectError) as failed_error:
+            failed.result(timeout=5)
+        with pytest.raises(TimeoutError) as stuck_error:
+            stuck.result(timeout=5)
+        with pytest.raises(NotFoundError):
+            missing.result(timeout=5)
+        assert flaky.result(timeout=5).state == "created"
+
+    assert failed_error.value.message == "Batch batch_failed reached state creation_failed instead of created."
+    assert stuck_error.value.message == (
+        "Batch batch_stuck did not reach state purchased in time, its last state was purchasing."
+    )
+    assert transport.requests.count("batch_missing") == 1
+
+
+def test_close_cancels_waits():
+    """Tests that closing a waiter cancels the futures of the objects still waited for."""
+    transport = StatesTransport(responses={"batch_123": [batch("batch_123", "creating")]})
+    waiter = StateWaiter(EasyPostClient("123", transport=transport), initial_interval=10, max_interval=10)
+
+    future = waiter.wait_for_batch("batch_123")
+    while not transport.requests:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    waiter.close()
+
+    assert future.cancelled()
+    assert waiter.wait_for_batch("batch_123").cancelled()
+
+
+def test_polling_backoff():
+    """Tests that polls back off while the state does not change, and poll again quickly once it changes."""
+    backoff = _PollingBackoff(initial_interval=1, max_interval=4, multiplier=2)
+    wait = _Wait(
+        object_name="Batch", id="batch_123", state_attribute="state", states=["created"], failure_states=[], timeout=60
+    )
+
+    intervals = []
+    for state in ["creating", "creating", "creating", "creating", "purchasing"]:
+        wait.reached({"state": state})
+        delay = backoff.delay(wait=wait)
+        assert wait.interval / 2 <= delay <= wait.interval
+        intervals.append(wait.interval)
+
+    assert intervals == [1, 2, 4, 4, 1]
+
+    backoff.delay(wait=wait, error=RateLimitError("rate limited"))
+    assert wait.interval == 4
+
+    wait.deadline = time.monotonic() + 0.1
+    assert backoff.delay(wait=wait) <= 0.1
+    wait.deadline = time.monotonic()
+    assert backoff.delay(wait=wait) is None
+
+
+def test_async_state_waiter():
+    """Tests that the async waiter polls objects on the event loop until they reach a state or time out."""
+    transport = StatesTransport(
+        responses={
+            "batch_123": [batch("batch_123", "label_generating"), batch("batch_123", "label_generated")],
+            "batch_456": [batch("batch_456", "creating")],
+        }
+    )
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=AsyncStatesTransport(transport)) as client:
+            waiter = AsyncStateWaiter(client, **FAST_POLLING)
+            labelled = waiter.wait_for_batch("batch_123", states=["label_generated"])
+            stuck = waiter.wait_for_batch("batch_456", timeout=0.1)
+
+            return await asyncio.gather(labelled, stuck, return_exceptions=True)
+
+    labelled, stuck = asyncio.run(run())
+
+    assert labelled.state == "label_generated"
+    assert isinstance(stuck, TimeoutError)
+
+
+def test_wait_without_delay():
+    """Tests that polls rescheduled without delay run in their own context, while the previous poll is returning."""
+
+    class LingeringStateWaiter(StateWaiter):
+        def _reschedule(self, *args, **kwargs):
+            super()._reschedule(*args, **kwargs)
+            # Keep the poll which rescheduled running while the next one starts
+            time.sleep(0.02)
+
+    states = ["creating", "created", "purchasing", "purchased", "label_generating", "label_generated"]
+    transport = StatesTransport(responses={"batch_123": [batch("batch_123", state) for state in states]})
+
+    with LingeringStateWaiter(
+        EasyPostClient("123", transport=transport), concurrency=4, initial_interval=0, max_interval=0
+    ) as waiter:
+        labelled = waiter.wait_for_batch("batch_123", states=["label_generated"]).result(timeout=5)
+
+    assert labelled.state == "label_generated"
+    assert transport.requests == ["batch_123"] * len(states)
+
+
+def test_wait_poll_errors_resolve_future():
+    """Tests that an error raised outside of the retrieval of a poll fails its future instead of leaving it pending."""
+    transport = StatesTransport(responses={"batch_123": [batch("batch_123", "creating")]})
+
+    def fail(wait, error=None):
+        raise ValueError("invalid interval")
+
+    with StateWaiter(EasyPostClient("123", transport=transport), **FAST_POLLING) as waiter:
+        waiter.backoff.delay = fail
+        future = waiter.wait_for_batch("batch_123")
+
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
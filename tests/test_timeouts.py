@@ -0,0 +1,125 @@
+import time
+
+import pytest
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    ServiceUnavailableError,
+    TimeoutError,
+)
+from easypost.retry_policy import RetryPolicy
+from easypost.transports import AiohttpTransport
+from tests.helpers import InMemoryTransport
+
+
+SHIPMENT_RESPONSE = (200, {"id": "shp_123", "object": "Shipment"})
+
+
+def shipments_page(ids, has_more):
+    """Build a page of a shipment list response."""
+    return 200, {"shipments": [{"id": id, "object": "Shipment"} for id in ids], "has_more": has_more}
+
+
+class SlowTransport(InMemoryTransport):
+    """A transport that takes `delay` seconds to answer each request."""
+
+    def __init__(self, responses, delay):
+        super().__init__(responses=responses)
+        self.delay = delay
+
+    def request(self, method, url, headers, params, body, timeout):
+        time.sleep(self.delay)
+        return super().request(method, url, headers, params, body, timeout)
+
+
+def test_request_options_timeout():
+    """Tests that the timeout of a `request_options` block replaces the timeout of the client within the block."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE, SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", timeout=60, transport=transport)
+
+    with client.request_options(timeout=(0.5, 2)):
+        client.shipment.retrieve("shp_123")
+    client.shipment.retrieve("shp_123")
+
+    assert [request["timeout"] for request in transport.requests] == [(0.5, 2), 60]
+
+
+def test_deadline_caps_timeout():
+    """Tests that the timeout of a request does not run past the deadline of its block."""
+    transport = InMemoryTransport(responses=[SHIPMENT_RESPONSE])
+    client = EasyPostClient("123", timeout=(5, 60), transport=transport)
+
+    with client.request_options(deadline=2):
+        client.shipment.retrieve("shp_123")
+
+    connect_timeout, read_timeout = transport.requests[0]["timeout"]
+    assert connect_timeout <= 2
+    assert read_timeout <= 2
+
+
+def test_nested_deadline():
+    """Tests that a nested block cannot extend the deadline of its enclosing block."""
+    client = EasyPostClient("123")
+
+    with client.request_options(deadline=1) as outer_options:
+        with client.request_options(deadline=10) as inner_options:
+            assert inner_options["deadline_at"] == outer_options["deadline_at"]
+
+
+def test_deadline_spans_pagination():
+    """Tests that a deadline covers every page requested within its block."""
+    transport = SlowTransport(
+        responses=[shipments_page(["shp_2"], has_more=True), shipments_page(["shp_1"], has_more=False)],
+        delay=0.2,
+    )
+    client = EasyPostClient("123", transport=transport)
+    shipment_ids = []
+
+    with pytest.raises(TimeoutError) as error:
+        with client.request_options(deadline=0.1):
+            for shipment in client.shipment.iter_all():
+                shipment_ids.append(shipment.id)
+
+    assert error.value.message == "Request deadline exceeded."
+    assert shipment_ids == ["shp_2"]
+    assert len(transport.requests) == 1
+
+
+def test_deadline_stops_retries(monkeypatch):
+    """Tests that a request is not retried when the retry would start after its deadline."""
+    monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt: 5)
+    transport = InMemoryTransport(
+        responses=[(503, {"error": {"code": "SERVICE_UNAVAILABLE", "message": "unavailable"}}), SHIPMENT_RESPONSE]
+    )
+    client = EasyPostClient("123", transport=transport, retry_policy=RetryPolicy())
+
+    with pytest.raises(ServiceUnavailableError):
+        with client.request_options(deadline=2):
+            client.shipment.retrieve("shp_123")
+
+    assert len(transport.requests) == 1
+
+
+def test_request_options_apply_to_prefetch_threads():
+    """Tests that request options apply to the pages requested in the background by a prefetching iterator."""
+    transport = InMemoryTransport(
+        responses=[shipments_page(["shp_2"], has_more=True), shipments_page(["shp_1"], has_more=False)]
+    )
+    client = EasyPostClient("123", transport=transport)
+
+    with client.request_options(timeout=3):
+        shipments = list(client.shipment.iter_all(prefetch=1))
+
+    assert len(shipments) == 2
+    assert [request["timeout"] for request in transport.requests] == [3, 3]
+
+
+def test_aiohttp_transport_timeouts():
+    """Tests that the aiohttp transport sets separate connect and read timeouts from a tuple."""
+    pytest.importorskip("aiohttp")
+    transport = AiohttpTransport()
+
+    tuple_timeout = transport._client_timeout(timeout=(1, 5))
+    total_timeout = transport._client_timeout(timeout=10)
+
+    assert (tuple_timeout.total, tuple_timeout.sock_connect, tuple_timeout.sock_read) == (None, 1, 5)
+    assert total_timeout.total == 10
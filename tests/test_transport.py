@@ -0,0 +1,225 @@
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+
+import pytest
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    HttpError,
+    NotFoundError,
+    TimeoutError,
+)
+from easypost.models import Shipment
+from easypost.transports import RequestsTransport
+from tests.helpers import (
+    InMemoryAsyncTransport,
+    InMemoryTransport,
+)
+
+
+def test_default_transport():
+    """Tests that the client uses the requests transport by default."""
+    client = EasyPostClient("123")
+
+    assert isinstance(client.transport, RequestsTransport)
+
+
+def test_custom_transport():
+    """Tests that a custom transport receives the request and its response is converted into a model."""
+    transport = InMemoryTransport(responses=[(200, {"id": "shp_123", "object": "Shipment"})])
+    client = EasyPostClient("123", timeout=5, transport=transport)
+
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert isinstance(shipment, Shipment)
+    assert shipment.id == "shp_123"
+    assert transport.requests[0]["method"].value == "get"
+    assert transport.requests[0]["url"] == "https://api.easypost.com/v2/shipments/shp_123"
+    assert transport.requests[0]["headers"]["Authorization"] == "Bearer 123"
+    assert transport.requests[0]["params"] == {}
+    assert transport.requests[0]["body"] is None
+    assert transport.requests[0]["timeout"] == 5
+
+
+def test_custom_transport_body():
+    """Tests that POST params are given to a custom transport as the body of the request."""
+    transport = InMemoryTransport(responses=[(201, {"id": "prcl_123", "object": "Parcel"})])
+    client = EasyPostClient("123", transport=transport)
+
+    client.parcel.create(weight=10)
+
+    assert transport.requests[0]["params"] is None
+    assert transport.requests[0]["body"] == {"parcel": {"weight": 10}}
+
+
+def test_custom_transport_hooks():
+    """Tests that hooks fire for custom transports."""
+    transport = InMemoryTransport(responses=[(201, {"id": "prcl_123", "object": "Parcel"})])
+    client = EasyPostClient("123", transport=transport)
+    hook_calls = []
+    client.subscribe_to_request_hook(lambda **kwargs: hook_calls.append("request"))
+    client.subscribe_to_response_hook(lambda **kwargs: hook_calls.append(kwargs["http_status"]))
+
+    client.parcel.create(weight=10)
+
+    assert hook_calls == ["request", 201]
+
+
+def test_custom_transport_error_mapping():
+    """Tests that API errors of a custom transport are mapped to EasyPost errors."""
+    transport = InMemoryTransport(responses=[(404, {"error": {"code": "NOT_FOUND", "message": "not found"}})])
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(NotFoundError):
+        client.shipment.retrieve("shp_123")
+
+
+def test_custom_transport_timeout():
+    """Tests that timeouts raised by a custom transport are translated into a TimeoutError."""
+    transport = InMemoryTransport(responses=[socket.timeout("timed out")])
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(TimeoutError) as error:
+        client.shipment.retrieve("shp_123")
+
+    assert error.value.message == "Request timed out."
+
+
+def test_custom_transport_exception():
+    """Tests that unexpected exceptions raised by a custom transport are translated into an HttpError."""
+    transport = InMemoryTransport(responses=[ConnectionResetError("connection reset")])
+    client = EasyPostClient("123", transport=transport)
+
+    with pytest.raises(HttpError) as error:
+        client.shipment.retrieve("shp_123")
+
+    assert "connection reset" in error.value.message
+
+
+def test_custom_async_transport():
+    """Tests that the async client uses a custom async transport and closes it."""
+    transport = InMemoryAsyncTransport(responses=[(200, {"id": "shp_123", "object": "Shipment"})])
+
+    async def run():
+        async with AsyncEasyPostClient("123", transport=transport) as client:
+            return await client.shipment.retrieve("shp_123")
+
+    shipment = asyncio.run(run())
+
+    assert isinstance(shipment, Shipment)
+    assert transport.closed
+
+
+def test_requests_transport_pool_options():
+    """Tests that the connection pool options are applied to the session of the requests transport."""
+    transport = RequestsTransport(pool_connections=4, pool_maxsize=64, pool_block=True, keep_alive=False)
+
+    adapter = transport.session.get_adapter("https://api.easypost.com")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert transport.session.headers["Connection"] == "close"
+
+
+def test_requests_transport_warm_up():
+    """Tests that warming up the requests transport opens distinct connections that are reused afterwards."""
+    peers = set()
+
+    class PeerHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_HEAD(self):
+            peers.add(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            peers.add(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PeerHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v2"
+
+    transport = RequestsTransport(pool_maxsize=3)
+    opened = transport.warm_up(url=url, connections=5)
+    warm_peers = set(peers)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: transport.session.get(url).content, range(3)))
+
+    assert opened == 3
+    assert len(warm_peers) == 3
+    assert peers == warm_peers
+    assert RequestsTransport(keep_alive=False).warm_up(url=url, connections=5) == 0
+
+    transport.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_warm_up():
+    """Tests that warming up a client warms up its transport with the API base."""
+    warm_up_calls = []
+
+    class WarmUpTransport(InMemoryTransport):
+        def warm_up(self, url, connections):
+            warm_up_calls.append((url, connections))
+            return connections
+
+    client = EasyPostClient("123", transport=WarmUpTransport(responses=[]))
+
+    assert client.warm_up(connections=8) == 8
+    assert warm_up_calls == [("https://api.easypost.com/v2", 8)]
+
+
+def test_aiohttp_transport_warm_up():
+    """Tests that warming up the aiohttp transport opens concurrent connections that are reused afterwards."""
+    pytest.importorskip("aiohttp")
+    from aiohttp import (
+        test_utils,
+        web,
+    )
+    from easypost.transports import AiohttpTransport
+
+    peers = set()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"id": "shp_123", "object": "Shipment"})
+
+    async def run():
+        app = web.Application()
+        app.add_routes([web.route("*", "/v2", handler), web.route("*", "/v2/{tail:.*}", handler)])
+        server = test_utils.TestServer(app)
+        await server.start_server()
+
+        async with AsyncEasyPostClient(
+            "123", api_base=str(server.make_url("/v2")), transport=AiohttpTransport()
+        ) as client:
+            opened = await client.warm_up(connections=4)
+            warm_peers = set(peers)
+            await asyncio.gather(*[client.shipment.retrieve("shp_123") for _ in range(4)])
+        await server.close()
+
+        return opened, warm_peers
+
+    opened, warm_peers = asyncio.run(run())
+
+    assert opened == 4
+    assert len(warm_peers) == 4
+    assert peers == warm_peers